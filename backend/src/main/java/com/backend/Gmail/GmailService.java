@@ -333,7 +333,7 @@ public class GmailService {
     private void extractAttachments(Gmail service, String userId, MessagePart part, String messageId, List<Map<String, String>> attachments) throws IOException {
         if (part.getFilename() != null && !part.getFilename().isEmpty()) {
             String filename = part.getFilename().toLowerCase();
-            if (filename.endsWith(".pdf") || filename.endsWith(".docx")) {
+            if (filename.endsWith(".pdf") || filename.endsWith(".docx") || filename.endsWith(".odt")) {
                 String attachmentId = part.getBody().getAttachmentId();
                 if (attachmentId != null) {
                     MessagePartBody attachPart = service.users().messages().attachments()
@@ -378,6 +378,8 @@ public class GmailService {
             mimeType = "application/pdf";
         } else if (filename.toLowerCase().endsWith(".docx")) {
             mimeType = "application/vnd.openxmlformats-officedocument.wordprocessingml.document";
+        } else if (filename.toLowerCase().endsWith(".odt")) {
+            mimeType = "application/vnd.oasis.opendocument.text";
         } else {
             throw new IllegalArgumentException("Unsupported file type: " + filename);
         }
@@ -8,6 +8,7 @@ import com.fasterxml.jackson.databind.DeserializationFeature;
 import com.fasterxml.jackson.databind.ObjectMapper;
 import com.fasterxml.jackson.datatype.jsr310.JavaTimeModule;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Value;
 import org.springframework.http.HttpStatus;
 import org.springframework.http.ResponseEntity;
 import org.springframework.http.converter.json.GsonBuilderUtils;
@@ -21,6 +22,13 @@ import java.io.BufferedReader;
 import java.io.File;
 import java.io.IOException;
 import java.io.InputStreamReader;
+import java.net.ConnectException;
+import java.net.URI;
+import java.net.URLEncoder;
+import java.net.http.HttpClient;
+import java.net.http.HttpRequest;
+import java.net.http.HttpResponse;
+import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.util.Map;
 
@@ -37,6 +45,12 @@ public class ParserController {
     String parserScript = new File(parserDir, "__main__.py").getAbsolutePath();
     CVService cvService;
 
+    // Adres serwera parsera (python __main__.py --serve), pusty = uruchamianie skryptu dla każdego CV
+    @Value("${parser.server.url:}")
+    String parserServerUrl;
+
+    HttpClient httpClient = HttpClient.newHttpClient();
+
     @Autowired
     public ParserController(CVService cvService) {
         this.cvService = cvService;
@@ -44,6 +58,14 @@ public class ParserController {
 
     @PostMapping("/pdf")
     public ResponseEntity<String> parsePdf(@RequestParam("file") MultipartFile file) throws IOException, InterruptedException {
+        if (parserServerUrl != null && !parserServerUrl.isBlank()) {
+            try {
+                return parseWithServer(file);
+            } catch (ConnectException e) {
+                System.out.println("Parser server unavailable, falling back to script: " + e.getMessage());
+            }
+        }
+
         // Zapisz plik tymczasowo
         File inputFile = File.createTempFile("input-", ".pdf");
         file.transferTo(inputFile);
@@ -86,6 +108,26 @@ public class ParserController {
         inputFile.delete();
         outputFile.delete();
 
+        return saveResult(resultJson);
+    }
+
+    private ResponseEntity<String> parseWithServer(MultipartFile file) throws IOException, InterruptedException {
+        String filename = file.getOriginalFilename() != null ? file.getOriginalFilename() : "input.pdf";
+        HttpRequest request = HttpRequest.newBuilder()
+                .uri(URI.create(parserServerUrl + "/parse?filename=" + URLEncoder.encode(filename, StandardCharsets.UTF_8)))
+                .header("Content-Type", "application/octet-stream")
+                .POST(HttpRequest.BodyPublishers.ofByteArray(file.getBytes()))
+                .build();
+
+        HttpResponse<String> response = httpClient.send(request, HttpResponse.BodyHandlers.ofString(StandardCharsets.UTF_8));
+        if (response.statusCode() != 200) {
+            return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR)
+                    .body("Parser server failed: " + response.body());
+        }
+        return saveResult(response.body());
+    }
+
+    private ResponseEntity<String> saveResult(String resultJson) throws IOException {
         ObjectMapper mapper = new ObjectMapper()
                 .registerModule(new JavaTimeModule())
                 .configure(DeserializationFeature.FAIL_ON_UNKNOWN_PROPERTIES, false);
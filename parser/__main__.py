@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import sys
-sys.stdout.reconfigure(encoding='utf-8')
+
+sys.stdout.reconfigure(encoding="utf-8")
+
 
 def check_if_in_env() -> None:
     if sys.prefix == sys.base_prefix:
@@ -12,9 +14,23 @@ def check_if_in_env() -> None:
 check_if_in_env()
 
 import argparse
-from src.parser import Parser
+from src.parser import (
+    Parser,
+    NLP_PROFILES,
+    DEFAULT_NLP_PROFILE,
+    DOCX_READERS,
+    DEFAULT_DOCX_READER,
+)
+from src.catalogue import DEFAULT_CATALOGUE_PATH
+from src.cache import DEFAULT_MAX_BYTES, ResultCache
+from src import server, batch, schema
+from src.profiling import ParseTimings, profiled
 import json
+import logging
 import os
+import tracemalloc
+
+LOG_LEVELS = ("debug", "info", "warning", "error")
 
 
 def main() -> None:
@@ -26,27 +42,230 @@ def main() -> None:
         action="store_true",
         help="Run in API mock mode (no real processing).",
     )
+    args_parser.add_argument(
+        "--export-schema",
+        metavar="PATH",
+        help="Write the JSON schema of the parser output to PATH and exit.",
+    )
+    args_parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a long-lived HTTP parser server (model is loaded once).",
+    )
+    args_parser.add_argument(
+        "--host", default=server.DEFAULT_HOST, help="Server bind address."
+    )
+    args_parser.add_argument(
+        "--port", type=int, default=server.DEFAULT_PORT, help="Server port."
+    )
+    args_parser.add_argument(
+        "--serve-root",
+        help="Directory the server may parse files from by path, "
+        'POST /parse {"path": ...} is refused without it.',
+    )
+    args_parser.add_argument(
+        "--nlp-profile",
+        choices=list(NLP_PROFILES),
+        default=DEFAULT_NLP_PROFILE,
+        help="spaCy model/pipeline profile ('ner-sm' is the lightweight one).",
+    )
+    args_parser.add_argument(
+        "--docx-reader",
+        choices=list(DOCX_READERS),
+        default=DEFAULT_DOCX_READER,
+        help="DOCX text source: MuPDF layout or document.xml read directly ('xml', faster).",
+    )
+    args_parser.add_argument(
+        "--layout",
+        action="store_true",
+        help="Split PDF/DOCX into sections by font/position instead of regexes.",
+    )
+    args_parser.add_argument(
+        "--max-pages",
+        type=int,
+        help="Read only the first N pages (appendices past the CV are skipped).",
+    )
+    args_parser.add_argument(
+        "--page-workers",
+        type=int,
+        default=1,
+        help="Processes extracting the pages of long PDFs in parallel.",
+    )
+    args_parser.add_argument(
+        "--catalogue",
+        default=DEFAULT_CATALOGUE_PATH,
+        help="Positions/requirements catalogue (JSON).",
+    )
+    args_parser.add_argument(
+        "--cache-dir",
+        help="Cache parse results in this directory (keyed by file content), "
+        "off by default since the entries hold personal data from the CVs.",
+    )
+    args_parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Cache size limit, least recently used entries are evicted.",
+    )
+    args_parser.add_argument(
+        "--no-cache", action="store_true", help="Do not read or write the cache."
+    )
+    args_parser.add_argument(
+        "--invalidate-cache",
+        action="store_true",
+        help="Drop every cached result before running.",
+    )
     args_parser.add_argument(
         "--input", default="test/pdf/basic-sample.pdf", help="Path to input PDF file."
     )
     args_parser.add_argument(
-        "--output", default="output.json", help="Path to output text file."
+        "--output",
+        help="Path to the output file, output.json or in batch mode output.jsonl.",
+    )
+    args_parser.add_argument(
+        "--log-level",
+        choices=LOG_LEVELS,
+        default="warning",
+        help="Diagnostics to stderr: 'info' adds progress, 'debug' every extractor's findings.",
+    )
+    args_parser.add_argument(
+        "--timings",
+        help="Write the time of every parse stage and the cache hit/miss to this JSON.",
+    )
+    args_parser.add_argument(
+        "--profile",
+        help="Write a cProfile dump of the parse to this file (pstats/snakeviz).",
+    )
+    args_parser.add_argument(
+        "--trace-malloc",
+        action="store_true",
+        help="Also measure memory allocated by every stage (slower), see --timings.",
+    )
+    args_parser.add_argument(
+        "--input-dir",
+        help="Batch mode: parse every CV in this directory.",
+    )
+    args_parser.add_argument(
+        "--glob",
+        help="Batch mode: glob pattern (e.g. '**/*.pdf'), relative to --input-dir.",
+    )
+    args_parser.add_argument(
+        "--output-dir",
+        help="Batch mode: write one JSON per input here instead of JSONL to --output.",
+    )
+    args_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Batch mode: number of worker processes.",
+    )
+    args_parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Batch mode: write the JSONL records of a batch as soon as its worker "
+        "finishes it, not in input order.",
+    )
+    args_parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the JSON output without indentation (JSONL is always compact).",
+    )
+    args_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Batch mode: files per nlp.pipe batch in each worker, JSONL records "
+        "of a batch are written when the whole batch is parsed.",
+    )
+    args_parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Batch mode: replace an existing JSONL --output instead of stopping.",
     )
     args = args_parser.parse_args()
+    batch_mode = bool(args.input_dir or args.glob)
+    if args.output is None:
+        args.output = "output.jsonl" if batch_mode else "output.json"
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
 
-    parser = Parser()
-
-    if args.api_mock:
-        mock = parser.create_mock()
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(mock.model_dump_json(indent=2, ensure_ascii=False))
+    if args.export_schema:
+        with open(args.export_schema, "w", encoding="utf-8") as f:
+            json.dump(
+                schema.CVParserSchema.model_json_schema(),
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
         return
 
-    cv = parser.parse_file(
-        args.input, enable_log=True, log_output=os.path.dirname(args.output)
-    )
-    with open(args.output, "w", encoding="utf-8") as f:
-        f.write(cv.model_dump_json(indent=2, ensure_ascii=False))
+    if args.invalidate_cache:
+        if not args.cache_dir:
+            args_parser.error("--invalidate-cache needs --cache-dir")
+        ResultCache(args.cache_dir).invalidate()
+    parser_kwargs = {
+        "nlp_profile": args.nlp_profile,
+        "catalogue_path": args.catalogue,
+        "docx_reader": args.docx_reader,
+        "max_pages": args.max_pages,
+        "layout": args.layout,
+        "page_workers": args.page_workers,
+        "cache_dir": None if args.no_cache else args.cache_dir,
+        "cache_max_bytes": args.cache_max_mb * 1024 * 1024,
+    }
+
+    if batch_mode:
+        inputs = batch.collect_inputs(args.input_dir, args.glob)
+        try:
+            parsed, failed = batch.run_batch(
+                inputs,
+                args.workers,
+                output_jsonl=None if args.output_dir else args.output,
+                output_dir=args.output_dir,
+                base_dir=args.input_dir or ".",
+                batch_size=args.batch_size,
+                parser_kwargs=parser_kwargs,
+                ordered=not args.unordered,
+                overwrite=args.overwrite,
+            )
+        except batch.OutputExistsError:
+            args_parser.error(f"{args.output} exists, pass --overwrite to replace it")
+        print(f"Parsed {parsed} files, {failed} failed")
+        sys.exit(1 if failed else 0)
+
+    indent = None if args.compact else 2
+    parser = Parser(**parser_kwargs)
+
+    try:
+        if args.serve:
+            server.serve(parser, args.host, args.port, args.serve_root)
+            return
+
+        if args.api_mock:
+            mock = parser.create_mock()
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(mock.model_dump_json(indent=indent, ensure_ascii=False))
+            return
+
+        if args.trace_malloc:
+            tracemalloc.start()
+        timings = ParseTimings()
+        with profiled(args.profile):
+            cv = parser.parse_file(
+                args.input,
+                enable_log=True,
+                log_output=os.path.dirname(args.output),
+                timings=timings,
+            )
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(cv.model_dump_json(indent=indent, ensure_ascii=False))
+        if args.timings:
+            with open(args.timings, "w", encoding="utf-8") as f:
+                json.dump({"file": args.input, **timings.to_dict()}, f, indent=2)
+    finally:
+        parser.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+PARSER_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = (PARSER_DIR / "../data").resolve()
+EXPECTED_PATH = PARSER_DIR / "test" / "pdf" / "expected_results.json"
+
+
+def load_expected() -> Dict[str, Any]:
+    with open(EXPECTED_PATH, "r", encoding="utf-8") as f:
+        expected: Dict[str, Any] = json.load(f)
+    return expected
+
+
+def fixture_pdfs() -> List[Path]:
+    """PDF fixtures from data/ that have an entry in expected_results.json."""
+    expected = load_expected()
+    return sorted(p for p in DATA_DIR.glob("*.pdf") if p.name in expected)
+
+
+def fixture_docx() -> List[Path]:
+    return sorted(DATA_DIR.glob("*.docx"))
+
+
+def timed(fn: Callable[[], T]) -> Tuple[T, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def best_of(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Fastest wall time of `repeat` runs, in seconds."""
+    return min(timed(fn)[1] for _ in range(repeat))
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process, None where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _leaves(value: Any, path: str) -> Dict[str, Any]:
+    if isinstance(value, dict):
+        leaves: Dict[str, Any] = {}
+        for key, item in value.items():
+            leaves.update(_leaves(item, f"{path}.{key}"))
+        return leaves
+    if isinstance(value, list):
+        leaves = {f"{path}.len": len(value)}
+        for i, item in enumerate(value):
+            leaves.update(_leaves(item, f"{path}[{i}]"))
+        return leaves
+    return {path: value}
+
+
+def accuracy(actual: Dict[str, Any], expected: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    (matching, total) leaf fields of `expected` found with the same value
+    in `actual`, same comparison as test/pdf/test_pdf_parsing.py.
+    """
+    expected_leaves = _leaves(expected, "")
+    actual_leaves = _leaves(actual, "")
+    matching = sum(
+        1
+        for path, value in expected_leaves.items()
+        if path in actual_leaves and actual_leaves[path] == value
+    )
+    return matching, len(expected_leaves)
+
+
+def print_table(headers: List[str], rows: List[List[Any]]) -> None:
+    cells = [headers] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for n, row in enumerate(cells):
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths)))
+        if n == 0:
+            print("  ".join("-" * w for w in widths))
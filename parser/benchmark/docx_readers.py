@@ -0,0 +1,61 @@
+"""
+DOCX text extraction: MuPDF layout (after clean_docx) vs. document.xml
+read directly with iterparse, on the data/*.docx fixtures.
+
+python -m benchmark.docx_readers [--repeat 5]
+"""
+
+import argparse
+
+import fitz
+
+from benchmark.common import best_of, fixture_docx, print_table
+from src.docx_reader import clean_docx, read_docx_text
+
+
+def mupdf_text(data: bytes) -> str:
+    doc = fitz.open(stream=clean_docx(data), filetype="docx")
+    return "\n".join(page.get_text(sort=True) for page in doc)
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--repeat", type=int, default=5)
+    args = args_parser.parse_args()
+
+    rows = []
+    totals = [0.0, 0.0, 0.0]
+    for path in fixture_docx():
+        data = path.read_bytes()
+        clean_s = best_of(lambda: clean_docx(data), args.repeat)
+        mupdf_s = best_of(lambda: mupdf_text(data), args.repeat)
+        xml_s = best_of(lambda: read_docx_text(data), args.repeat)
+        for i, value in enumerate((clean_s, mupdf_s, xml_s)):
+            totals[i] += value
+        rows.append(
+            [
+                path.name,
+                f"{len(data) / 1024:.0f}",
+                f"{1000 * clean_s:.1f}",
+                f"{1000 * mupdf_s:.1f}",
+                f"{1000 * xml_s:.1f}",
+                f"{mupdf_s / xml_s:.1f}x",
+            ]
+        )
+    rows.append(
+        [
+            "total",
+            "",
+            *(f"{1000 * t:.1f}" for t in totals),
+            f"{totals[1] / totals[2]:.1f}x",
+        ]
+    )
+
+    print_table(
+        ["file", "size [KB]", "clean_docx [ms]", "mupdf [ms]", "xml [ms]", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Entity merging of the education section: the old nested loops vs. the
+sweep line of src/intervals.py.
+
+python -m benchmark.education_merge [--entries 25 100 400] [--repeat 5]
+
+The education section of a synthetic CV with the given number of entries
+(school, degree, field of study, month and year dates) goes through the
+regexes of _extract_education; NER entities are left out, so no model is
+needed. Both implementations must return the same entities.
+"""
+
+import argparse
+import random
+from typing import List, Tuple
+
+from benchmark.common import best_of, print_table
+from src import patterns
+from src.intervals import Entity, cut_overlaps, keep_longest, merge_month_names
+
+CUTTING = ("degree", "year", "field_of_study")
+
+SCHOOLS = (
+    "Uniwersytet Warszawski",
+    "Politechnika Gdańska",
+    "Liceum Ogólnokształcące nr 5 w Krakowie",
+    "Technikum Elektroniczne w Poznaniu",
+    "Akademia Górniczo-Hutnicza",
+)
+DEGREES = ("Magister", "Licencjat", "Inżynier", "Technik")
+FIELDS = ("informatyka", "ekonomia", "mechatronika", "zarządzanie", "fizyka")
+MONTHS = ("styczeń", "marzec", "wrzesień", "październik")
+
+
+def synthetic_section(entries: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(entries):
+        year = rng.randrange(1990, 2024)
+        lines.append(
+            f"{rng.choice(MONTHS)} {year} - {rng.choice(MONTHS)} {year + 3}\n"
+            f"{rng.choice(SCHOOLS)}\n"
+            f"{rng.choice(DEGREES)}, kierunek: {rng.choice(FIELDS)}"
+        )
+    return "\n".join(lines)
+
+
+def section_entities(text: str) -> Tuple[List[Entity], List[Tuple[int, int, str]]]:
+    entities: List[Entity] = []
+    for match in patterns.DEGREE.finditer(text):
+        entities.append((*match.span(), "degree", match.group(1).capitalize()))
+    for match in patterns.YEAR_OR_CURRENT.finditer(text):
+        entities.append((*match.span(), "year", match.group(1)))
+    for match in patterns.INSTITUTION.finditer(text):
+        entities.append((*match.span(), "orgName", match.group(0).strip()))
+    for match in patterns.FIELD_OF_STUDY.finditer(text):
+        entities.append((*match.span(), "field_of_study", match.group(0).strip()))
+    entities.sort(key=lambda x: x[0])
+    months = [
+        (match.start(), match.end(), match.group(0))
+        for match in patterns.EDU_MONTH_NAME.finditer(text)
+    ]
+    return entities, months
+
+
+def loop_merge(
+    entities: List[Entity], months: List[Tuple[int, int, str]], text: str
+) -> List[Entity]:
+    entities = list(entities)
+    for start, end, month_text in months:
+        merged = False
+        for i, (e_start, e_end, e_label, e_text) in enumerate(entities):
+            if e_label == "year" or e_label == "date" and abs(e_start - end) <= 3:
+                entities[i] = (start, e_end, "date", text[start:e_end])
+                merged = True
+                break
+            elif e_label == "year" or e_label == "date" and abs(start - e_end) <= 3:
+                entities[i] = (e_start, end, "date", text[e_start:end])
+                merged = True
+                break
+        if not merged:
+            entities.append((start, end, "date", month_text))
+    return entities
+
+
+def loop_cut(entities: List[Entity]) -> List[Entity]:
+    adjusted: List[Entity] = []
+    for start, end, label, text in entities:
+        if label in CUTTING:
+            overlaps = [
+                e
+                for e in adjusted
+                if not (end <= e[0] or start >= e[1]) and e[2] != "date"
+            ]
+            for o_start, o_end, o_label, o_text in overlaps:
+                if start > o_start:
+                    adjusted.append(
+                        (o_start, start, o_label, o_text[: start - o_start].strip())
+                    )
+                if end < o_end:
+                    adjusted.append(
+                        (end, o_end, o_label, o_text[end - o_start :].strip())
+                    )
+                adjusted.remove((o_start, o_end, o_label, o_text))
+        adjusted.append((start, end, label, text))
+    return adjusted
+
+
+def loop_keep_longest(entities: List[Entity]) -> List[Entity]:
+    kept: List[Entity] = []
+    for start, end, label, text in entities:
+        overlap = False
+        for o_start, o_end, o_label, o_text in kept:
+            if not (end <= o_start or start >= o_end):
+                overlap = True
+                if (end - start) > (o_end - o_start):
+                    kept.remove((o_start, o_end, o_label, o_text))
+                    kept.append((start, end, label, text))
+                break
+        if not overlap:
+            kept.append((start, end, label, text))
+    return kept
+
+
+def loops(
+    entities: List[Entity], months: List[Tuple[int, int, str]], text: str
+) -> List[Entity]:
+    merged = loop_merge(entities, months, text)
+    merged.sort(key=lambda x: x[0])
+    cut = loop_cut(merged)
+    cut.sort(key=lambda x: x[0])
+    return loop_keep_longest(cut)
+
+
+def sweep(
+    entities: List[Entity], months: List[Tuple[int, int, str]], text: str
+) -> List[Entity]:
+    merged = merge_month_names(entities, months, text)
+    merged.sort(key=lambda x: x[0])
+    cut = cut_overlaps(merged, CUTTING)
+    cut.sort(key=lambda x: x[0])
+    return keep_longest(cut)
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--entries", type=int, nargs="+", default=[25, 100, 400])
+    args_parser.add_argument("--repeat", type=int, default=5)
+    args = args_parser.parse_args()
+
+    rows = []
+    for entries in args.entries:
+        text = synthetic_section(entries)
+        entities, months = section_entities(text)
+        assert loops(entities, months, text) == sweep(entities, months, text)
+        loop_s = best_of(lambda: loops(entities, months, text), args.repeat)
+        sweep_s = best_of(lambda: sweep(entities, months, text), args.repeat)
+        rows.append(
+            [
+                entries,
+                len(entities) + len(months),
+                f"{1000 * loop_s:.2f}",
+                f"{1000 * sweep_s:.2f}",
+                f"{loop_s / sweep_s:.1f}x",
+            ]
+        )
+
+    print_table(["entries", "entities", "loops [ms]", "sweep [ms]", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
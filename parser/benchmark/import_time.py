@@ -0,0 +1,87 @@
+"""
+Cold start: wall time of fresh interpreters running the entry points
+that never parse a CV, and which heavy modules they import.
+
+python -m benchmark.import_time [--repeat 5]
+
+Every command runs with -X importtime. The import column is the
+cumulative import time of the top-level modules it reports, "heavy" lists
+spacy/fitz if either got imported. `import spacy` and `import fitz` are
+there for scale.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Set, Tuple
+
+from benchmark.common import PARSER_DIR, print_table, timed
+
+HEAVY_MODULES = ("spacy", "fitz")
+# "import time: self | cumulative | name", top-level modules are not indented
+_IMPORT_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def commands(tmp: Path) -> List[Tuple[str, List[str]]]:
+    main = str(PARSER_DIR / "__main__.py")
+    return [
+        ("import src.parser", ["-c", "import src.parser"]),
+        ("--api-mock", [main, "--api-mock", "--output", str(tmp / "mock.json")]),
+        ("--export-schema", [main, "--export-schema", str(tmp / "schema.json")]),
+        ("import spacy", ["-c", "import spacy"]),
+        ("import fitz", ["-c", "import fitz"]),
+    ]
+
+
+def run(args: List[str]) -> Tuple[float, float, Set[str]]:
+    """(wall seconds, import seconds, heavy modules imported) of one run."""
+    result, elapsed = timed(
+        lambda: subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            cwd=PARSER_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    )
+    import_us = 0
+    heavy = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        cumulative, indent, name = match.groups()
+        if name.split(".")[0] in HEAVY_MODULES:
+            heavy.add(name.split(".")[0])
+        if not indent:
+            import_us += int(cumulative)
+    return elapsed, import_us / 1e6, heavy
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--repeat", type=int, default=5)
+    args = args_parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, command in commands(Path(tmp)):
+            runs = [run(command) for _ in range(args.repeat)]
+            wall, imports, heavy = min(runs, key=lambda r: r[0])
+            rows.append(
+                [
+                    label,
+                    f"{1000 * wall:.0f}",
+                    f"{1000 * imports:.0f}",
+                    ", ".join(sorted(heavy)) or "-",
+                ]
+            )
+
+    print_table(["command", "wall [ms]", "imports [ms]", "heavy"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Writing many results: a pretty-printed JSON file per CV vs. the JSONL of
+run_batch before and after JsonlWriter.
+
+python -m benchmark.jsonl_output [--count 2000] [--entries 5] [--repeat 3]
+
+Every way starts from the same parsed CV models, `entries` education
+entries, jobs and languages each, and writes them into a temporary
+directory. The old JSONL decoded the JSON of every result and encoded it
+again inside its record; JsonlWriter embeds it as the worker produced it.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+from benchmark.common import best_of, print_table
+from src import draft, schema
+from src.batch import JsonlWriter, read_records
+
+
+def results(count: int, entries: int) -> List[schema.CVParserSchema]:
+    cv = draft.CV()
+    cv.personal_info.full_name = "Łukasz Wójcik"
+    cv.education = [
+        draft.Education(
+            "Magister", "Politechnika Gdańska", date(2010, 10, 1), None, "informatyka"
+        )
+        for _ in range(entries)
+    ]
+    cv.work_experience = [
+        draft.WorkExperience("Magazynier", "Wajchex sp. z o.o.", date(2015, 3, 1))
+        for _ in range(entries)
+    ]
+    cv.languages = [draft.Language("Polski", "native") for _ in range(entries)]
+    return [draft.to_schema(cv)] * count
+
+
+def file_per_cv(cvs: List[schema.CVParserSchema], out: str) -> None:
+    for i, cv in enumerate(cvs):
+        with open(os.path.join(out, f"{i}.json"), "w", encoding="utf-8") as f:
+            f.write(cv.model_dump_json(indent=2, ensure_ascii=False))
+
+
+def reencoded_jsonl(cvs: List[schema.CVParserSchema], out: str) -> None:
+    with open(os.path.join(out, "out.jsonl"), "w", encoding="utf-8") as f:
+        for i, cv in enumerate(cvs):
+            result = cv.model_dump_json(ensure_ascii=False)
+            record: Dict[str, Any] = {"file": f"{i}.pdf", "result": json.loads(result)}
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def streamed_jsonl(cvs: List[schema.CVParserSchema], out: str) -> None:
+    with JsonlWriter(os.path.join(out, "out.jsonl"), overwrite=True) as writer:
+        writer.write_many(
+            (f"{i}.pdf", cv.model_dump_json(ensure_ascii=False), None)
+            for i, cv in enumerate(cvs)
+        )
+
+
+WAYS: Dict[str, Callable[[List[schema.CVParserSchema], str], None]] = {
+    "JSON file per CV, indent=2": file_per_cv,
+    "JSONL, decoded and re-encoded": reencoded_jsonl,
+    "JsonlWriter": streamed_jsonl,
+}
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--count", type=int, default=2000)
+    args_parser.add_argument("--entries", type=int, default=5)
+    args_parser.add_argument("--repeat", type=int, default=3)
+    args = args_parser.parse_args()
+
+    cvs = results(args.count, args.entries)
+    rows = []
+    base = None
+    for way, write in WAYS.items():
+        with tempfile.TemporaryDirectory() as out:
+            seconds = best_of(lambda: write(cvs, out), args.repeat)
+            size = sum(
+                os.path.getsize(os.path.join(out, name)) for name in os.listdir(out)
+            )
+            if write is streamed_jsonl:
+                records = read_records(os.path.join(out, "out.jsonl"))
+                assert [r["result"] for r in records] == [
+                    cv.model_dump(mode="json") for cv in cvs
+                ]
+        base = base or seconds
+        rows.append(
+            [
+                way,
+                f"{1000 * seconds:.0f}",
+                f"{1e6 * seconds / args.count:.0f}",
+                f"{size / 1024:.0f}",
+                f"{base / seconds:.2f}x",
+            ]
+        )
+
+    print_table(["output", "total [ms]", "per CV [us]", "size [KiB]", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Latency / memory vs. accuracy of the spaCy profiles on the data/ fixtures.
+
+python -m benchmark.nlp_profiles [--profiles full ner ner-sm] [--repeat 3]
+
+Every profile runs in its own subprocess so load time and peak memory
+are not polluted by the other models.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+from benchmark.common import (
+    PARSER_DIR,
+    accuracy,
+    fixture_pdfs,
+    load_expected,
+    peak_rss_mb,
+    print_table,
+    timed,
+)
+
+
+def measure(profile: str, repeat: int) -> Dict[str, Any]:
+    from src.parser import Parser
+
+    parser = Parser(nlp_profile=profile)
+    _, load_s = timed(parser.load)
+    expected = load_expected()
+
+    matching = total = 0
+    latencies: List[float] = []
+    for pdf in fixture_pdfs():
+        for _ in range(repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                cv, elapsed = timed(lambda: parser.parse_file(str(pdf)))
+            latencies.append(elapsed)
+        m, t = accuracy(cv.model_dump(mode="json"), expected[pdf.name])
+        matching += m
+        total += t
+
+    return {
+        "profile": profile,
+        "pipeline": parser.nlp.pipe_names,
+        "load_s": load_s,
+        "mean_parse_ms": 1000 * sum(latencies) / max(len(latencies), 1),
+        "peak_rss_mb": peak_rss_mb(),
+        "accuracy": matching / max(total, 1),
+    }
+
+
+def main() -> None:
+    from src.parser import NLP_PROFILES
+
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument(
+        "--profiles", nargs="+", default=list(NLP_PROFILES), choices=NLP_PROFILES
+    )
+    args_parser.add_argument("--repeat", type=int, default=3)
+    args_parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = args_parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.repeat)))
+        return
+
+    rows = []
+    for profile in args.profiles:
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmark.nlp_profiles"]
+            + ["--child", profile, "--repeat", str(args.repeat)],
+            cwd=PARSER_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if out.returncode != 0:
+            print(f"[ERR] {profile}: {out.stderr.strip().splitlines()[-1]}")
+            continue
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        rss = r["peak_rss_mb"]
+        rows.append(
+            [
+                r["profile"],
+                ",".join(r["pipeline"]),
+                f"{r['load_s']:.2f}",
+                f"{r['mean_parse_ms']:.1f}",
+                "n/a" if rss is None else f"{rss:.0f}",
+                f"{100 * r['accuracy']:.1f}%",
+            ]
+        )
+
+    print_table(
+        ["profile", "pipeline", "load [s]", "parse [ms]", "peak RSS [MB]", "accuracy"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+ODT text extraction with src/odt_reader.py vs. MuPDF on the same CV.
+
+python -m benchmark.odt_reader [--repeat 5]
+
+There are no ODT fixtures and MuPDF cannot open ODT, so every data/*.pdf
+is turned into an ODT with the same lines (as paragraphs, every other one
+in a table cell) and the reader is timed against MuPDF on the PDF and,
+where it exists, the DOCX of that CV.
+"""
+
+import argparse
+import io
+import zipfile
+from typing import List
+from xml.sax.saxutils import escape
+
+import fitz
+
+from benchmark.common import DATA_DIR, best_of, print_table
+from src.docx_reader import clean_docx
+from src.odt_reader import read_odt_text
+
+CONTENT_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    "<office:document-content"
+    ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+    ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+    ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">'
+    "<office:body><office:text>"
+)
+CONTENT_TAIL = "</office:text></office:body></office:document-content>"
+
+
+def make_odt(lines: List[str]) -> bytes:
+    body = []
+    for i, line in enumerate(lines):
+        paragraph = f"<text:p>{escape(line)}</text:p>"
+        if i % 2:
+            paragraph = (
+                "<table:table><table:table-row><table:table-cell>"
+                f"{paragraph}</table:table-cell></table:table-row></table:table>"
+            )
+        body.append(paragraph)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as odt:
+        odt.writestr(
+            "mimetype",
+            "application/vnd.oasis.opendocument.text",
+            compress_type=zipfile.ZIP_STORED,
+        )
+        odt.writestr("content.xml", CONTENT_HEAD + "".join(body) + CONTENT_TAIL)
+    return buffer.getvalue()
+
+
+def mupdf_text(data: bytes, filetype: str) -> str:
+    if filetype == "docx":
+        data = clean_docx(data)
+    doc = fitz.open(stream=data, filetype=filetype)
+    return "\n".join(page.get_text(sort=True) for page in doc)
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--repeat", type=int, default=5)
+    args = args_parser.parse_args()
+
+    try:
+        fitz.open(stream=make_odt(["test"]), filetype="odt")
+        print("MuPDF opened the ODT")
+    except Exception as e:
+        print(f"MuPDF cannot open ODT: {e}")
+
+    rows = []
+    for pdf in sorted(DATA_DIR.glob("*.pdf")):
+        pdf_data = pdf.read_bytes()
+        odt = make_odt(mupdf_text(pdf_data, "pdf").splitlines())
+        docx = pdf.with_suffix(".docx")
+
+        odt_s = best_of(lambda: read_odt_text(odt), args.repeat)
+        pdf_s = best_of(lambda: mupdf_text(pdf_data, "pdf"), args.repeat)
+        docx_s = None
+        if docx.exists():
+            docx_data = docx.read_bytes()
+            docx_s = best_of(lambda: mupdf_text(docx_data, "docx"), args.repeat)
+        rows.append(
+            [
+                pdf.stem,
+                f"{1000 * odt_s:.2f}",
+                f"{1000 * pdf_s:.2f}",
+                "-" if docx_s is None else f"{1000 * docx_s:.2f}",
+            ]
+        )
+
+    print_table(["CV", "odt_reader [ms]", "MuPDF pdf [ms]", "MuPDF docx [ms]"], rows)
+
+
+if __name__ == "__main__":
+    main()
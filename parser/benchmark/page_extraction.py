@@ -0,0 +1,60 @@
+"""
+Page text extraction of a long PDF: serial vs. worker processes vs. a
+page cap.
+
+python -m benchmark.page_extraction [--pages 40] [--repeat 3]
+
+The long PDF is the data/*.pdf fixtures concatenated until it has
+`--pages` pages, like a CV with a portfolio attached.
+"""
+
+import argparse
+
+import fitz
+
+from benchmark.common import DATA_DIR, best_of, print_table
+from src.page_text import PageExtractor
+
+
+def long_pdf(n_pages: int) -> bytes:
+    out = fitz.open()
+    sources = [fitz.open(path) for path in sorted(DATA_DIR.glob("*.pdf"))]
+    while out.page_count < n_pages:
+        for src in sources:
+            if out.page_count >= n_pages:
+                break
+            out.insert_pdf(
+                src, to_page=min(src.page_count, n_pages - out.page_count) - 1
+            )
+    return bytes(out.tobytes())
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--pages", type=int, default=40)
+    args_parser.add_argument("--repeat", type=int, default=3)
+    args = args_parser.parse_args()
+
+    data = long_pdf(args.pages)
+    serial = PageExtractor().pages(data, "pdf")
+
+    rows = []
+    for label, extractor in [
+        ("serial", PageExtractor()),
+        ("2 workers", PageExtractor(workers=2)),
+        ("4 workers", PageExtractor(workers=4)),
+        ("max_pages=3", PageExtractor(max_pages=3)),
+    ]:
+        try:
+            pages = extractor.pages(data, "pdf")  # also starts the pool
+            assert pages == serial[: len(pages)]
+            elapsed = best_of(lambda: extractor.pages(data, "pdf"), args.repeat)
+        finally:
+            extractor.close()
+        rows.append([label, len(pages), f"{1000 * elapsed:.1f}"])
+
+    print_table(["extraction", "pages", "time [ms]"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Parse latency and throughput on synthetic CVs of growing size, compared
+with a stored baseline.
+
+python -m benchmark.parse_suite [--pages 1 3 8] [--education 2 8]
+    [--keyword-density 0.1 0.6] [--count 3] [--repeat 3]
+    [--nlp-profile ner] [--baseline PATH] [--save] [--max-ratio 1.25]
+
+Every combination of pages, education entries and keyword density is
+generated as `count` PDFs and DOCX files (benchmark.synthetic_cv). Each
+file is parsed `repeat` times with the cache off, giving p50/p95 latency
+and the median of every stage, then the whole corpus of a format goes
+through Parser.parse_many for files per second. The model is loaded
+before any timing.
+
+--save writes the results as the new baseline. Otherwise, if a baseline
+of the same --nlp-profile exists, every row shows its p50 relative to it,
+and the run exits with status 1 when one is slower than --max-ratio times
+the baseline.
+"""
+
+import argparse
+import itertools
+import json
+import math
+import platform
+import statistics
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmark.common import PARSER_DIR, print_table, timed
+from benchmark.synthetic_cv import CVSpec, write_corpus
+
+DEFAULT_BASELINE = PARSER_DIR / "benchmark" / "baselines" / "parse_suite.json"
+FORMATS = ("pdf", "docx")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile, q in [0, 100]."""
+    ordered = sorted(values)
+    rank = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def case_name(spec: CVSpec, fmt: str) -> str:
+    return f"{fmt} pages={spec.pages} edu={spec.education} kw={spec.keyword_density}"
+
+
+def measure_case(parser: Any, files: List[Path], repeat: int) -> Dict[str, Any]:
+    from src.profiling import ParseTimings
+
+    totals: List[float] = []
+    stages: Dict[str, List[float]] = {}
+    for path in files:
+        for _ in range(repeat):
+            timings = ParseTimings()
+            _, elapsed = timed(lambda: parser.parse_file(str(path), timings=timings))
+            totals.append(elapsed)
+            for stage, seconds in timings.seconds.items():
+                stages.setdefault(stage, []).append(seconds)
+    return {
+        "p50_ms": 1000 * statistics.median(totals),
+        "p95_ms": 1000 * percentile(totals, 95),
+        "stages_ms": {
+            stage: 1000 * statistics.median(seconds)
+            for stage, seconds in stages.items()
+        },
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    from src.parser import PARSER_VERSION, Parser
+
+    parser = Parser(nlp_profile=args.nlp_profile)
+    _, load_s = timed(parser.load)
+
+    cases: Dict[str, Any] = {}
+    corpus: Dict[str, List[Path]] = {fmt: [] for fmt in FORMATS}
+    with tempfile.TemporaryDirectory() as tmp:
+        grid = itertools.product(args.pages, args.education, args.keyword_density)
+        for n, (pages, education, density) in enumerate(grid):
+            spec = CVSpec(pages, education, keyword_density=density, seed=n * 1000)
+            files = write_corpus(Path(tmp) / str(n), spec, args.count)
+            for fmt in FORMATS:
+                of_format = [p for p in files if p.suffix == f".{fmt}"]
+                corpus[fmt] += of_format
+                cases[case_name(spec, fmt)] = measure_case(
+                    parser, of_format, args.repeat
+                )
+
+        throughput = {}
+        for fmt, files in corpus.items():
+            results, elapsed = timed(
+                lambda: parser.parse_many(str(path) for path in files)
+            )
+            failed = [r for r in results if isinstance(r, Exception)]
+            if failed:
+                raise RuntimeError(f"{len(failed)} {fmt} files failed: {failed[0]!r}")
+            throughput[fmt] = len(files) / elapsed
+
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "parser_version": PARSER_VERSION,
+            "nlp_profile": args.nlp_profile,
+            "count": args.count,
+            "repeat": args.repeat,
+            "load_s": load_s,
+        },
+        "cases": cases,
+        "throughput_files_per_s": throughput,
+    }
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], max_ratio: float
+) -> bool:
+    """Print the results against the baseline, False if one regressed."""
+    ok = True
+    rows = []
+    for name, case in results["cases"].items():
+        base = baseline["cases"].get(name)
+        ratio = case["p50_ms"] / base["p50_ms"] if base else None
+        if ratio is not None and ratio > max_ratio:
+            ok = False
+        top = sorted(case["stages_ms"].items(), key=lambda s: -s[1])[:3]
+        rows.append(
+            [
+                name,
+                f"{case['p50_ms']:.1f}",
+                f"{case['p95_ms']:.1f}",
+                "-" if ratio is None else f"{ratio:.2f}x",
+                ", ".join(f"{stage} {ms:.1f}" for stage, ms in top),
+            ]
+        )
+    print_table(
+        ["case", "p50 [ms]", "p95 [ms]", "vs baseline", "top stages [ms]"], rows
+    )
+    print()
+
+    rows = []
+    for fmt, rate in results["throughput_files_per_s"].items():
+        base_rate = baseline.get("throughput_files_per_s", {}).get(fmt)
+        rows.append(
+            [fmt, f"{rate:.2f}", "-" if base_rate is None else f"{base_rate:.2f}"]
+        )
+    print_table(["format", "parse_many [files/s]", "baseline"], rows)
+    return ok
+
+
+def main() -> None:
+    from src.parser import DEFAULT_NLP_PROFILE, NLP_PROFILES
+
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--pages", nargs="+", type=int, default=[1, 3, 8])
+    args_parser.add_argument("--education", nargs="+", type=int, default=[2, 8])
+    args_parser.add_argument(
+        "--keyword-density", nargs="+", type=float, default=[0.1, 0.6]
+    )
+    args_parser.add_argument("--count", type=int, default=3)
+    args_parser.add_argument("--repeat", type=int, default=3)
+    args_parser.add_argument(
+        "--nlp-profile", default=DEFAULT_NLP_PROFILE, choices=NLP_PROFILES
+    )
+    args_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    args_parser.add_argument("--save", action="store_true")
+    args_parser.add_argument("--max-ratio", type=float, default=1.25)
+    args = args_parser.parse_args()
+
+    results = run(args)
+    baseline: Dict[str, Any] = {"cases": {}}
+    if not args.save and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        profile = baseline.get("meta", {}).get("nlp_profile")
+        if profile != args.nlp_profile:
+            # timings of another model say nothing about this one
+            print(f"[WARN] baseline recorded with --nlp-profile {profile}, ignored\n")
+            baseline = {"cases": {}}
+    elif not args.save:
+        print(f"[WARN] no baseline at {args.baseline}, record one with --save\n")
+    ok = compare(results, baseline, args.max_ratio)
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+        print(f"\nBaseline written to {args.baseline}")
+    elif not ok:
+        print(f"\n[ERR] p50 above {args.max_ratio}x the baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
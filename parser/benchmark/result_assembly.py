@@ -0,0 +1,159 @@
+"""
+Building the result of a parse: a pydantic model per entry, as the
+extractors used to, vs. the dataclasses of src/draft.py validated once.
+
+python -m benchmark.result_assembly [--entries 5 50 500] [--repeat 5]
+
+Every run assembles the same CV with the given number of education
+entries, jobs, languages, certificates and military entries, starting
+from the mock CV and setting each extracted value on it. No document is
+read and no model is loaded. All ways must give the same result.
+"""
+
+import argparse
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+from benchmark.common import best_of, print_table
+from src import draft, schema
+from src.catalogue import load_catalogue
+
+KEYWORDS = load_catalogue().empty_keywords
+
+
+def values(entries: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Extracted values, as keyword arguments of the entry classes."""
+    return {
+        "education": [
+            {
+                "degree": "Magister",
+                "institution": "Politechnika Gdańska",
+                "start_date": date(2000 + i % 20, 10, 1),
+                "end_date": date(2005 + i % 20, 6, 30),
+                "field_of_study": "informatyka",
+            }
+            for i in range(entries)
+        ],
+        "work_experience": [
+            {
+                "job_title": "Magazynier",
+                "company": "Magazyny Pomorskie sp. z o.o.",
+                "start_date": date(2010 + i % 10, 3, 1),
+                "end_date": None,
+            }
+            for i in range(entries)
+        ],
+        "languages": [
+            {"language": "Angielski", "proficiency": "fluent"} for _ in range(entries)
+        ],
+        "certifications": [
+            {"name": "SEP do 1 kV", "issuing_organization": "UDT"}
+            for _ in range(entries)
+        ],
+        "military_experience": [
+            {
+                "rank": "Szeregowy",
+                "branch": "Wojska Lądowe",
+                "start_date": date(1999, 1, 1),
+                "end_date": date(2000, 1, 1),
+                "duties": ["Służba wartownicza"],
+            }
+            for _ in range(entries)
+        ],
+    }
+
+
+SCHEMA_CLASSES = {
+    "education": schema.Education,
+    "work_experience": schema.WorkExperience,
+    "languages": schema.Language,
+    "certifications": schema.Certification,
+    "military_experience": schema.MilitaryExperience,
+}
+DRAFT_CLASSES = {
+    "education": draft.Education,
+    "work_experience": draft.WorkExperience,
+    "languages": draft.Language,
+    "certifications": draft.Certification,
+    "military_experience": draft.MilitaryExperience,
+}
+
+
+def per_model(extracted: Dict[str, List[Dict[str, Any]]]) -> schema.CVParserSchema:
+    """The old way: a validated mock, then a validated model per entry."""
+    cv = schema.CVParserSchema(
+        personal_info=schema.PersonalInfo(
+            full_name="UNDEFINED",
+            date_of_birth=date(1901, 1, 1),
+            nationality="UNDEFINED",
+            contact=schema.Contact(
+                email="undefined@undefined.com",
+                phone="+48 123458021",
+                address="UNDEFINED",
+            ),
+        ),
+        overview="",
+        education=[],
+        work_experience=[],
+        skills=[],
+        certifications=[],
+        languages=[],
+        military_experience=[],
+        keywords=KEYWORDS(),
+    )
+    cv.personal_info.contact.email = "jan.kowalski@example.pl"
+    cv.personal_info.full_name = "Jan Kowalski"
+    for name, entries in extracted.items():
+        setattr(cv, name, [SCHEMA_CLASSES[name](**entry) for entry in entries])
+    return cv
+
+
+def drafted(extracted: Dict[str, List[Dict[str, Any]]]) -> draft.CV:
+    cv = draft.CV(keywords=KEYWORDS())
+    cv.personal_info.contact.email = "jan.kowalski@example.pl"
+    cv.personal_info.full_name = "Jan Kowalski"
+    for name, entries in extracted.items():
+        setattr(cv, name, [DRAFT_CLASSES[name](**entry) for entry in entries])
+    return cv
+
+
+WAYS: Dict[str, Callable[[Dict[str, List[Dict[str, Any]]]], schema.CVParserSchema]] = {
+    "model per entry": per_model,
+    "draft, validated once": lambda extracted: draft.to_schema(drafted(extracted)),
+    "draft, constructed": lambda extracted: draft.construct(drafted(extracted)),
+}
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--entries", nargs="+", type=int, default=[5, 50, 500])
+    args_parser.add_argument("--repeat", type=int, default=5)
+    args = args_parser.parse_args()
+
+    rows = []
+    for entries in args.entries:
+        extracted = values(entries)
+        results = {way: fn(extracted) for way, fn in WAYS.items()}
+        reference = results["model per entry"].model_dump_json()
+        for way, cv in results.items():
+            if cv.model_dump_json() != reference:
+                raise AssertionError(f"{way} differs at {entries} entries")
+
+        # enough rounds for the small sizes to be measurable
+        rounds = max(1, 2000 // entries)
+        times = {
+            way: best_of(lambda: [fn(extracted) for _ in range(rounds)], args.repeat)
+            / rounds
+            for way, fn in WAYS.items()
+        }
+        base = times["model per entry"]
+        for way, seconds in times.items():
+            rows.append(
+                [entries, way, f"{1e6 * seconds:.0f}", f"{base / seconds:.2f}x"]
+            )
+
+    print_table(["entries", "assembly", "per CV [us]", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
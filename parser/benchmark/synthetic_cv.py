@@ -0,0 +1,295 @@
+"""
+Synthetic Polish CVs as PDF and DOCX, sized on demand.
+
+python -m benchmark.synthetic_cv --out-dir DIR [--count 10] [--pages 1]
+    [--education 3] [--jobs 3] [--keyword-density 0.3] [--seed 0]
+
+A CV has a header, an overview, the experience, education, skills,
+languages and certificates sections, then project descriptions until it
+has `pages` pages. `keyword_density` is the share of job bullets that
+carry a phrase of the positions catalogue. The same seed gives the same
+CV, so runs can be compared.
+"""
+
+import argparse
+import html
+import io
+import random
+import zipfile
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import List, Tuple
+from xml.sax.saxutils import escape
+
+from src.catalogue import load_catalogue
+
+HEADING = "heading"
+LINE = "line"
+BULLET = "bullet"
+
+FIRST_NAMES = ("Jan", "Anna", "Piotr", "Katarzyna", "Tomasz", "Małgorzata", "Łukasz")
+LAST_NAMES = ("Kowalski", "Nowak", "Wiśniewska", "Wójcik", "Zieliński", "Szymańska")
+CITIES = ("Gdańsk", "Warszawa", "Kraków", "Łódź", "Poznań", "Wrocław")
+COMPANIES = (
+    "Fabryka Precyzyjnych Wajch Sp. z o.o.",
+    "Stocznia Północna S.A.",
+    "Magazyny Pomorskie sp. z o.o.",
+    "Transport i Logistyka Kowalski sp.j.",
+    "Zakłady Mechaniczne Ursus S.A.",
+)
+TITLES = (
+    "Operator wózka widłowego",
+    "Magazynier",
+    "Specjalista ds. logistyki",
+    "Kierownik zmiany",
+    "Technik utrzymania ruchu",
+)
+SCHOOLS = (
+    "Uniwersytet Warszawski",
+    "Politechnika Gdańska",
+    "Technikum Elektroniczne w Poznaniu",
+    "Akademia Górniczo-Hutnicza",
+)
+DEGREES = ("Magister", "Licencjat", "Inżynier", "Technik")
+FIELDS = ("informatyka", "ekonomia", "mechatronika", "zarządzanie", "logistyka")
+MONTHS = ("styczeń", "marzec", "maj", "wrzesień", "październik")
+DUTIES = (
+    "Obsługa i konserwacja maszyn produkcyjnych",
+    "Przyjmowanie i wydawanie towaru zgodnie z dokumentacją",
+    "Koordynacja pracy zespołu na zmianie",
+    "Prowadzenie ewidencji w systemie ERP",
+    "Dbanie o przestrzeganie zasad BHP",
+)
+SKILLS = (
+    "Obsługa komputera i systemów ERP",
+    "Prawo jazdy kat. B, C",
+    "Uprawnienia UDT na wózki widłowe",
+    "Podstawowa znajomość mechaniki i hydrauliki",
+    "Umiejętność pracy w zespole",
+)
+LANGUAGES = ("Polski - ojczysty", "Angielski - B2", "Niemiecki - podstawowy")
+CERTIFICATES = (
+    "Certyfikat SEP do 1 kV - Urząd Dozoru Technicznego",
+    "Kurs pierwszej pomocy",
+    "Szkolenie BHP dla pracowników magazynu",
+)
+PROJECT = (
+    "Wdrożenie nowego układu regałów w magazynie wysokiego składowania, "
+    "skrócenie czasu kompletacji zamówień i ograniczenie przestojów wózków. "
+    "Opracowanie instrukcji stanowiskowych i przeszkolenie zespołu zmiany."
+)
+
+Line = Tuple[str, str]
+
+_ASCII = str.maketrans("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ", "acelnoszzACELNOSZZ")
+
+
+@dataclass(frozen=True)
+class CVSpec:
+    pages: int = 1
+    education: int = 3
+    jobs: int = 3
+    keyword_density: float = 0.3
+    seed: int = 0
+
+
+def _catalogue_phrases() -> List[str]:
+    catalogue = load_catalogue()
+    return sorted(
+        {phrase for req in catalogue.requirements.values() for phrase in req.phrases}
+    )
+
+
+def cv_lines(spec: CVSpec, projects: int = 0) -> List[Line]:
+    """(kind, text) lines of the CV, `projects` extra project paragraphs."""
+    rng = random.Random(spec.seed)
+    phrases = _catalogue_phrases()
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines: List[Line] = [
+        (HEADING, f"{first} {last}"),
+        (LINE, f"{first}.{last}@example.pl".lower().translate(_ASCII)),
+        (
+            LINE,
+            f"+48 {rng.randrange(500, 800)} {rng.randrange(100, 1000)} "
+            f"{rng.randrange(100, 1000)}",
+        ),
+        (LINE, f"{rng.choice(CITIES)}, Polska"),
+        (HEADING, "O mnie"),
+        (
+            LINE,
+            "Jestem sumienną osobą z wieloletnim doświadczeniem w pracy "
+            "fizycznej i biurowej. Szybko uczę się nowych zadań i dobrze "
+            "odnajduję się w pracy zespołowej.",
+        ),
+        (HEADING, "Doświadczenie zawodowe"),
+    ]
+    year = 2024
+    for _ in range(spec.jobs):
+        start = year - rng.randrange(1, 4)
+        lines.append(
+            (
+                LINE,
+                f"{rng.choice(MONTHS)} {start} - {rng.choice(MONTHS)} {year} "
+                f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)}",
+            )
+        )
+        for _ in range(3):
+            duty = rng.choice(DUTIES)
+            if rng.random() < spec.keyword_density:
+                duty = f"{duty}, {rng.choice(phrases)}"
+            lines.append((BULLET, duty))
+        year = start
+
+    lines.append((HEADING, "Wykształcenie"))
+    year = 2020
+    for _ in range(spec.education):
+        start = year - rng.randrange(3, 6)
+        lines.append(
+            (LINE, f"{rng.choice(MONTHS)} {start} - {rng.choice(MONTHS)} {year}")
+        )
+        lines.append((LINE, rng.choice(SCHOOLS)))
+        lines.append((LINE, f"{rng.choice(DEGREES)}, kierunek: {rng.choice(FIELDS)}"))
+        year = start
+
+    lines.append((HEADING, "Umiejętności"))
+    lines.extend((BULLET, skill) for skill in rng.sample(SKILLS, 3))
+    lines.append((HEADING, "Języki"))
+    lines.extend((LINE, language) for language in LANGUAGES)
+    lines.append((HEADING, "Certyfikaty"))
+    lines.extend((LINE, certificate) for certificate in CERTIFICATES)
+    if projects:
+        lines.append((HEADING, "Projekty"))
+        lines.extend((LINE, PROJECT) for _ in range(projects))
+    return lines
+
+
+def _html(lines: List[Line]) -> str:
+    out = []
+    for kind, text in lines:
+        text = html.escape(text)
+        if kind == HEADING:
+            out.append(f"<h2>{text}</h2>")
+        elif kind == BULLET:
+            out.append(f"<p>• {text}</p>")
+        else:
+            out.append(f"<p>{text}</p>")
+    return "\n".join(out)
+
+
+def _render_pdf(lines: List[Line], max_pages: int = 0) -> Tuple[bytes, int]:
+    """PDF of the lines and its page count, cut after `max_pages` if set."""
+    import fitz
+
+    out = io.BytesIO()
+    writer = fitz.DocumentWriter(out)
+    story = fitz.Story(html=_html(lines))
+    page = fitz.paper_rect("a4")
+    pages = 0
+    more = True
+    while more and (not max_pages or pages < max_pages):
+        device = writer.begin_page(page)
+        more, _ = story.place(page + (50, 50, -50, -50))
+        story.draw(device)
+        writer.end_page()
+        pages += 1
+    writer.close()
+    return out.getvalue(), pages
+
+
+# project paragraphs that fill about one A4 page
+PROJECTS_PER_PAGE = 12
+
+
+def to_pdf(spec: CVSpec) -> bytes:
+    data, pages = _render_pdf(cv_lines(spec))
+    if pages >= spec.pages:
+        return data
+    projects = (spec.pages - pages + 1) * PROJECTS_PER_PAGE
+    data, _ = _render_pdf(cv_lines(spec, projects), max_pages=spec.pages)
+    return data
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    "</Relationships>"
+)
+_DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"/>'
+)
+_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _paragraph(kind: str, text: str) -> str:
+    props = '<w:rPr><w:b/><w:sz w:val="28"/></w:rPr>' if kind == HEADING else ""
+    prefix = "• " if kind == BULLET else ""
+    return (
+        f'<w:p><w:r>{props}<w:t xml:space="preserve">'
+        f"{escape(prefix + text)}</w:t></w:r></w:p>"
+    )
+
+
+def to_docx(spec: CVSpec) -> bytes:
+    """DOCX of the CV with `pages - 1` pages of projects, the reader paginates it."""
+    lines = cv_lines(spec, (spec.pages - 1) * PROJECTS_PER_PAGE)
+    body = "".join(_paragraph(kind, text) for kind, text in lines)
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{_W}"><w:body>{body}</w:body></w:document>'
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        docx.writestr("_rels/.rels", _RELS)
+        docx.writestr("word/_rels/document.xml.rels", _DOCUMENT_RELS)
+        docx.writestr("word/document.xml", document)
+    return out.getvalue()
+
+
+def write_corpus(out_dir: Path, spec: CVSpec, count: int) -> List[Path]:
+    """`count` CVs of `spec` with consecutive seeds, each as PDF and DOCX."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        cv = replace(spec, seed=spec.seed + i)
+        stem = f"cv-p{cv.pages}-e{cv.education}-j{cv.jobs}-s{cv.seed}"
+        for suffix, render in ((".pdf", to_pdf), (".docx", to_docx)):
+            path = out_dir / (stem + suffix)
+            path.write_bytes(render(cv))
+            paths.append(path)
+    return paths
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--out-dir", required=True, type=Path)
+    args_parser.add_argument("--count", type=int, default=10)
+    args_parser.add_argument("--pages", type=int, default=1)
+    args_parser.add_argument("--education", type=int, default=3)
+    args_parser.add_argument("--jobs", type=int, default=3)
+    args_parser.add_argument("--keyword-density", type=float, default=0.3)
+    args_parser.add_argument("--seed", type=int, default=0)
+    args = args_parser.parse_args()
+
+    spec = CVSpec(
+        args.pages, args.education, args.jobs, args.keyword_density, args.seed
+    )
+    paths = write_corpus(args.out_dir, spec, args.count)
+    print(f"Wrote {len(paths)} files to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
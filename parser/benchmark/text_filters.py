@@ -0,0 +1,64 @@
+"""
+Unicode filtering of the document text: the old per-character
+unicodedata.name loop vs. the cached tables in src/text_filters.py.
+
+python -m benchmark.text_filters [--repeat 20]
+"""
+
+import argparse
+import unicodedata
+
+import fitz
+
+from benchmark.common import DATA_DIR, best_of, print_table
+from src.text_filters import remove_unwanted_unicode
+
+
+def per_char_loop(text: str) -> str:
+    cleaned = []
+    for ch in text:
+        if ord(ch) < 32 and ch not in ("\n", "\t"):
+            continue
+        if ord(ch) < 128:
+            cleaned.append(ch)
+            continue
+        cat = unicodedata.name(ch, "")
+        if "LATIN" in cat or "WITH" in cat:
+            cleaned.append(ch)
+            continue
+        if ch in "•–—…«»©®°":
+            cleaned.append(ch)
+    return "".join(cleaned)
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--repeat", type=int, default=20)
+    args = args_parser.parse_args()
+
+    texts = []
+    for path in sorted(DATA_DIR.glob("*.pdf")):
+        with fitz.open(path) as doc:
+            texts.append("\n".join(page.get_text(sort=True) for page in doc))
+    corpus = "\n".join(texts)
+    assert per_char_loop(corpus) == remove_unwanted_unicode(corpus)
+
+    rows = []
+    for name, text in (("shortest CV", min(texts, key=len)), ("all CVs", corpus)):
+        loop_s = best_of(lambda: per_char_loop(text), args.repeat)
+        table_s = best_of(lambda: remove_unwanted_unicode(text), args.repeat)
+        rows.append(
+            [
+                name,
+                len(text),
+                f"{1000 * loop_s:.2f}",
+                f"{1000 * table_s:.2f}",
+                f"{loop_s / table_s:.0f}x",
+            ]
+        )
+
+    print_table(["text", "chars", "loop [ms]", "table [ms]", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
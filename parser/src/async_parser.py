@@ -0,0 +1,183 @@
+"""
+asyncio façade over Parser.
+
+A parse blocks for the whole document open, text extraction and spaCy
+run, so none of it happens on the event loop:
+
+- reading the input and the cache run in a small thread pool,
+- opening the document and extracting its text run in `extract_workers`
+  processes (MuPDF is not thread-safe), or in one dedicated thread when
+  extract_workers is 0,
+- the spaCy pipeline and the extractors run in one thread, the pipeline
+  is loaded once and is not safe to share between threads.
+
+Files move through these stages independently, so a long PDF in the
+extraction stage does not hold up the NLP of the file before it. At most
+`max_concurrency` files are in flight, the others wait for a slot.
+
+A timeout or cancellation stops waiting for the file right away. A stage
+already running in a pool still runs to its end, but its result is
+dropped and no later stage is started.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from src import schema
+from src.context import ParseContext
+from src.parser import Parser, Source
+from src.profiling import ParseTimings
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Parser of an extraction worker process, it never loads the spaCy model
+_worker_parser: Optional[Parser] = None
+
+
+def _init_worker(parser_kwargs: dict[str, Any]) -> None:
+    global _worker_parser
+    # pool workers are daemonic and cannot start page extraction workers
+    _worker_parser = Parser(**{**parser_kwargs, "cache_dir": None, "page_workers": 1})
+
+
+def _worker_extract(data: bytes, filetype: str) -> ParseContext:
+    assert _worker_parser is not None
+    return _worker_parser._extract_context(data, filetype)
+
+
+class AsyncParser:
+    """
+    Parses CVs from coroutines, see the module docstring for where each
+    stage runs. `timeout` is the default limit in seconds for one file,
+    waiting for a slot included.
+    """
+
+    def __init__(
+        self,
+        parser_kwargs: Optional[dict[str, Any]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        extract_workers: int = 0,
+        timeout: Optional[float] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+        parser_kwargs = parser_kwargs or {}
+        self.parser = Parser(**parser_kwargs)
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._io = ThreadPoolExecutor(max_concurrency, thread_name_prefix="parser-io")
+        self._extract: Executor
+        self._extract_fn: Callable[[bytes, str], ParseContext]
+        if extract_workers > 0:
+            # forking a process that already runs the pool threads can deadlock
+            self._extract = ProcessPoolExecutor(
+                extract_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(parser_kwargs,),
+            )
+            self._extract_fn = _worker_extract
+        else:
+            self._extract = ThreadPoolExecutor(1, thread_name_prefix="parser-extract")
+            self._extract_fn = self.parser._extract_context
+        self._nlp = ThreadPoolExecutor(1, thread_name_prefix="parser-nlp")
+
+    def _read(
+        self, input: Source, filetype: Optional[str], timings: ParseTimings
+    ) -> Tuple[bytes, str, Optional[str], Optional[schema.CVParserSchema]]:
+        parser = self.parser
+        with timings.stage("read"):
+            data, filetype, _ = parser._read_input(input, filetype)
+            cache_key = parser._cache_key(data)
+        return data, filetype, cache_key, parser._cache_get(cache_key, timings)
+
+    def _finish(
+        self, ctx: ParseContext, cache_key: Optional[str]
+    ) -> schema.CVParserSchema:
+        parser = self.parser
+        parser._build_contexts([ctx])
+        cv = parser._parse_context(ctx)
+        parser._cache_put(cache_key, cv, ctx.timings)
+        return cv
+
+    async def _parse(
+        self, input: Source, filetype: Optional[str], timings: ParseTimings
+    ) -> schema.CVParserSchema:
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            data, detected_type, cache_key, cached = await loop.run_in_executor(
+                self._io, self._read, input, filetype, timings
+            )
+            if cached is not None:
+                return cached
+
+            ctx = await loop.run_in_executor(
+                self._extract, self._extract_fn, data, detected_type
+            )
+            # the extraction stages, possibly timed in another process
+            timings.seconds.update(ctx.timings.seconds)
+            timings.allocated.update(ctx.timings.allocated)
+            ctx.timings = timings
+
+            return await loop.run_in_executor(self._nlp, self._finish, ctx, cache_key)
+
+    async def parse_one(
+        self,
+        input: Source,
+        filetype: Optional[str] = None,
+        timeout: Optional[float] = None,
+        timings: Optional[ParseTimings] = None,
+    ) -> schema.CVParserSchema:
+        """
+        Parse one CV like Parser.parse_file. Raises TimeoutError after
+        `timeout` seconds (default: the parser's timeout).
+        """
+        return await asyncio.wait_for(
+            self._parse(input, filetype, timings or ParseTimings()),
+            self.timeout if timeout is None else timeout,
+        )
+
+    async def parse_many(
+        self, inputs: Iterable[Source], timeout: Optional[float] = None
+    ) -> List[Union[schema.CVParserSchema, BaseException]]:
+        """
+        Parse many CVs concurrently, in input order. Like Parser.parse_many a
+        file that fails or times out yields its exception in place of a
+        result. Cancelling the call cancels every file still in flight.
+        """
+        return await asyncio.gather(
+            *(self.parse_one(input, timeout=timeout) for input in inputs),
+            return_exceptions=True,
+        )
+
+    def close(self) -> None:
+        """Wait for the running stages, drop the queued ones, stop the pools."""
+        for executor in (self._io, self._extract, self._nlp):
+            executor.shutdown(wait=True, cancel_futures=True)
+        self.parser.close()
+
+    async def aclose(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self) -> "AsyncParser":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,199 @@
+import glob
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from types import TracebackType
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple, Type
+
+from src.parser import Parser
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".odt")
+
+# One Parser per worker process, created by the pool initializer
+_worker_parser: Optional[Parser] = None
+
+
+def _init_worker(parser_kwargs: dict[str, Any]) -> None:
+    global _worker_parser
+    # pool workers are daemonic and cannot start page extraction workers
+    _worker_parser = Parser(**{**parser_kwargs, "page_workers": 1})
+
+
+def _parse_chunk(paths: List[str]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    Returns (path, result_json, error) per path. The chunk shares one
+    nlp.pipe run; exceptions never leave the worker, so one broken file
+    does not take the whole batch down.
+    """
+    assert _worker_parser is not None
+    try:
+        results = _worker_parser.parse_many(paths)
+    except Exception as e:
+        return [(path, None, repr(e)) for path in paths]
+
+    return [
+        (
+            (path, None, repr(result))
+            if isinstance(result, Exception)
+            else (path, result.model_dump_json(ensure_ascii=False), None)
+        )
+        for path, result in zip(paths, results)
+    ]
+
+
+def collect_inputs(input_dir: Optional[str], pattern: Optional[str]) -> List[str]:
+    """
+    Files matching `pattern` inside `input_dir` (recursive `**` allowed).
+    Without a pattern every supported CV file in `input_dir` is taken.
+    """
+    base = input_dir or "."
+    if pattern:
+        paths = glob.glob(os.path.join(base, pattern), recursive=True)
+    else:
+        paths = [
+            os.path.join(base, name)
+            for name in os.listdir(base)
+            if name.lower().endswith(SUPPORTED_EXTENSIONS)
+        ]
+    return sorted(p for p in paths if os.path.isfile(p))
+
+
+def file_id(path: str, base: str = ".") -> str:
+    """
+    Id of an input that does not depend on the working directory, the
+    worker or the order of results: a hash of its path relative to `base`.
+    """
+    rel = os.path.relpath(path, base)
+    if rel.startswith(".."):
+        rel = os.path.abspath(path)
+    return hashlib.sha1(rel.replace(os.sep, "/").encode("utf-8")).hexdigest()[:16]
+
+
+class OutputExistsError(FileExistsError):
+    """The JSONL output exists and `overwrite` was not given."""
+
+
+class JsonlWriter:
+    """
+    Appends one compact {"id", "file", "result"|"error"} record per line.
+    A result is written as the JSON the worker produced, without decoding
+    it again. Every record is flushed, so a reader of the growing file sees
+    every written record and at most an incomplete last line, which
+    read_records skips. An existing file is only replaced with `overwrite`,
+    otherwise OutputExistsError is raised before anything is parsed.
+    """
+
+    def __init__(self, path: str, base_dir: str = ".", overwrite: bool = False) -> None:
+        self.base_dir = base_dir
+        try:
+            self._file: TextIO = open(path, "w" if overwrite else "x", encoding="utf-8")
+        except FileExistsError:
+            raise OutputExistsError(path) from None
+
+    def write(
+        self, path: str, result_json: Optional[str], error: Optional[str]
+    ) -> None:
+        head = (
+            f'{{"id":"{file_id(path, self.base_dir)}",'
+            f'"file":{json.dumps(path, ensure_ascii=False)},'
+        )
+        if error is not None:
+            line = f'{head}"error":{json.dumps(error, ensure_ascii=False)}}}\n'
+        else:
+            line = f'{head}"result":{result_json}}}\n'
+        self._file.write(line)
+        self._file.flush()
+
+    def write_many(
+        self, records: Iterable[Tuple[str, Optional[str], Optional[str]]]
+    ) -> None:
+        for path, result_json, error in records:
+            self.write(path, result_json, error)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def read_records(path: str) -> List[Dict[str, Any]]:
+    """Records of a JSONL output, also one still being written."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.endswith("\n")]
+
+
+def _output_path(output_dir: str, base: str, path: str) -> str:
+    rel = os.path.relpath(path, base)
+    if rel.startswith(".."):
+        rel = os.path.basename(path)
+    return os.path.join(output_dir, rel + ".json")
+
+
+def run_batch(
+    inputs: Iterable[str],
+    workers: int,
+    output_jsonl: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    base_dir: str = ".",
+    parser_kwargs: Optional[dict[str, Any]] = None,
+    batch_size: int = 8,
+    ordered: bool = True,
+    overwrite: bool = False,
+) -> Tuple[int, int]:
+    """
+    Parse `inputs` on a pool of `workers` processes, handing each worker
+    `batch_size` files at a time so their NLP work is batched.
+
+    Results go either to `output_jsonl` (see JsonlWriter), written as
+    every chunk finishes, or to `output_dir` (one JSON file per input).
+    An existing `output_jsonl` is only replaced with `overwrite`.
+    With `ordered` False chunks are written in the order they finish
+    instead of the input order. Returns (parsed, failed) counts.
+    """
+    if (output_jsonl is None) == (output_dir is None):
+        raise ValueError("Exactly one of output_jsonl and output_dir is required")
+
+    inputs = list(inputs)
+    chunks = [inputs[i : i + batch_size] for i in range(0, len(inputs), batch_size)]
+    parsed = failed = 0
+
+    jsonl = JsonlWriter(output_jsonl, base_dir, overwrite) if output_jsonl else None
+    try:
+        with multiprocessing.Pool(
+            processes=workers,
+            initializer=_init_worker,
+            initargs=(parser_kwargs or {},),
+        ) as pool:
+            imap = pool.imap if ordered else pool.imap_unordered
+            for records in imap(_parse_chunk, chunks):
+                for path, result, error in records:
+                    if error is not None:
+                        failed += 1
+                        logger.error("%s: %s", path, error)
+                    else:
+                        parsed += 1
+                    if result is not None and output_dir is not None:
+                        out_path = _output_path(output_dir, base_dir, path)
+                        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                        with open(out_path, "w", encoding="utf-8") as f:
+                            f.write(result)
+                if jsonl is not None:
+                    jsonl.write_many(records)
+    finally:
+        if jsonl is not None:
+            jsonl.close()
+
+    return parsed, failed
@@ -0,0 +1,96 @@
+import hashlib
+import os
+import tempfile
+from typing import List, Optional, Tuple
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+class ResultCache:
+    """
+    On-disk cache of parse results, one JSON file per entry.
+
+    Entries are keyed by the SHA-256 of the input bytes together with
+    everything that changes the output (parser, model and catalogue
+    versions). Reads refresh the file mtime, and once the directory grows
+    over `max_bytes` the least recently used entries are removed. The size
+    is tracked as a running total, the directory is only scanned at start
+    and when the total goes over the cap (other processes may share it).
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._total = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def key(data: bytes, *versions: str) -> str:
+        digest = hashlib.sha256(data)
+        for version in versions:
+            digest.update(b"\0" + version.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        # write to a temp file first so concurrent readers never see half an entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(value)
+        path = self._path(key)
+        try:
+            self._total -= os.stat(path).st_size
+        except FileNotFoundError:
+            pass
+        self._total += os.stat(tmp_path).st_size
+        os.replace(tmp_path, path)
+        if self._total > self.max_bytes:
+            self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total = total
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._total = 0
@@ -0,0 +1,90 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src import schema
+from src.keyword_matcher import KeywordMatcher
+
+DEFAULT_CATALOGUE_PATH = str(
+    Path(__file__).resolve().parent.parent / "catalogue" / "positions.json"
+)
+GROUPS = ("required", "optional")
+
+
+@dataclass(frozen=True)
+class Requirement:
+    position: str
+    group: str
+    flag: str
+    phrases: Tuple[str, ...]
+    # flag is also set when the computed value reaches this threshold
+    min_experience_years: Optional[int] = None
+    min_dead_lift_kg: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.position}.{self.group}.{self.flag}"
+
+
+class Catalogue:
+    """
+    Positions and their required/optional requirements, as declared in
+    catalogue/positions.json:
+
+    {"positions": {"<position>": {"title": "...",
+                                  "required": {"<flag>": {"phrases": [...]}},
+                                  "optional": {...}}}}
+
+    All phrases are compiled into one KeywordMatcher whose keys are the
+    requirement keys, so a match maps to its flag with a dict lookup.
+    """
+
+    def __init__(self, data: Dict[str, Any], version: str) -> None:
+        self.version = version
+        self.titles: Dict[str, str] = {}
+        self.requirements: Dict[str, Requirement] = {}
+
+        for position, spec in data["positions"].items():
+            self.titles[position] = spec.get("title", position)
+            unknown = set(spec) - set(GROUPS) - {"title"}
+            if unknown:
+                raise ValueError(f"Unknown keys {unknown} in position {position!r}")
+            for group in GROUPS:
+                for flag, rule in spec.get(group, {}).items():
+                    if not isinstance(rule.get("phrases"), list):
+                        raise ValueError(f"{position}.{group}.{flag}: missing phrases")
+                    req = Requirement(
+                        position=position,
+                        group=group,
+                        flag=flag,
+                        phrases=tuple(rule["phrases"]),
+                        min_experience_years=rule.get("min_experience_years"),
+                        min_dead_lift_kg=rule.get("min_dead_lift_kg"),
+                    )
+                    self.requirements[req.key] = req
+
+        self.matcher = KeywordMatcher(
+            {key: req.phrases for key, req in self.requirements.items()}
+        )
+
+    def empty_keywords(self) -> schema.Keywords:
+        """Every flag of every position set to False."""
+        keywords = {
+            position: schema.PositionKeywords(required={}, optional={})
+            for position in self.titles
+        }
+        for req in self.requirements.values():
+            getattr(keywords[req.position], req.group)[req.flag] = False
+        return keywords
+
+    def set_flag(self, keywords: schema.Keywords, key: str) -> None:
+        req = self.requirements[key]
+        getattr(keywords[req.position], req.group)[req.flag] = True
+
+
+def load_catalogue(path: str = DEFAULT_CATALOGUE_PATH) -> Catalogue:
+    with open(path, "rb") as f:
+        raw = f.read()
+    return Catalogue(json.loads(raw), hashlib.sha256(raw).hexdigest()[:12])
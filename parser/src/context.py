@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List
+
+from src.profiling import ParseTimings
+from src.sections import Span
+
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
+# Text views of one CV that go through the spaCy pipeline
+FULL_VIEW = "full"
+EDUCATION_VIEW = "education"
+# only when the experience section has no spans, i.e. it comes from the layout
+EXPERIENCE_VIEW = "experience"
+
+
+@dataclass
+class ParseContext:
+    """
+    Everything extractors need for one document, computed once up front:
+    the whitespace-normalized text, the section index (see
+    Parser._index_sections) with the offsets of the sections in the text
+    (see sections.segment_spans) and the spaCy Docs (see Parser._nlp_views).
+    `timings` collects the time of every stage spent on the document.
+    """
+
+    text: str
+    sections: Dict[str, str] = field(default_factory=dict)
+    spans: Dict[str, List[Span]] = field(default_factory=dict)
+    docs: Dict[str, "Doc"] = field(default_factory=dict)
+    timings: ParseTimings = field(default_factory=ParseTimings)
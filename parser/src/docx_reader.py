@@ -0,0 +1,96 @@
+"""
+DOCX handling without going through the whole archive.
+
+`clean_docx` prepares a DOCX for MuPDF: mc:Fallback duplicates are removed
+from word/document.xml and media parts are left out, since only the text
+is extracted. `read_docx_text` skips MuPDF altogether and streams the
+document parts through iterparse, which is much faster but lays the text
+out by paragraphs instead of by rendered lines.
+"""
+
+import io
+import re
+import zipfile
+from typing import IO, List
+from xml.etree.ElementTree import iterparse
+
+from src import patterns
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+DOCUMENT_PART = "word/document.xml"
+MEDIA_PREFIX = "word/media/"
+HEADER_PART = re.compile(r"word/header\d*\.xml")
+FOOTER_PART = re.compile(r"word/footer\d*\.xml")
+
+_T = W_NS + "t"
+_P = W_NS + "p"
+_R = W_NS + "r"
+_TAB = W_NS + "tab"
+_BREAKS = (W_NS + "br", W_NS + "cr")
+_FALLBACK = MC_NS + "Fallback"
+
+
+def clean_docx(data: bytes) -> bytes:
+    """
+    Copy of the archive without mc:Fallback elements in document.xml and
+    without media parts.
+    """
+    cleaned = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data), "r") as docx:
+        with zipfile.ZipFile(cleaned, "w") as cleaned_docx:
+            for item in docx.infolist():
+                if item.filename.startswith(MEDIA_PREFIX):
+                    continue
+                if item.filename == DOCUMENT_PART:
+                    xml_content = docx.read(item).decode("utf-8")
+                    cleaned_docx.writestr(
+                        item, patterns.DOCX_FALLBACK.sub("", xml_content)
+                    )
+                else:
+                    cleaned_docx.writestr(item, docx.read(item))
+    return cleaned.getvalue()
+
+
+def _part_text(stream: IO[bytes], out: List[str]) -> None:
+    fallback_depth = run_depth = 0
+    for event, el in iterparse(stream, ("start", "end")):
+        tag = el.tag
+        if tag == _FALLBACK:
+            fallback_depth += 1 if event == "start" else -1
+            continue
+        if tag == _R:
+            run_depth += 1 if event == "start" else -1
+        if event == "start" or fallback_depth:
+            continue
+        if tag == _T:
+            out.append(el.text or "")
+        elif tag == _TAB and run_depth:
+            # w:tab outside a run is a tab stop definition (w:pPr/w:tabs)
+            out.append("\t")
+        elif tag in _BREAKS:
+            out.append("\n")
+        elif tag == _P:
+            out.append("\n")
+        # everything below was consumed already, keep memory flat
+        el.clear()
+
+
+def read_docx_text(data: bytes) -> str:
+    """
+    Text of the headers, body and footers in document order, one line per
+    paragraph. Text boxes are read once (mc:Choice), media is never opened.
+    """
+    out: List[str] = []
+    with zipfile.ZipFile(io.BytesIO(data), "r") as docx:
+        names = docx.namelist()
+        parts = (
+            sorted(n for n in names if HEADER_PART.fullmatch(n))
+            + [DOCUMENT_PART]
+            + sorted(n for n in names if FOOTER_PART.fullmatch(n))
+        )
+        for part in parts:
+            with docx.open(part) as stream:
+                _part_text(stream, out)
+    return "".join(out)
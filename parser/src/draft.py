@@ -0,0 +1,125 @@
+"""
+The result of one parse while it is being built.
+
+Extractors fill in plain slotted dataclasses with the field names of
+src/schema.py, which cost an attribute write to change. The draft is
+validated into a CVParserSchema once, when the parse is done, instead of
+validating a pydantic model per education entry, job or language.
+"""
+
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from src import schema
+
+UNDEFINED = "UNDEFINED"
+# placeholders of a CV nothing was extracted from, see Parser.create_mock
+MOCK_EMAIL = "undefined@undefined.com"
+MOCK_PHONE = "+48 123458021"
+MOCK_DATE_OF_BIRTH = date(1901, 1, 1)
+
+
+@dataclass(slots=True)
+class Contact:
+    email: str = MOCK_EMAIL
+    phone: str = MOCK_PHONE
+    address: Optional[str] = UNDEFINED
+
+
+@dataclass(slots=True)
+class PersonalInfo:
+    full_name: str = UNDEFINED
+    date_of_birth: date = MOCK_DATE_OF_BIRTH
+    nationality: str = UNDEFINED
+    contact: Contact = field(default_factory=Contact)
+
+
+@dataclass(slots=True)
+class Education:
+    degree: str
+    institution: str
+    start_date: date
+    end_date: Optional[date]
+    field_of_study: str
+
+
+@dataclass(slots=True)
+class WorkExperience:
+    job_title: str
+    company: str
+    start_date: date
+    end_date: Optional[date] = None
+
+
+@dataclass(slots=True)
+class Certification:
+    name: str
+    issuing_organization: str
+
+
+@dataclass(slots=True)
+class Language:
+    language: str
+    proficiency: str
+
+
+@dataclass(slots=True)
+class MilitaryExperience:
+    rank: str
+    branch: str
+    start_date: date
+    end_date: Optional[date]
+    duties: List[str]
+
+
+@dataclass(slots=True)
+class CV:
+    personal_info: PersonalInfo = field(default_factory=PersonalInfo)
+    overview: str = ""
+    education: List[Education] = field(default_factory=list)
+    work_experience: List[WorkExperience] = field(default_factory=list)
+    skills: List[str] = field(default_factory=list)
+    certifications: List[Certification] = field(default_factory=list)
+    languages: List[Language] = field(default_factory=list)
+    military_experience: List[MilitaryExperience] = field(default_factory=list)
+    # keyword flags are built as schema.PositionKeywords by the catalogue
+    keywords: schema.Keywords = field(default_factory=dict)
+
+
+def to_schema(cv: CV) -> schema.CVParserSchema:
+    """Validate the whole draft in one pass, raises pydantic.ValidationError."""
+    return schema.CVParserSchema.model_validate(cv, from_attributes=True)
+
+
+_MODELS: Dict[type, Type[BaseModel]] = {
+    Contact: schema.Contact,
+    PersonalInfo: schema.PersonalInfo,
+    Education: schema.Education,
+    WorkExperience: schema.WorkExperience,
+    Certification: schema.Certification,
+    Language: schema.Language,
+    MilitaryExperience: schema.MilitaryExperience,
+    CV: schema.CVParserSchema,
+}
+
+
+def _construct(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_construct(item) for item in value]
+    if is_dataclass(value) and not isinstance(value, type):
+        return _MODELS[type(value)].model_construct(
+            **{f.name: _construct(getattr(value, f.name)) for f in fields(value)}
+        )
+    return value
+
+
+def construct(cv: CV) -> schema.CVParserSchema:
+    """
+    The schema model without validation, only for drafts whose values are
+    known to be valid, e.g. the constant ones of create_mock.
+    """
+    result: schema.CVParserSchema = _construct(cv)
+    return result
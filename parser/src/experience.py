@@ -0,0 +1,194 @@
+"""
+Job entries of the experience section.
+
+An entry starts at a line with a date ("wrzesień 2016 –", "2015 – 2024")
+and its header is that line with the date lines right after it (an end
+date in a second column). With the dates cut out, the header splits into
+pieces: the company is the piece with a legal form or an organisation the
+NER found, the title the piece starting with a job name, else the first
+one left. When one of them is missing, the line after the dates and then
+up to two short lines before them are read as well.
+"""
+
+import calendar
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Collection, List, Optional, Tuple
+
+from src import draft, patterns, sections
+
+# a longer line without a date is description, not a title or company
+MAX_HEADER_WORDS = 10
+# lines before the dates that can still belong to the header
+MAX_LINES_BEFORE_DATES = 2
+UNKNOWN = "UNKNOWN"
+
+
+@dataclass
+class JobEntry:
+    # the date lines
+    header: List[str]
+    # short lines right before the dates and the first line after them,
+    # read only when the header has no title or company
+    before: List[str] = field(default_factory=list)
+    next_line: Optional[str] = None
+    # every line after the dates, next_line included
+    description: List[str] = field(default_factory=list)
+
+
+def _is_short(line: str) -> bool:
+    """Could be a title or company line: short, every piece capitalised."""
+    return (
+        not patterns.JOB_BULLET.match(line)
+        and (not line.endswith(".") or patterns.COMPANY.search(line) is not None)
+        and len(line.split()) <= MAX_HEADER_WORDS
+        and all(piece[0].isupper() for piece in _pieces(line))
+    )
+
+
+def _has_year(line: str) -> bool:
+    return any(m.group("year") for m in patterns.JOB_DATE.finditer(line))
+
+
+def job_entries(text: str) -> List[JobEntry]:
+    """Dated entries (jobs, military service) of a section, up to the next known heading."""
+    entries: List[JobEntry] = []
+    current: Optional[JobEntry] = None
+    in_header = False
+    before: List[str] = []  # short lines since the last description line
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line:
+            in_header = False
+            continue
+        if len(line) <= sections.MAX_HEADING_LENGTH:
+            kind = sections.heading_kind(line)
+            if kind is not None and kind != sections.EXPERIENCE:
+                break
+        bullet = patterns.JOB_BULLET.match(line) is not None
+        if in_header and current is not None and patterns.JOB_DATE.search(line):
+            current.header.append(line)
+        elif not bullet and _has_year(line):
+            above = before[-MAX_LINES_BEFORE_DATES:]
+            if current is not None and above:
+                # the lines above the dates open this entry, not end the previous one
+                del current.description[-len(above) :]
+                if current.next_line in above:
+                    current.next_line = None
+            current = JobEntry([line], above)
+            entries.append(current)
+            in_header = True
+            before = []
+        else:
+            if current is not None:
+                if in_header:
+                    current.next_line = line
+                current.description.append(line)
+            in_header = False
+            before = before + [line] if _is_short(line) else []
+    return entries
+
+
+def _end_of_month(year: int, month: Optional[int]) -> date:
+    month = month or 12
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def header_dates(header: str) -> Tuple[Optional[date], Optional[date], str]:
+    """(start, end, header without dates), end is None for a current job."""
+    found: List[Tuple[int, Optional[int]]] = []
+    current = False
+    for m in patterns.JOB_DATE.finditer(header):
+        if m.group("current"):
+            current = True
+            continue
+        month: Optional[int] = None
+        if m.group("month"):
+            month = patterns.MONTHS_FOLDED[patterns.ascii_fold(m.group("month"))][0]
+        elif m.group("month_number") and 1 <= int(m.group("month_number")) <= 12:
+            month = int(m.group("month_number"))
+        found.append((int(m.group("year")), month))
+    rest = patterns.JOB_DATE.sub("\n", header)
+    if not found:
+        return None, None, rest
+    start = date(found[0][0], found[0][1] or 1, 1)
+    end = None
+    if len(found) > 1 and not current:
+        end = _end_of_month(*found[1])
+    return start, end, rest
+
+
+def _pieces(text: str) -> List[str]:
+    pieces = []
+    for piece in patterns.JOB_HEADER_SEPARATOR.split(text):
+        piece = piece.strip(" \t-–—,;:|/")
+        if piece and piece.lower() not in ("od", "do"):
+            pieces.append(piece)
+    return pieces
+
+
+def _strip_places(piece: str, places: Collection[str]) -> str:
+    """ "Operator Gdańsk" -> "Operator", "POLSKA Horni sp. z o.o." -> "Horni sp. z o.o."."""
+    for place in places:
+        if piece.endswith(" " + place):
+            piece = piece[: -len(place)].rstrip(" ,")
+        if piece.startswith(place + " "):
+            piece = piece[len(place) :].lstrip(" ,")
+    return piece
+
+
+def parse_entry(
+    entry: JobEntry, orgs: Collection[str] = (), places: Collection[str] = ()
+) -> Optional[draft.WorkExperience]:
+    """
+    WorkExperience of one entry, `orgs` and `places` are the organisation
+    and place names the NER found in the section.
+    """
+    start, end, rest = header_dates("\n".join(entry.header))
+    if start is None:
+        return None
+    pieces = [p for p in _pieces(rest) if p not in places]
+
+    def is_company(piece: str) -> bool:
+        return patterns.COMPANY.search(piece) is not None or any(
+            org in piece for org in orgs
+        )
+
+    company = next((p for p in pieces if is_company(p)), None)
+    # title or company missing: the line after the dates, then the lines before
+    if company is None or len(pieces) < 2:
+        if entry.next_line is not None and _is_short(entry.next_line):
+            pieces += [p for p in _pieces(entry.next_line) if p not in places]
+            company = next((p for p in pieces if is_company(p)), None)
+    if company is None or len(pieces) < 2:
+        above = [p for line in entry.before for p in _pieces(line) if p not in places]
+        pieces = above + pieces
+        company = next((p for p in pieces if is_company(p)), None)
+
+    others = [p for p in pieces if p != company]
+    title = next((p for p in others if patterns.JOB_TITLE.match(p)), None)
+    if title is None and others:
+        title = others[0]
+    if company is None:
+        # "Kurier" and one more piece: the other one is the employer
+        rest_pieces = [p for p in others if p != title]
+        if title is not None and len(rest_pieces) == 1:
+            company = rest_pieces[0]
+
+    return draft.WorkExperience(
+        job_title=_strip_places(title, places) if title else UNKNOWN,
+        company=_strip_places(company, places) if company else UNKNOWN,
+        start_date=start,
+        end_date=end,
+    )
+
+
+def extract_jobs(
+    text: str, orgs: Collection[str] = (), places: Collection[str] = ()
+) -> List[draft.WorkExperience]:
+    jobs = []
+    for entry in job_entries(text):
+        job = parse_entry(entry, orgs, places)
+        if job is not None:
+            jobs.append(job)
+    return jobs
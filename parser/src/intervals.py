@@ -0,0 +1,159 @@
+"""
+Overlap resolution for (start, end, label, text) entities of a section.
+
+The education extractor used to resolve overlaps with nested loops over
+the whole entity list and list.remove, quadratic in the number of
+entities. These functions give the same results with a sweep line: the
+entities are visited by start offset, and an item ending before the
+current start is retired from the active set for good. A query then only
+looks at the items that can still overlap.
+"""
+
+import heapq
+from collections import defaultdict, deque
+from typing import Deque, Dict, Iterable, List, Tuple
+
+Entity = Tuple[int, int, str, str]
+
+# a month name and a date this many characters apart belong together
+MONTH_DATE_GAP = 3
+
+
+class IntervalSweep:
+    """
+    Entities in insertion order, queried by overlap with non-decreasing
+    start offsets.
+    """
+
+    def __init__(self) -> None:
+        self._items: Dict[int, Entity] = {}
+        self._active: List[Tuple[int, int]] = []  # heap of (end, seq)
+        self._seq = 0
+
+    def add(self, entity: Entity, searchable: bool = True) -> int:
+        seq = self._seq
+        self._seq += 1
+        self._items[seq] = entity
+        if searchable:
+            heapq.heappush(self._active, (entity[1], seq))
+        return seq
+
+    def remove(self, seq: int) -> None:
+        # left in the heap, skipped when retired or queried
+        del self._items[seq]
+
+    def overlapping(self, start: int, end: int) -> List[int]:
+        """Items overlapping [start, end), in insertion order."""
+        active = self._active
+        while active and (active[0][0] <= start or active[0][1] not in self._items):
+            heapq.heappop(active)
+        return sorted(
+            seq
+            for item_end, seq in active
+            if seq in self._items and self._items[seq][0] < end and item_end > start
+        )
+
+    def __getitem__(self, seq: int) -> Entity:
+        return self._items[seq]
+
+    def items(self) -> List[Entity]:
+        return list(self._items.values())
+
+
+def merge_month_names(
+    entities: List[Entity], months: Iterable[Tuple[int, int, str]], text: str
+) -> List[Entity]:
+    """
+    Merge every (start, end, month) into a year or nearby date entity, or add
+    it as a date of its own.
+
+    Keeps the rule of the original loop: the first entity in list order
+    that is a "year" (at any distance) or a "date" at most MONTH_DATE_GAP
+    characters away is taken.
+    """
+    entities = list(entities)
+    years: Deque[int] = deque(i for i, e in enumerate(entities) if e[2] == "year")
+    dates_by_start: Dict[int, List[int]] = defaultdict(list)
+    dates_by_end: Dict[int, List[int]] = defaultdict(list)
+
+    def index_date(i: int) -> None:
+        dates_by_start[entities[i][0]].append(i)
+        dates_by_end[entities[i][1]].append(i)
+
+    def unindex_date(i: int) -> None:
+        dates_by_start[entities[i][0]].remove(i)
+        dates_by_end[entities[i][1]].remove(i)
+
+    for i, entity in enumerate(entities):
+        if entity[2] == "date":
+            index_date(i)
+
+    for start, end, month_text in months:
+        # (index, month comes first)
+        candidates = []
+        if years:
+            candidates.append((years[0], True))
+        for pos in range(end - MONTH_DATE_GAP, end + MONTH_DATE_GAP + 1):
+            candidates.extend((i, True) for i in dates_by_start.get(pos, ()))
+        for pos in range(start - MONTH_DATE_GAP, start + MONTH_DATE_GAP + 1):
+            candidates.extend((i, False) for i in dates_by_end.get(pos, ()))
+
+        if not candidates:
+            entities.append((start, end, "date", month_text))
+            index_date(len(entities) - 1)
+            continue
+
+        # lowest index wins, a date near the month end before one near its start
+        i, month_first = min(candidates, key=lambda c: (c[0], not c[1]))
+        e_start, e_end, e_label, _ = entities[i]
+        if e_label == "year":
+            years.popleft()
+        else:
+            unindex_date(i)
+        new_start, new_end = (start, e_end) if month_first else (e_start, end)
+        entities[i] = (new_start, new_end, "date", text[new_start:new_end])
+        index_date(i)
+    return entities
+
+
+def cut_overlaps(
+    entities: List[Entity], cutting_labels: Tuple[str, ...]
+) -> List[Entity]:
+    """
+    Entities sorted by start. Each one labelled with `cutting_labels` cuts
+    the part it covers out of the earlier non-date entities it overlaps.
+    Returns the entities in the order the original loop left them.
+    """
+    sweep = IntervalSweep()
+    for start, end, label, text in entities:
+        if label in cutting_labels:
+            for seq in sweep.overlapping(start, end):
+                o_start, o_end, o_label, o_text = sweep[seq]
+                if start > o_start:
+                    piece = (o_start, start, o_label, o_text[: start - o_start].strip())
+                    sweep.add(piece, o_label != "date")
+                if end < o_end:
+                    piece = (end, o_end, o_label, o_text[end - o_start :].strip())
+                    sweep.add(piece, o_label != "date")
+                sweep.remove(seq)
+        sweep.add((start, end, label, text), label != "date")
+    return sweep.items()
+
+
+def keep_longest(entities: List[Entity]) -> List[Entity]:
+    """
+    Entities sorted by start. An entity overlapping a kept one replaces
+    the first such (in kept order) when it is longer, and is dropped
+    otherwise.
+    """
+    sweep = IntervalSweep()
+    for start, end, label, text in entities:
+        overlaps = sweep.overlapping(start, end)
+        if not overlaps:
+            sweep.add((start, end, label, text))
+            continue
+        o_start, o_end, _, _ = sweep[overlaps[0]]
+        if (end - start) > (o_end - o_start):
+            sweep.remove(overlaps[0])
+            sweep.add((start, end, label, text))
+    return sweep.items()
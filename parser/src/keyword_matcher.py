@@ -0,0 +1,108 @@
+import re
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Set, Tuple
+
+TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+class KeywordMatch(NamedTuple):
+    key: str
+    phrase: str
+    start: int
+    end: int
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _has_boundary(text: str, i: int) -> bool:
+    """Same as regex \\b at position i."""
+    before = i > 0 and _is_word(text[i - 1])
+    after = i < len(text) and _is_word(text[i])
+    return before != after
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over lowercased word tokens.
+
+    Finds every phrase of every key in one pass over the text, so the cost
+    depends on the text length and not on how many phrases are registered.
+    A phrase matches like the regex \\b(phrase)\\b with IGNORECASE would.
+    """
+
+    def __init__(self, phrases: Mapping[str, Iterable[str]]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # state -> [(phrase, number of tokens, keys)]
+        self._out: List[List[Tuple[str, int, Tuple[str, ...]]]] = [[]]
+
+        keys_by_phrase: Dict[str, List[str]] = {}
+        for key, key_phrases in phrases.items():
+            for phrase in key_phrases:
+                keys = keys_by_phrase.setdefault(phrase.lower(), [])
+                if key not in keys:
+                    keys.append(key)
+
+        for phrase, keys in keys_by_phrase.items():
+            self._add(phrase, tuple(keys))
+        self._build_fail_links()
+
+    @property
+    def keys(self) -> Set[str]:
+        return {key for out in self._out for _, _, keys in out for key in keys}
+
+    def _add(self, phrase: str, keys: Tuple[str, ...]) -> None:
+        tokens = TOKEN.findall(phrase)
+        state = 0
+        for token in tokens:
+            if token not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][token] = len(self._goto) - 1
+            state = self._goto[state][token]
+        self._out[state].append((phrase, len(tokens), keys))
+
+    def _build_fail_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(token, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Every (key, phrase) occurrence in text, in end-offset order."""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # a few characters change length when lowercased, keep offsets aligned
+            lowered = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+        goto, fail, out = self._goto, self._fail, self._out
+        spans: List[Tuple[int, int]] = []
+        matches: List[KeywordMatch] = []
+        state = 0
+        for m in TOKEN.finditer(lowered):
+            token = m.group()
+            spans.append(m.span())
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for phrase, n_tokens, keys in out[state]:
+                start = spans[-n_tokens][0]
+                end = m.end()
+                # tokens matched, now check the separators and edges like the regex would
+                if lowered[start:end] != phrase:
+                    continue
+                if not (_has_boundary(text, start) and _has_boundary(text, end)):
+                    continue
+                for key in keys:
+                    matches.append(KeywordMatch(key, phrase, start, end))
+        return matches
+
+    def matched_keys(self, text: str) -> Set[str]:
+        return {match.key for match in self.find_all(text)}
@@ -0,0 +1,146 @@
+"""
+Layout-aware text extraction through PyMuPDF's get_text("dict").
+
+One pass over the text lines of the document gives both the plain text
+(blocks separated by empty lines) and the typed sections. A line is a
+heading when it is a known heading (src/sections.py). A short line alone
+in its block, drawn in the same style as the known headings but outside
+the vocabulary, closes the current section as OTHER, so an unknown
+section does not run into the previous one.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from src import sections
+
+# span flag of bold text in get_text("dict")
+BOLD_FLAG = 16
+# longest line, in words, still treated as a heading
+MAX_HEADING_WORDS = 4
+# blocks further apart than this many line heights start a new paragraph
+PARAGRAPH_GAP = 0.5
+
+
+class Line(NamedTuple):
+    text: str
+    size: float
+    bold: bool
+    block: int
+    top: float
+    bottom: float
+
+    @property
+    def style(self) -> Tuple[int, bool]:
+        return round(self.size), self.bold
+
+
+@dataclass
+class Layout:
+    text: str
+    sections: Dict[str, str]
+
+
+def page_lines(page_dict: Dict[str, Any], first_block: int = 0) -> List[Line]:
+    lines = []
+    for n, block in enumerate(page_dict["blocks"], start=first_block):
+        if block["type"] != 0:  # images
+            continue
+        for line in block["lines"]:
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+            lines.append(
+                Line(
+                    text="".join(span["text"] for span in line["spans"]).strip(),
+                    size=max(span["size"] for span in spans),
+                    bold=all(span["flags"] & BOLD_FLAG for span in spans),
+                    block=n,
+                    top=line["bbox"][1],
+                    bottom=line["bbox"][3],
+                )
+            )
+    return lines
+
+
+def _looks_like_heading(text: str) -> bool:
+    words = text.rstrip(":").split()
+    return (
+        0 < len(words) <= MAX_HEADING_WORDS
+        and not any(ch.isdigit() for ch in text)
+        and not text.endswith((".", ","))
+    )
+
+
+def segment(lines: List[Line]) -> Dict[str, str]:
+    """Section kind -> its text, a repeated kind is appended to."""
+    kinds = [sections.heading_kind(line.text) for line in lines]
+
+    chars_by_style: Counter[Tuple[int, bool]] = Counter()
+    for line in lines:
+        chars_by_style[line.style] += len(line.text)
+    body_style = chars_by_style.most_common(1)[0][0] if lines else None
+    heading_styles = {
+        line.style
+        for line, kind in zip(lines, kinds)
+        if kind is not None and line.style != body_style
+    }
+
+    lines_per_block = Counter(line.block for line in lines)
+
+    texts: Dict[str, List[Line]] = {}
+    current = sections.HEADER
+    for line, kind in zip(lines, kinds):
+        if (
+            kind is None
+            and lines_per_block[line.block] == 1
+            and line.style in heading_styles
+            and _looks_like_heading(line.text)
+        ):
+            kind = sections.OTHER
+        if kind is not None:
+            current = kind
+            continue
+        texts.setdefault(current, []).append(line)
+    return {kind: layout_text(section) for kind, section in texts.items()}
+
+
+def _new_paragraph(previous: Line, line: Line) -> bool:
+    if line.block == previous.block:
+        return False
+    # some generators put every line in its own block, keep those together
+    gap = line.top - previous.bottom
+    return gap < 0 or gap > PARAGRAPH_GAP * (previous.bottom - previous.top)
+
+
+def layout_text(lines: List[Line]) -> str:
+    """Lines of text, paragraphs separated by an empty line."""
+    out: List[str] = []
+    previous: Optional[Line] = None
+    for line in lines:
+        if previous is not None and _new_paragraph(previous, line):
+            out.append("")
+        out.append(line.text)
+        previous = line
+    return "\n".join(out)
+
+
+def extract_layout(
+    data: bytes, filetype: str, max_pages: Optional[int] = None
+) -> Layout:
+    """Text and sections of a PDF/DOCX document."""
+    # MuPDF is loaded with the first document, not with the parser
+    import fitz
+
+    lines: List[Line] = []
+    first_block = 0
+    with fitz.open(stream=data, filetype=filetype) as doc:
+        n_pages = doc.page_count
+        if max_pages is not None:
+            n_pages = min(n_pages, max_pages)
+        for i in range(n_pages):
+            page_dict = doc[i].get_text("dict", sort=True)
+            lines.extend(page_lines(page_dict, first_block))
+            first_block += len(page_dict["blocks"])
+    return Layout(text=layout_text(lines), sections=segment(lines))
@@ -0,0 +1,76 @@
+"""
+ODT text straight from content.xml.
+
+MuPDF cannot open OpenDocument files, so ODT CVs are read here instead:
+content.xml is streamed through iterparse and paragraphs, headings, list
+items, table cells and text boxes come out one per line in document order.
+Nothing is rendered and no other part of the archive is read.
+"""
+
+import io
+import zipfile
+from typing import IO, List
+from xml.etree.ElementTree import Element, iterparse
+
+TEXT_NS = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+OFFICE_NS = "{urn:oasis:names:tc:opendocument:xmlns:office:1.0}"
+DRAW_NS = "{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}"
+
+CONTENT_PART = "content.xml"
+MIMETYPE = b"application/vnd.oasis.opendocument.text"
+
+_PARAGRAPHS = (TEXT_NS + "p", TEXT_NS + "h")
+_SPACE = TEXT_NS + "s"
+_TAB = TEXT_NS + "tab"
+_LINE_BREAK = TEXT_NS + "line-break"
+# text boxes are emitted as their own paragraphs, not inside the anchor
+_FRAME = DRAW_NS + "frame"
+# comments, footnotes and deleted revisions are not part of the CV text
+_SKIPPED = (
+    OFFICE_NS + "annotation",
+    TEXT_NS + "note",
+    TEXT_NS + "tracked-changes",
+)
+
+
+def is_odt(data: bytes) -> bool:
+    """ODF packages start with an uncompressed "mimetype" member."""
+    return data[30:38] == b"mimetype" and data[38:].startswith(MIMETYPE)
+
+
+def _inline_text(el: Element, out: List[str]) -> None:
+    if el.text:
+        out.append(el.text)
+    for child in el:
+        tag = child.tag
+        if tag == _SPACE:
+            out.append(" " * int(child.get(TEXT_NS + "c", "1")))
+        elif tag == _TAB:
+            out.append("\t")
+        elif tag == _LINE_BREAK:
+            out.append("\n")
+        elif tag != _FRAME and tag not in _SKIPPED:
+            _inline_text(child, out)
+        if child.tail:
+            out.append(child.tail)
+
+
+def _content_text(stream: IO[bytes], out: List[str]) -> None:
+    skipped_depth = 0
+    for event, el in iterparse(stream, ("start", "end")):
+        if el.tag in _SKIPPED:
+            skipped_depth += 1 if event == "start" else -1
+            continue
+        if event == "end" and el.tag in _PARAGRAPHS and not skipped_depth:
+            _inline_text(el, out)
+            out.append("\n")
+            # a nested paragraph (text box) is never walked again by its parent
+            el.clear()
+
+
+def read_odt_text(data: bytes) -> str:
+    out: List[str] = []
+    with zipfile.ZipFile(io.BytesIO(data), "r") as odt:
+        with odt.open(CONTENT_PART) as stream:
+            _content_text(stream, out)
+    return "".join(out)
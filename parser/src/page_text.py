@@ -0,0 +1,78 @@
+"""
+Page text of PDF/DOCX documents through MuPDF.
+
+The layout sort of get_text(sort=True) dominates on long documents, so
+pages can be split into contiguous ranges handled by worker processes,
+each opening its own copy of the document. `max_pages` stops after the
+first pages, appendices and portfolios past the CV proper are never read.
+"""
+
+import multiprocessing
+from multiprocessing.pool import Pool
+from typing import List, Optional, Tuple
+
+# below this many pages the pool round-trip costs more than it saves
+PARALLEL_MIN_PAGES = 8
+
+
+def _range_text(args: Tuple[bytes, str, int, int]) -> List[str]:
+    import fitz
+
+    data, filetype, start, stop = args
+    with fitz.open(stream=data, filetype=filetype) as doc:
+        return [doc[i].get_text(sort=True) for i in range(start, stop)]
+
+
+def _split(n_pages: int, parts: int) -> List[Tuple[int, int]]:
+    size, extra = divmod(n_pages, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+class PageExtractor:
+    """
+    Extracts page texts in order, serially or across `workers` processes.
+    The pool is created on the first document long enough to need it.
+    """
+
+    def __init__(self, workers: int = 1, max_pages: Optional[int] = None) -> None:
+        if max_pages is not None and max_pages < 1:
+            raise ValueError(f"max_pages must be positive, got {max_pages}")
+        self.workers = max(1, workers)
+        self.max_pages = max_pages
+        self._pool: Optional[Pool] = None
+
+    def pages(self, data: bytes, filetype: str) -> List[str]:
+        # MuPDF is loaded with the first document, not with the parser
+        import fitz
+
+        with fitz.open(stream=data, filetype=filetype) as doc:
+            n_pages = doc.page_count
+            if self.max_pages is not None:
+                n_pages = min(n_pages, self.max_pages)
+            # DOCX is laid out again in every process, only PDF pays off
+            if self.workers == 1 or filetype != "pdf" or n_pages < PARALLEL_MIN_PAGES:
+                return [doc[i].get_text(sort=True) for i in range(n_pages)]
+
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers)
+        chunks = self._pool.map(
+            _range_text,
+            [
+                (data, filetype, start, stop)
+                for start, stop in _split(n_pages, self.workers)
+            ],
+        )
+        return [text for chunk in chunks for text in chunk]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
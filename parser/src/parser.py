@@ -1,192 +1,219 @@
-import spacy
 from datetime import date
-from typing import Optional, Any, List, Tuple
-import re
-import unicodedata
-from src import schema
-import fitz
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union,
+)
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from src import schema, patterns, text_filters
+from src.cache import DEFAULT_MAX_BYTES, ResultCache
+from src.catalogue import DEFAULT_CATALOGUE_PATH, load_catalogue
+from src.context import ParseContext, FULL_VIEW, EDUCATION_VIEW, EXPERIENCE_VIEW
+from src.docx_reader import clean_docx, read_docx_text
+from src.odt_reader import is_odt, read_odt_text
+from src.page_text import PageExtractor
+from src.profiling import CACHE_HIT, CACHE_MISS, ParseTimings
+from src.layout import extract_layout
+from src import draft, experience, intervals, section_lists, sections
+from contextlib import contextmanager
+import importlib.metadata
+import itertools
+import logging
 import os
-from pyparsing import Word, OneOrMore, SkipTo, Combine, pyparsing_unicode as ppu
 import calendar
+import threading
+
+# spaCy is imported by load_nlp, the mock and the schema never need it
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+
+logger = logging.getLogger(__name__)
+# the extracted text of every parsed file, at DEBUG (see parse_file(enable_log=True))
+raw_text_log = logging.getLogger(__name__ + ".raw_text")
+
+# bump whenever extractor output changes, cached results of older versions are ignored
+PARSER_VERSION = "3"
+
+# a CV can be given as a path, raw bytes or a binary file object
+Source = Union[str, "os.PathLike[str]", bytes, BinaryIO]
+
+# profile -> (model, load only what NER needs)
+NLP_PROFILES = {
+    "full": ("pl_core_news_lg", False),
+    "ner": ("pl_core_news_lg", True),
+    "ner-sm": ("pl_core_news_sm", True),
+}
+DEFAULT_NLP_PROFILE = "ner"
+
+# the email validation of the schema, applied to each extracted address
+_EMAIL = TypeAdapter(EmailStr)
+
+# "mupdf" renders the DOCX layout, "xml" reads document.xml directly (faster,
+# one line per paragraph instead of per rendered line)
+DOCX_READERS = ("mupdf", "xml")
+DEFAULT_DOCX_READER = "mupdf"
+
+# extractors only read doc.ents, none of these feed the NER component
+NER_UNUSED_COMPONENTS = [
+    "tagger",
+    "morphologizer",
+    "parser",
+    "senter",
+    "attribute_ruler",
+    "lemmatizer",
+    "trainable_lemmatizer",
+]
+
+
+def load_nlp(profile: str = DEFAULT_NLP_PROFILE) -> "Language":
+    if profile not in NLP_PROFILES:
+        raise ValueError(
+            f"Unknown NLP profile {profile!r}, expected one of {list(NLP_PROFILES)}"
+        )
+    import spacy
+    from spacy.pipeline import Tok2Vec
+
+    model, ner_only = NLP_PROFILES[profile]
+    if not ner_only:
+        return spacy.load(model)
+
+    nlp = spacy.load(model, exclude=NER_UNUSED_COMPONENTS)
+    # shared tok2vec is only kept if NER listens to it
+    tok2vec = nlp.get_pipe("tok2vec") if "tok2vec" in nlp.pipe_names else None
+    if isinstance(tok2vec, Tok2Vec) and not tok2vec.listening_components:
+        nlp.remove_pipe("tok2vec")
+    return nlp
+
+
+def model_version(profile: str) -> str:
+    """Package and version of the profile's model, read without loading it."""
+    model, _ = NLP_PROFILES[profile]
+    try:
+        return f"{model}-{importlib.metadata.version(model)}"
+    except importlib.metadata.PackageNotFoundError:
+        return f"{model}-unknown"
+
+
+@contextmanager
+def _raw_text_file(path: str) -> Iterator[None]:
+    """Send raw_text_log records to `path`, and only there, within the block."""
+    handler = logging.FileHandler(path, mode="w", encoding="utf-8")
+    handler.terminator = ""
+    level, propagate = raw_text_log.level, raw_text_log.propagate
+    raw_text_log.addHandler(handler)
+    raw_text_log.setLevel(logging.DEBUG)
+    raw_text_log.propagate = False
+    try:
+        yield
+    finally:
+        raw_text_log.removeHandler(handler)
+        raw_text_log.setLevel(level)
+        raw_text_log.propagate = propagate
+        handler.close()
 
 
 class Parser:
-    def __init__(self) -> None:
-        self.nlp = spacy.load("pl_core_news_lg")
-        self.base_alphas = ppu.Latin1.alphas + ppu.LatinA.alphas + ppu.LatinB.alphas
-        self.name_alphas = self.base_alphas + "-"
-        self.alphanum_alphas = (
-            self.base_alphas + ppu.Latin1.nums + ppu.LatinA.nums + ppu.LatinB.nums
-        )
-
-    def _preprocess_docx(self, loc: str) -> str:
+    def __init__(
+        self,
+        nlp_profile: str = DEFAULT_NLP_PROFILE,
+        catalogue_path: str = DEFAULT_CATALOGUE_PATH,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        docx_reader: str = DEFAULT_DOCX_READER,
+        page_workers: int = 1,
+        max_pages: Optional[int] = None,
+        layout: bool = False,
+    ) -> None:
+        if docx_reader not in DOCX_READERS:
+            raise ValueError(
+                f"Unknown DOCX reader {docx_reader!r}, expected one of {list(DOCX_READERS)}"
+            )
+        if nlp_profile not in NLP_PROFILES:
+            raise ValueError(
+                f"Unknown NLP profile {nlp_profile!r}, expected one of {list(NLP_PROFILES)}"
+            )
+        self.docx_reader = docx_reader
+        self.page_extractor = PageExtractor(page_workers, max_pages)
+        # segment PDF/DOCX into sections by the page layout
+        self.layout = layout
+        self.nlp_profile = nlp_profile
+        # part of the cache key, a cache hit never loads the model
+        self.model_version = model_version(nlp_profile)
+        # loaded on first use, processes that only extract text never load it
+        self._nlp: Optional["Language"] = None
+        self._nlp_lock = threading.Lock()
+        self.catalogue = load_catalogue(catalogue_path)
+        self.cache = ResultCache(cache_dir, cache_max_bytes) if cache_dir else None
+
+    @property
+    def nlp(self) -> "Language":
+        return self.load()
+
+    def load(self) -> "Language":
         """
-        Remove mc:Fallback elements from document.xml inside a DOCX file
+        The spaCy pipeline, loaded by the first call. Long-lived processes
+        call it up front so the first CV does not pay for the load.
         """
-        import zipfile
-
-        with zipfile.ZipFile(loc, "r") as docx:
-            xml_content = docx.read("word/document.xml").decode("utf-8")
-            # Remove mc:Fallback elements
-            cleaned_xml = re.sub(
-                r"<mc:Fallback>.*?</mc:Fallback>", "", xml_content, flags=re.DOTALL
-            )
-            # Write back the cleaned XML to a new DOCX file
-            temp_loc = loc + "_cleaned.docx"
-            with zipfile.ZipFile(temp_loc, "w") as cleaned_docx:
-                for item in docx.infolist():
-                    if item.filename == "word/document.xml":
-                        cleaned_docx.writestr(item, cleaned_xml)
-                    else:
-                        cleaned_docx.writestr(item, docx.read(item.filename))
-        return temp_loc
+        if self._nlp is None:
+            with self._nlp_lock:
+                if self._nlp is None:
+                    self._nlp = load_nlp(self.nlp_profile)
+        return self._nlp
 
     def _normalize_whitespace(self, text: str) -> str:
         """
         Strip leading and trailing whitespace from the text,
         and replace sequences of spaces or tabs with a single space.
         """
-        text = re.sub(r"[ \t]+", " ", text)
+        text = patterns.WHITESPACE_RUN.sub(" ", text)
         text = "\n".join(line.strip() for line in text.splitlines())
         return text.strip()
 
-    def _remove_unwanted_unicode(self, text: str) -> str:
+    def _normalize_columns(self, text: str) -> str:
         """
-        Keep only ASCII, common Latin letters with diacritics,
-        and punctuation/symbols useful in text.
-        Removes control characters and emoji-like symbols.
+        Same as _normalize_whitespace, but a gap between columns becomes a
+        tab, e.g. a list of certificates laid out in three columns.
         """
-        cleaned = []
-        for ch in text:
-            # Remove control characters
-            if ord(ch) < 32 and ch not in ("\n", "\t"):
-                continue
-            # Allow ASCII
-            if ord(ch) < 128:
-                cleaned.append(ch)
-                continue
-            # Allow Latin letters with accents (e.g., Polish, Czech, etc.)
-            cat = unicodedata.name(ch, "")
-            if "LATIN" in cat or "WITH" in cat:
-                cleaned.append(ch)
-                continue
-            # Allow common punctuation/symbols like bullets, dashes, ©, etc.
-            if ch in "•–—…«»©®°":
-                cleaned.append(ch)
-                continue
-        return "".join(cleaned)
+        text = patterns.COLUMN_GAP.sub("\t", text)
+        text = "\n".join(line.strip() for line in text.splitlines())
+        return text.strip()
+
+    def _remove_unwanted_unicode(self, text: str) -> str:
+        return text_filters.remove_unwanted_unicode(text)
 
     def _remove_unwanted_chars_in_fullname(self, text: str) -> str:
-        """
-        Keep only ASCII letters, common Latin letters and spaces
-        """
-        cleaned = []
-        for ch in text:
-            # Allow ASCII letters
-            if 65 <= ord(ch) <= 90 or 97 <= ord(ch) <= 122:
-                cleaned.append(ch)
-                continue
-            # Allow some ASCII symbols
-            if ch == " " or ch == "-":
-                cleaned.append(ch)
-                continue
-            if ch == "\n" or ch == "\t":
-                cleaned.append(" ")
-                continue
-            # Allow Latin letters with accents (e.g., Polish, Czech, etc.)
-            cat = unicodedata.name(ch, "")
-            if "LATIN" in cat or "WITH" in cat:
-                cleaned.append(ch)
-                continue
-        return "".join(cleaned).strip()
+        return text_filters.remove_unwanted_chars_in_fullname(text)
 
     def _text_contains_a_year(self, text: str) -> bool:
         """Return True if text contains a number between 1900 and 2100."""
-        return re.search(r"\b(19\d\d|20\d\d|2100)\b", text) is not None
+        return patterns.YEAR_WORD.search(text) is not None
 
     def _return_years_in_text(self, text: str) -> List[int]:
         """Return list of years (numbers between 1900 and 2100) found in text."""
-        years = re.findall(r"(19\d\d|20\d\d|2100)", text)
+        years = patterns.YEAR.findall(text)
         return [int(year) for year in years]
 
     def _parse_month_years_in_text(self, text: str) -> List[Tuple[int, Optional[int]]]:
-        months_map = {
-            # Polish full forms and common abbreviations/stems
-            "styczeń": 1,
-            "stycznia": 1,
-            "sty": 1,
-            "styc": 1,
-            "luty": 2,
-            "lutego": 2,
-            "lut": 2,
-            "marzec": 3,
-            "marca": 3,
-            "mar": 3,
-            "kwiecień": 4,
-            "kwietnia": 4,
-            "kwi": 4,
-            "maj": 5,
-            "czerwiec": 6,
-            "czerwca": 6,
-            "cze": 6,
-            "czerw": 6,
-            "lipiec": 7,
-            "lipca": 7,
-            "lip": 7,
-            "sierpień": 8,
-            "sierpnia": 8,
-            "sie": 8,
-            "sierp": 8,
-            "wrzesień": 9,
-            "września": 9,
-            "wrz": 9,
-            "wrzes": 9,
-            "październik": 10,
-            "października": 10,
-            "paź": 10,
-            "paz": 10,
-            "listopad": 11,
-            "listopada": 11,
-            "lis": 11,
-            "grudzień": 12,
-            "grudnia": 12,
-            "gru": 12,
-            # English months to be tolerant
-            "january": 1,
-            "february": 2,
-            "march": 3,
-            "april": 4,
-            "may": 5,
-            "june": 6,
-            "july": 7,
-            "august": 8,
-            "september": 9,
-            "october": 10,
-            "november": 11,
-            "december": 12,
-        }
+        named: List[Tuple[int, int, int]] = []
 
-        results: List[Tuple[int, Optional[int]]] = []
-
-        def norm(s: str) -> str:
-            return (
-                unicodedata.normalize("NFKD", s)
-                .encode("ascii", "ignore")
-                .decode("ascii")
-                .lower()
-            )
-
-        norm_text = norm(text)
-
-        # month-name + year
-        for m_name, m_num in months_map.items():
-            pat = rf"\b{re.escape(norm(m_name))}\b\s*(19\d\d|20\d\d|2100)"
-            for m in re.finditer(pat, norm_text, flags=re.IGNORECASE):
-                yr = int(m.group(1))
-                results.append((yr, m_num))
+        # month-name + year, all names in one pass over the folded text
+        for m in patterns.MONTH_NAME_YEAR.finditer(patterns.ascii_fold(text)):
+            m_num, rank = patterns.MONTHS_FOLDED[m.group(1).lower()]
+            named.append((rank, int(m.group(2)), m_num))
+        # month names keep their MONTHS_MAP precedence, like the per-name loop did
+        named.sort(key=lambda x: x[0])
+        results: List[Tuple[int, Optional[int]]] = [(yr, mon) for _, yr, mon in named]
 
         # numeric month/year
-        for m in re.finditer(r"(\d{1,2})[\./-](19\d\d|20\d\d|2100)", text):
+        for m in patterns.NUMERIC_MONTH_YEAR.finditer(text):
             mon = int(m.group(1))
             yr = int(m.group(2))
             if 1 <= mon <= 12:
@@ -200,94 +227,7 @@ class Parser:
 
     def _text_contains_edu_institution(self, text: str) -> bool:
         """Return True if text contains common education institution keywords."""
-        keywords = [
-            "żłobek",
-            "szkoła",
-            "gimnazjum",
-            "liceum",
-            "technikum",
-            "politechnika",
-            "uniwersytet",
-            "akademia",
-            "kolegium",
-        ]
-        pattern = re.compile(r"(" + "|".join(keywords) + r")", re.IGNORECASE)
-        return pattern.search(text) is not None
-
-    def _experience_str_extraction(self, text: str) -> str:
-        # find line starting with experience keywords and return anything before Edukacja, Umiejętności etc.
-        keywords_pattern = re.compile(
-            r"(?:\n(Moje )?)\b(do(ś|s)wia(t|d)czenie):?\b", re.IGNORECASE
-        )
-        for match in keywords_pattern.finditer(text):
-            start_idx = match.end()
-            text_after = text[start_idx:]
-            # cut off at next section heading if any
-            section_headings = [
-                "edukacja",
-                "education",
-                "nauczanie",
-                "wykształcenie",
-                "kluczowe umiejętności",
-                "umiejętności",
-                "umiejetnosci",
-                "certyfikat",
-                "certyfikaty",
-                "języki",
-                "jezyki",
-                "doświadczenie wojskowe",
-                "doswiadczenie wojskowe",
-            ]
-            section_pattern = re.compile(
-                r"(?mi)^(?:"
-                + "|".join(section_headings)
-                + r")[:\-\s \wąćęłńóśźżĄĆĘŁŃÓŚŹŻ]*$",
-                re.IGNORECASE,
-            )
-            sec_match = section_pattern.search(text_after)
-            if sec_match:
-                end_idx = sec_match.start()
-                return text_after[:end_idx].strip()
-            else:
-                return text_after.strip()
-        # fallback: return entire text if no heading found
-        return text
-
-    def _education_str_extraction(self, text: str) -> str:
-        keywords_pattern = re.compile(
-            r"(?:\n(Moj(?:e|a) )?)\b(edukacja|nauczanie|education|wykształcenie):?\b",
-            re.IGNORECASE,
-        )
-        for match in keywords_pattern.finditer(text):
-            start_idx = match.end()
-            text_after = text[start_idx:]
-            # cut off at next section heading if any
-            section_headings = [
-                "wykształcenie",
-                "kluczowe umiejętności",
-                "umiejętności",
-                "umiejetnosci",
-                "certyfikat",
-                "certyfikaty",
-                "języki",
-                "jezyki",
-                "doświadczenie",
-                "doswiadczenie",
-            ]
-            section_pattern = re.compile(
-                r"(?mi)^(?:"
-                + "|".join(section_headings)
-                + r")[:\-\s \wąćęłńóśźżĄĆĘŁŃÓŚŹŻ]*$",
-                re.IGNORECASE,
-            )
-            sec_match = section_pattern.search(text_after)
-            if sec_match:
-                end_idx = sec_match.start()
-                return text_after[:end_idx].strip()
-            else:
-                return text_after.strip()
-        # fallback: return entire text if no heading found
-        return text
+        return patterns.EDU_INSTITUTION_KEYWORD.search(text) is not None
 
     def _calculate_years_from_txt(self, text: str) -> int:
         years = sorted(self._return_years_in_text(text))
@@ -299,114 +239,43 @@ class Parser:
             return 0
 
         # try to find if currently working
-        now_keywords = ["teraz", "obecnie", "aktualnie", "dziś", "dzis"]
-        now_pattern = re.compile(r"(" + "|".join(now_keywords) + r")", re.IGNORECASE)
-        if now_pattern.search(text):
+        if patterns.CURRENTLY.search(text):
             last_year = date.today().year
         total_years = last_year - first_year + 1
 
         return total_years
 
-    def _calculate_dead_lift_from_txt(self, text: str) -> bool:
+    def _calculate_dead_lift_from_txt(self, text: str) -> int:
         # find martwy ciąg and numbers
-        dead_lift_pattern = re.compile(
-            r"(\d+)(?: ?kg (?:w )?martwym? ci(?:ą|a)gu?)", re.IGNORECASE
-        )
-        match = dead_lift_pattern.search(text)
+        match = patterns.DEAD_LIFT.search(text)
         if match:
-            weight = int(match.group(1))
-            return weight >= 150
-        return False
+            return int(match.group(1))
+        return 0
 
     def create_mock(self) -> schema.CVParserSchema:
-
-        contact = schema.Contact(
-            email="undefined@undefined.com",
-            phone="+48 123458021",
-            address="UNDEFINED",
-        )
-
-        personal_info = schema.PersonalInfo(
-            full_name="UNDEFINED",
-            date_of_birth=date(1901, 1, 1),
-            nationality="UNDEFINED",
-            contact=contact,
-        )
-
-        wajcha_required = schema.WajchaRequired(
-            has_higher_education=False,
-            ten_years_experience=False,
-            no_asking=False,
-            color_knowledge=False,
-        )
-
-        wajcha_optional = schema.WajchaOptional(
-            high_soft_skills=False,
-            dead_lift_150kg=False,
-            forklift=False,
-            coffee_making=False,
-        )
-
-        wajcha_keywords = schema.WajchaKeywords(
-            required=wajcha_required,
-            optional=wajcha_optional,
-        )
-
-        zmechol_required = schema.ZmecholRequired(
-            north_south_east_west=False,
-            fast_run=False,
-            push_ups=False,
-            kindergarten_graduate=False,
-        )
-
-        zmechol_optional = schema.ZmecholOptional(
-            driving_licence=False,
-            reading=False,
-            unpunishability=False,
-            grade_school_graduate=False,
-            multiplication_table_knowledge=False,
-        )
-
-        zmechol_keywords = schema.ZmecholKeywords(
-            required=zmechol_required,
-            optional=zmechol_optional,
-        )
-
-        keywords = schema.Keywords(
-            wajcha_keywords=wajcha_keywords,
-            zmechol_keywords=zmechol_keywords,
-        )
-
-        return schema.CVParserSchema(
-            personal_info=personal_info,
-            overview="",
-            education=[],
-            work_experience=[],
-            skills=[],
-            certifications=[],
-            languages=[],
-            military_experience=[],
-            keywords=keywords,
-        )
-
-    def _extract_email(self, text: str) -> Optional[str]:
-        email_pattern = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-
-        emails = email_pattern.findall(text)
-        occurences = list(set(emails))
-        print(f"Found emails: {emails}")
-        if len(occurences) > 0:
-            return str(occurences[0])
+        """A CV with placeholders in every field and no keyword matched."""
+        return draft.construct(draft.CV(keywords=self.catalogue.empty_keywords()))
+
+    def _extract_email(self, ctx: ParseContext) -> Optional[str]:
+        text = ctx.text
+        emails = patterns.EMAIL.findall(text)
+        logger.debug("Found emails: %s", emails)
+        # the first address in the text that the schema accepts, the pattern
+        # also matches e.g. jan..kowalski@wp.pl or jan@firma.local
+        for email in dict.fromkeys(emails):
+            try:
+                _EMAIL.validate_python(email)
+            except ValidationError:
+                continue
+            return str(email)
 
         return None
 
-    def _extract_phone(self, text: str) -> Optional[str]:
-        phone_pattern = re.compile(
-            r"(?:(?:\+\d{1,3}\s*)?(?:\(?\d{2,4}\)?[\s.-]*)?\d{3}[\s.-]*\d{3,4}[\s.-]*\d{3,4})"
-        )
-        phones = phone_pattern.findall(text)
+    def _extract_phone(self, ctx: ParseContext) -> Optional[str]:
+        text = ctx.text
+        phones = patterns.PHONE.findall(text)
         occurences = list(set(phones))
-        print(f"Found phones: {phones}")
+        logger.debug("Found phones: %s", phones)
         if len(occurences) > 0:
             return str(occurences[0])
 
@@ -423,8 +292,9 @@ class Parser:
             result.append(word.capitalize())
         return " ".join(result)
 
-    def _extract_name(self, text: str) -> Optional[str]:
-        parsed_entities = self.nlp(text)
+    def _extract_name(self, ctx: ParseContext) -> Optional[str]:
+        text = ctx.text
+        parsed_entities = ctx.docs[FULL_VIEW]
         names = []
 
         for ent in parsed_entities.ents:
@@ -434,28 +304,27 @@ class Parser:
                 names.append(capitilized)
 
         if len(names) > 0:
-            print(f"Found names: {names}")
+            logger.debug("Found names: %s", names)
             return str(names[0])
 
         # If fails find the first two valid words
-        name_word = Word(self.name_alphas)
-        tokens = [t[0] for t in name_word.searchString(text)]
-        first_2_words = tokens[:2]
+        first_2_words = [
+            m.group() for m in itertools.islice(patterns.NAME_WORD.finditer(text), 2)
+        ]
         capitilized = self._capitilize_fullname(" ".join(first_2_words))
         names.append(capitilized)
 
-        print(f"Found names: {names}")
+        logger.debug("Found names: %s", names)
         if len(names) > 0:
             return str(names[0])
         return None
 
-    def _extract_overview(self, text: str) -> Optional[str]:
-        section_body = SkipTo("\n\n", include=False)
-        section_parser = Combine(section_body + "\n\n")
-
-        results = [res[0].strip() for res, _, _ in section_parser.scanString(text)]
-
-        base_word = Word(self.base_alphas)
+    def _extract_overview(self, ctx: ParseContext) -> Optional[str]:
+        text = ctx.text
+        if sections.OVERVIEW in ctx.sections:
+            # paragraphs end with an empty line, the section's last one too
+            text = ctx.sections[sections.OVERVIEW] + "\n\n"
+        results = [m.group(1).strip() for m in patterns.PARAGRAPH.finditer(text)]
 
         MIN_SENTECE_AMMOUNT = 2
         MIN_WORDS_IN_SENTENCE = 4
@@ -469,10 +338,10 @@ class Parser:
                 continue
 
             valid_sentence_count = 0
-            sentences = re.split(r"[.!?]", section)
+            sentences = patterns.SENTENCE_END.split(section)
 
             for sentence in sentences:
-                tokens = [t[0] for t in base_word.searchString(sentence)]
+                tokens = patterns.BASE_WORD.findall(sentence)
                 filtered = [t for t in tokens if len(t) >= MIN_WORD_LENGTH]
 
                 if len(filtered) < MIN_WORDS_IN_SENTENCE:
@@ -488,27 +357,23 @@ class Parser:
                 continue
 
             # Output only words without special chars
-            filtered_section = [t[0] for t in base_word.searchString(section)]
+            filtered_section = patterns.BASE_WORD.findall(section)
             valid_sections.append(" ".join(filtered_section))
 
         if len(valid_sections) > 0:
-            print(f"Found about sections:")
-
-            for section in valid_sections:
-                print(section)
-
+            logger.debug("Found about sections: %s", valid_sections)
             return valid_sections[0]
 
         return None
 
-    def _extract_education(self, text: str) -> Optional[List[schema.Education]]:
-        edu_text = self._education_str_extraction(text)
+    def _extract_education(self, ctx: ParseContext) -> Optional[List[draft.Education]]:
+        edu_text = ctx.sections[sections.EDUCATION]
         if not edu_text:
             return None
-        print(f"Extracted education section text:\n{edu_text}")
+        logger.debug("Extracted education section text:\n%s", edu_text)
 
-        # use NLP
-        doc = self.nlp(" ".join([x.strip() for x in edu_text.split("\n")]))
+        # NLP over the education view, computed together with the other views
+        doc = ctx.docs[EDUCATION_VIEW]
 
         # start positions of every found entity
         entity_positions = [
@@ -516,68 +381,38 @@ class Parser:
         ]
 
         # find degrees in text and add to entity positions
-        degree_pattern = re.compile(
-            r"\b(magister|licencjat|in[żz]ynier|mgr|lic\.|bachelor|master)\b",
-            re.IGNORECASE,
-        )
-        degrees_found = degree_pattern.findall(edu_text)
-        for match in degree_pattern.finditer(edu_text):
+        for match in patterns.DEGREE.finditer(edu_text):
             start, end = match.span()
             degree = match.group(1).capitalize()
             entity_positions.append((start, end, "degree", degree))
 
         # find years or "current"-type text in text and add to entity positions
-        year_pattern = re.compile(
-            r"\b(19\d\d|20\d\d|2100|obecnie|aktualnie|do dziś|do dzisiaj|do teraz|present|current)\b",
-            re.IGNORECASE,
-        )
-        for match in year_pattern.finditer(edu_text):
+        for match in patterns.YEAR_OR_CURRENT.finditer(edu_text):
             start, end = match.span()
             year_text = match.group(1)
             entity_positions.append((start, end, "year", year_text))
-        entity_positions.sort(key=lambda x: x[0])  # sort by start position
 
         # find non-standard institution names and add to entity positions
-        institution_pattern = re.compile(
-            r"(([a-zA-ZąęółśżźćńĄĘÓŁŚŻŹĆŃ]+)(szko\w*|szkoła|gimnazjum|liceum|technikum|politechnika|uniwersytet|akademia|kolegium)( w [a-zA-ZąęółśżźćńĄĘÓŁŚŻŹĆŃ]+)?)[^\n,\.;]*",
-            re.IGNORECASE,
-        )
-        for match in institution_pattern.finditer(edu_text):
+        for match in patterns.INSTITUTION.finditer(edu_text):
             start, end = match.span()
             institution = match.group(0).strip()
             entity_positions.append((start, end, "orgName", institution))
         entity_positions.sort(key=lambda x: x[0])  # sort by start position
 
-        # find month names before years and add to entity positions
-        month_names_pattern = r"\b(styczen|stycznia|styc|sty|luty|lutego|lut|marzec|marca|mar|kwiecien|kwietnia|kwi|kwiecie[nń]|maj|czerwiec|czerwca|cze|czerw|lipiec|lipca|lip|sierpien|sierpnia|sierp|sie|wrzesie[nń]|wrzesnia|wrz|wrzes|pa[zź]dziernik|pa[zź]dziernika|pa[zź]|paz|listopad|listopada|lis|grudzie[nń]|grudnia|gru)\b"
-        for match in re.finditer(month_names_pattern, edu_text, re.IGNORECASE):
-            start, end = match.span()
-            month_text = match.group(0)
-            # merge with adjacent year existing in entity_positions if any
-            merged = False
-            for i, (e_start, e_end, e_label, e_text) in enumerate(entity_positions):
-                if e_label == "year" or e_label == "date" and abs(e_start - end) <= 3:
-                    new_start = start
-                    new_end = e_end
-                    new_text = edu_text[new_start:new_end]
-                    entity_positions[i] = (new_start, new_end, "date", new_text)
-                    merged = True
-                    break
-                elif e_label == "year" or e_label == "date" and abs(start - e_end) <= 3:
-                    new_start = e_start
-                    new_end = end
-                    new_text = edu_text[new_start:new_end]
-                    entity_positions[i] = (new_start, new_end, "date", new_text)
-                    merged = True
-                    break
-            if not merged:
-                entity_positions.append((start, end, "date", month_text))
+        # find month names before years, merge them with a year or adjacent date
+        months = [
+            (match.start(), match.end(), match.group(0))
+            for match in patterns.EDU_MONTH_NAME.finditer(edu_text)
+        ]
+        entity_positions = intervals.merge_month_names(
+            entity_positions, months, edu_text
+        )
 
         # remove trailing years from orgName entities
         adjusted_entities = []
         for start, end, label, text in entity_positions:
             if label == "orgName":
-                year_match = year_pattern.search(text)
+                year_match = patterns.YEAR_OR_CURRENT.search(text)
                 if year_match:
                     year_start = start + year_match.start()
                     adjusted_entities.append(
@@ -626,75 +461,40 @@ class Parser:
         entity_positions = final_entities
 
         # in edu_text if has "kierunek" or "zawód" count as field_of_study and add to entity positions
-        field_of_study_pattern = re.compile(
-            r"(kierunek|zawód|zawod)(?::)?\s+([A-Za-zĄĆĘŁŃÓŚŹŻąćęłńóśźż \-:]+)",
-            re.IGNORECASE,
-        )
-        for match in field_of_study_pattern.finditer(edu_text):
+        for match in patterns.FIELD_OF_STUDY.finditer(edu_text):
             start, end = match.span()
             field_of_study = match.group(0).strip()
             entity_positions.append((start, end, "field_of_study", field_of_study))
 
         # in edu_text if between degree and institution name is anything, count as field_of_study and add to entity positions
-        degree_institution_pattern = re.compile(
-            r"(?P<degree>\b(magister|licencjat|in[żz]ynier|mgr|lic\.|bachelor|master)\b(?:,( )?)?)(?P<between>.*?)(?:,|\.|\n|;|$| )+(?P<institution>(?:szko\w*|szkoła|gimnazjum|liceum|technikum|politechnika|uniwersytet|akademia|kolegium)[^\n,\.;]*)",
-            re.IGNORECASE | re.DOTALL,
-        )
-        for match in degree_institution_pattern.finditer(edu_text):
+        for match in patterns.DEGREE_INSTITUTION.finditer(edu_text):
             between_text = match.group("between").strip()
             if between_text:
                 start = match.start("between")
                 end = match.end("between")
                 field_of_study = between_text
                 entity_positions.append((start, end, "field_of_study", field_of_study))
-        entity_positions.sort(key=lambda x: x[0])  # sort by start position
 
         # field_of_study also after a colon after school name
-        institution_field_pattern = re.compile(
-            r"(?P<institution>(?:szko\w*|szkoła|gimnazjum|liceum|technikum|politechnika|uniwersytet|akademia|kolegium)[^\n,\.;]*):\s*(?P<field_of_study>[A-Za-zĄĆĘŁŃÓŚŹŻąćęłńóśźż\s\-:]+)",
-            re.IGNORECASE | re.DOTALL,
-        )
-        for match in institution_field_pattern.finditer(edu_text):
+        for match in patterns.INSTITUTION_FIELD.finditer(edu_text):
             field_of_study = match.group("field_of_study").strip()
             start = match.start("field_of_study")
             end = match.end("field_of_study")
             entity_positions.append((start, end, "field_of_study", field_of_study))
-        entity_positions.sort(key=lambda x: x[0])  # sort by start position
 
         # field_of_study after degree, before endline or month name or year
-        degree_field_pattern = re.compile(
-            r"(?P<degree>\b(magister|licencjat|in[żz]ynier|mgr|lic\.|bachelor|master)\b(?:,( )?)?)(?P<field_of_study>[A-Za-zĄĆĘŁŃÓŚŹŻąćęłńóśźż \-:]+?)(?=\n|$|\b(styczen|stycznia|styc|sty|luty|lutego|lut|marzec|marca|mar|kwiecien|kwietnia|kwi|kwiecie[nń]|maj|czerwiec|czerwca|cze|czerw|lipiec|lipca|lip|sierpien|sierpnia|sierp|sie|wrzesie[nń]|wrzesnia|wrz|wrzes|pa[zź]dziernik|pa[zź]dziernika|pa[zź]|paz|listopad|listopada|lis|grudzie[nń]|grudnia|gru)\b|\b(19\d\d|20\d\d|2100)\b)",
-            re.IGNORECASE | re.DOTALL,
-        )
-        for match in degree_field_pattern.finditer(edu_text):
+        for match in patterns.DEGREE_FIELD.finditer(edu_text):
             field_of_study = match.group("field_of_study").strip()
             start = match.start("field_of_study")
             end = match.end("field_of_study")
             entity_positions.append((start, end, "field_of_study", field_of_study))
+
         entity_positions.sort(key=lambda x: x[0])  # sort by start position
 
         # if degree or year text is part of any previous entity that is not "date", cut the previous entity to exclude degree/year
-        adjusted_entities = []
-        for start, end, label, text in entity_positions:
-            if label in ("degree", "year", "field_of_study"):
-                # check if it overlaps with any existing entity that is not "date"
-                overlaps = [
-                    e
-                    for e in adjusted_entities
-                    if not (end <= e[0] or start >= e[1]) and e[2] != "date"
-                ]
-                for o_start, o_end, o_label, o_text in overlaps:
-                    # adjust the overlapping entity to exclude degree/year
-                    if start > o_start:
-                        adjusted_entities.append(
-                            (o_start, start, o_label, o_text[: start - o_start].strip())
-                        )
-                    if end < o_end:
-                        adjusted_entities.append(
-                            (end, o_end, o_label, o_text[end - o_start :].strip())
-                        )
-                    adjusted_entities.remove((o_start, o_end, o_label, o_text))
-            adjusted_entities.append((start, end, label, text))
+        adjusted_entities = intervals.cut_overlaps(
+            entity_positions, ("degree", "year", "field_of_study")
+        )
 
         # remove duplicate adjacent date/year entries
         adjusted_entities.sort(key=lambda x: x[0])  # sort by start position
@@ -733,21 +533,7 @@ class Parser:
         entity_positions = merged_entities
 
         # remove overlapping entities, keep the longest match
-        non_overlapping: List[Tuple[int, int, str, str]] = []
-        for start, end, label, text in entity_positions:
-            overlap = False
-            for o_start, o_end, o_label, o_text in non_overlapping:
-                if not (end <= o_start or start >= o_end):
-                    # overlapping
-                    overlap = True
-                    # keep the longer one
-                    if (end - start) > (o_end - o_start):
-                        non_overlapping.remove((o_start, o_end, o_label, o_text))
-                        non_overlapping.append((start, end, label, text))
-                    break
-            if not overlap:
-                non_overlapping.append((start, end, label, text))
-        entity_positions = non_overlapping
+        entity_positions = intervals.keep_longest(entity_positions)
 
         # if orgName contains " w ", split string after " w ", and then split it after a city name
         # risky approach as we assume one-word city names
@@ -774,16 +560,21 @@ class Parser:
 
         entity_positions = adjusted_entities
 
-        print(f"Found entities in education section:")
-        for start, end, label, text in entity_positions:
-            print(f" - {text} ({label}) [{start}:{end}]")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Found entities in education section:\n%s",
+                "\n".join(
+                    f" - {text} ({label}) [{start}:{end}]"
+                    for start, end, label, text in entity_positions
+                ),
+            )
 
-        edu_list: List[schema.Education] = []
+        edu_list: List[draft.Education] = []
         first_element = ""
         for _, _, label, text in entity_positions:
             if label == first_element or first_element == "":
                 edu_list.append(
-                    schema.Education(
+                    draft.Education(
                         degree="UNKNOWN",
                         institution="UNKNOWN",
                         field_of_study="UNKNOWN",
@@ -799,7 +590,7 @@ class Parser:
                     and edu_list[-1].end_date is not None
                 ):
                     edu_list.append(
-                        schema.Education(
+                        draft.Education(
                             degree=text,
                             institution=edu_list[-1].institution,
                             field_of_study=edu_list[-1].field_of_study,
@@ -820,7 +611,7 @@ class Parser:
                     and edu_list[-1].end_date is not None
                 ):
                     edu_list.append(
-                        schema.Education(
+                        draft.Education(
                             degree="UNKNOWN",
                             institution=edu_list[-1].institution,
                             field_of_study=edu_list[-1].field_of_study,
@@ -828,17 +619,17 @@ class Parser:
                             end_date=None,
                         )
                     )
-                if re.search(
-                    r"(obecnie|aktualnie|do dziś|do dzisiaj|do teraz|present|current)",
-                    text,
-                    re.IGNORECASE,
-                ):
+                if patterns.CURRENT.search(text):
                     if edu_list[-1].start_date == date(1900, 1, 1):
                         edu_list[-1].start_date = date.today()
                     else:
                         edu_list[-1].end_date = date.today()
                 else:
-                    m_y = self._parse_month_years_in_text(text)[0]
+                    month_years = self._parse_month_years_in_text(text)
+                    if not month_years:
+                        # a date cut down to no year by an overlapping field
+                        continue
+                    m_y = month_years[0]
                     year = m_y[0]
                     month = m_y[1]
                 if edu_list[-1].start_date == date(1900, 1, 1):
@@ -852,100 +643,268 @@ class Parser:
                 first_element = label
         return edu_list if edu_list else None
 
-    def _extract_keywords(self, text: str) -> Optional[schema.Keywords]:
-        # Placeholder
-        # return self.create_mock().keywords
-
-        # array with keywords together with regex patterns to search for
-        keywords_patterns = {
-            # Wajcha Required
-            "has_higher_education": r"\b(wyższe wykształcenie|wyzsze wyksztalcenie|wykształcenie wyższe|wyksztalcenie wyzsze|studia magisterskie|studia inżynierskie|studia inzynierskie|licencjat|magister|inżynier|inzynier|mgr|lic\.|politechnika|politechniki|politechnikę|uniwersytet|akademia|kolegium)\b",
-            "ten_years_experience": r"\b(10 lat doświadczenia|10 lat doswiadczenia|10-letnim doświadczeniem|10-letnie doświadczenie)\b",  # additional naive year parsing -> TODO
-            "no_asking": r"\b(nie pytam|nie zadaj(ę|e) pytań|nie zadaję głupich pytań|niezadawanie pytań|niezadawanie głupich pytań|bez zadawania pytań|nie zadając( zbędnych)? pytań)\b",
-            "color_knowledge": r"\b(znajomość kolorów|znajomosc kolorow|rozróżnianie kolorów|rozroznianie kolorow|znam (wszystkie )?kolory|rozróżniam kolory)\b",
-            # Wajcha Optional
-            "high_soft_skills": r"\b(wysokie umiejętności miękkie|wysokie umiejetnosci miekkie)\b",
-            "dead_lift_150kg": r"\b(martwy ciąg 150kg|martwy ciag 150kg|150kg w martwym ciągu)\b",
-            "forklift": r"\b(wózek widłowy|wozek widlowy|wózku widłowym|wozku widlowym)\b",
-            "coffee_making": r"\b(kawę|kawy)\b",
-            # Zmechol Required
-            "north_south_east_west": r"\b(rozróżnianie kierunków|rozróżniam kierunki|rozróżnianie stron świata|rozróżniam strony świata|orientacja w terenie|(dobrze )?orientuję (się )?w terenie)\b",
-            "fast_run": r"\b(bieg(u)?|biegam|bieganie|biegi|biegać)\b",
-            "push_ups": r"\b(pompki|push[- ]?ups?|robienie pompek|robię pompki)\b",
-            "kindergarten_graduate": r"\b(przedszkole|przedszkola|przedszkolu|szkoła|szkołę|szkoły|szkole|gimnazjum|liceum|technikum|politechnika|politechniki|politechnikę|uniwersytet|akademia|kolegium)\b",
-            # Zmechol Optional
-            "driving_licence": r"\b(prawo jazdy|posiadacz prawa jazdy)\b",
-            "reading": r"\b(czytanie|czytania|czytać|czytam)\b",
-            "unpunishability": r"\b(niekaralność|niekaralnosc)\b",
-            "grade_school_graduate": r"\b(szkoła|szkoły|szkole|szkołę|gimnazjum|liceum|technikum|politechnika|politechniki|politechnikę|uniwersytet|akademia|kolegium)\b",
-            "multiplication_table_knowledge": r"\b(tabliczka mnożenia|tabliczka mnozenia|tabliczkę mnożenia)\b",
-        }
-        keywords = self.create_mock().keywords
-        cleaned_text = " ".join(
-            [line.strip() for line in self._normalize_whitespace(text).split("\n")]
-        )
-        for attr, pattern in keywords_patterns.items():
-            if (
-                re.search(pattern, cleaned_text, re.IGNORECASE)
-                or (
-                    attr == "ten_years_experience"
-                    and self._calculate_years_from_txt(
-                        self._experience_str_extraction(
-                            self._normalize_whitespace(text)
-                        )
-                    )
-                    >= 10
+    def _extract_work_experience(
+        self, ctx: ParseContext
+    ) -> Optional[List[draft.WorkExperience]]:
+        exp_text = ctx.sections[sections.EXPERIENCE]
+        # without an experience heading the section is the whole CV
+        if not exp_text or exp_text == ctx.text:
+            return None
+
+        if EXPERIENCE_VIEW in ctx.docs:
+            ents = ctx.docs[EXPERIENCE_VIEW].ents
+        else:
+            # entities of the full-text doc inside the section, no extra NLP pass
+            spans = ctx.spans.get(sections.EXPERIENCE, [])
+            ents = tuple(
+                e
+                for e in ctx.docs[FULL_VIEW].ents
+                if any(
+                    start <= e.start_char and e.end_char <= end for start, end in spans
                 )
-                or (
-                    attr == "dead_lift_150kg"
-                    and self._calculate_dead_lift_from_txt(
-                        self._normalize_whitespace(text)
+            )
+        orgs = {e.text for e in ents if e.label_ == "orgName" and len(e.text) > 2}
+        places = {e.text for e in ents if e.label_ in ("placeName", "geogName")}
+
+        jobs = experience.extract_jobs(exp_text, orgs, places)
+        return jobs or None
+
+    def _apply_section_lists(self, cv: draft.CV, ctx: ParseContext) -> None:
+        """Skills, languages, certifications and military service in one pass."""
+        lists = section_lists.extract(ctx.sections)
+        ctx.timings.seconds.update(lists.timings)
+        for name, _ in section_lists.HANDLERS.values():
+            value = getattr(lists, name)
+            if value:
+                setattr(cv, name, value)
+
+    def _extract_keywords(self, ctx: ParseContext) -> Optional[schema.Keywords]:
+        keywords = self.catalogue.empty_keywords()
+        # normalized lines are already stripped
+        cleaned_text = ctx.text.replace("\n", " ")
+
+        # every phrase of every requirement in a single pass
+        matched = set()
+        for match in self.catalogue.matcher.find_all(cleaned_text):
+            logger.debug(
+                "Keyword matched: %s (%r at %d:%d)",
+                match.key,
+                match.phrase,
+                match.start,
+                match.end,
+            )
+            matched.add(match.key)
+
+        # requirements that can also be met by a computed value
+        experience_years: Optional[int] = None
+        dead_lift_kg: Optional[int] = None
+        for key, req in self.catalogue.requirements.items():
+            if key in matched:
+                continue
+            if req.min_experience_years is not None:
+                if experience_years is None:
+                    experience_years = self._calculate_years_from_txt(
+                        ctx.sections[sections.EXPERIENCE]
                     )
-                )
-            ):
-                print(f"Keyword matched: {attr}")
-                for sub_attr in ["wajcha_keywords", "zmechol_keywords"]:
-                    sub_obj = getattr(keywords, sub_attr)
-                    for sub_sub_attr in ["required", "optional"]:
-                        sub_sub_obj = getattr(sub_obj, sub_sub_attr)
-
-                        if hasattr(sub_sub_obj, attr):
-                            setattr(sub_sub_obj, attr, True)
-                            break
+                if experience_years >= req.min_experience_years:
+                    matched.add(key)
+            if req.min_dead_lift_kg is not None:
+                if dead_lift_kg is None:
+                    dead_lift_kg = self._calculate_dead_lift_from_txt(ctx.text)
+                if dead_lift_kg >= req.min_dead_lift_kg:
+                    matched.add(key)
+
+        for key in matched:
+            self.catalogue.set_flag(keywords, key)
         return keywords
 
     def _apply_extractors(
-        self, cv: Any, text: str, extractors: list[tuple[Any, str]]
+        self, cv: draft.CV, ctx: ParseContext, extractors: list[tuple[Any, str]]
     ) -> None:
         """
         Runs a list of (extractor_function, attribute_path) tuples
-        and assigns results to attributes on the cv object.
+        and assigns results to attributes of the draft.
         """
         for extractor_fn, attr_path in extractors:
-            value = extractor_fn(text)
+            with ctx.timings.stage(attr_path):
+                value = extractor_fn(ctx)
             if not value:
                 continue
             # navigate nested attributes using dotted path, e.g. "personal_info.contact.email"
             parts = attr_path.split(".")
-            target = cv
+            target: Any = cv
             for part in parts[:-1]:
                 target = getattr(target, part)
             setattr(target, parts[-1], value)
 
-    def parse_file(
-        self, input: str, enable_log: bool = False, log_output: str = ""
-    ) -> schema.CVParserSchema:
+    def _read_input(
+        self, input: Source, filetype: Optional[str] = None
+    ) -> Tuple[bytes, str, str]:
+        """
+        Returns (bytes, filetype, name) of a path, bytes or binary file object.
+        The type comes from the content; the explicit filetype or the name's
+        extension only decide when the content does not, e.g. an ODT that
+        was saved as input-123.pdf is still read as ODT.
+        """
+        if isinstance(input, (str, os.PathLike)):
+            name = os.path.basename(input)
+            with open(input, "rb") as f:
+                data = f.read()
+        elif isinstance(input, (bytes, bytearray, memoryview)):
+            name = "upload"
+            data = bytes(input)
+        else:
+            name = os.path.basename(str(getattr(input, "name", "upload")))
+            data = input.read()
+
+        if filetype is None:
+            filetype = os.path.splitext(name)[1]
+        filetype = filetype.lower().lstrip(".")
+        if data.startswith(b"%PDF"):
+            filetype = "pdf"
+        elif is_odt(data):
+            filetype = "odt"
+        elif data.startswith(b"PK"):
+            # a zip without the ODF mimetype member, most likely a DOCX
+            if filetype not in ("docx", "odt"):
+                filetype = "docx"
+        elif not filetype:
+            raise ValueError(f"Cannot detect file type of {name}, pass filetype")
+        return data, filetype, name
+
+    def _extract_context(
+        self, data: bytes, filetype: str, timings: Optional[ParseTimings] = None
+    ) -> ParseContext:
+        """
+        Open a PDF/DOCX/ODT document from memory and segment it once,
+        extractors only read the resulting context.
+        """
+        if timings is None:
+            timings = ParseTimings()
+        layout_sections: Optional[Dict[str, str]] = None
+        with timings.stage("text"):
+            if self.layout and (filetype == "pdf" or filetype == "docx"):
+                if filetype == "docx":
+                    data = clean_docx(data)
+                layout = extract_layout(data, filetype, self.page_extractor.max_pages)
+                columns = self._clean_columns(layout.text)
+                layout_sections = {
+                    kind: self._clean_text(section)
+                    for kind, section in layout.sections.items()
+                }
+            else:
+                columns = self._clean_columns(self._extract_text(data, filetype))
+        with timings.stage("sections"):
+            return self._make_context(columns, timings, layout_sections)
+
+    def _make_context(
+        self,
+        columns: str,
+        timings: ParseTimings,
+        layout_sections: Optional[Dict[str, str]] = None,
+    ) -> ParseContext:
+        """Context of the cleaned text whose column gaps are tabs (_clean_columns)."""
+        # same offsets as columns, the text is already normalized
+        text = columns.replace("\t", " ")
+        layout_sections = layout_sections or {}
+        spans = sections.segment_spans(columns)
+        return ParseContext(
+            text=text,
+            sections=self._index_sections(text, columns, spans, layout_sections),
+            # sections taken from the layout have no offsets in the text
+            spans={k: v for k, v in spans.items() if k not in layout_sections},
+            timings=timings,
+        )
 
-        file_basename = os.path.basename(input)
-        if str(input).lower().endswith(".docx"):
-            input = self._preprocess_docx(input)
+    def _index_sections(
+        self,
+        text: str,
+        columns: str,
+        spans: Dict[str, List[sections.Span]],
+        layout_sections: Dict[str, str],
+    ) -> Dict[str, str]:
+        """
+        Section kind -> text, from one segmentation pass (spans). Experience
+        and education always have an entry (the whole text when there is no
+        heading), sections found in the layout take precedence. List
+        sections keep their column gaps as tabs, which separate items (see
+        section_lists.list_items).
+        """
+        index = {
+            kind: sections.section_text(
+                columns if kind in sections.LIST_KINDS else text, kind_spans
+            )
+            for kind, kind_spans in spans.items()
+        }
+        index.setdefault(sections.EXPERIENCE, text)
+        index.setdefault(sections.EDUCATION, text)
+        index.update(layout_sections)
+        return index
+
+    def _clean_text(self, text: str) -> str:
+        # dropped characters can leave whitespace runs, normalize after them
+        return self._normalize_whitespace(self._remove_unwanted_unicode(text))
 
-        doc = fitz.open(input)
+    def _clean_columns(self, text: str) -> str:
+        return self._normalize_columns(self._remove_unwanted_unicode(text))
 
-        if str(input).lower().endswith(".docx"):
-            os.remove(input)
+    def _extract_text(self, data: bytes, filetype: str) -> str:
+        """
+        Open a PDF/DOCX/ODT document from memory and return its raw text.
+        """
+        if filetype == "odt":
+            content = read_odt_text(data)
+        elif filetype == "docx" and self.docx_reader == "xml":
+            content = read_docx_text(data)
+        else:
+            if filetype == "docx":
+                data = clean_docx(data)
+            content = "\n".join(self.page_extractor.pages(data, filetype))
+        return content
+
+    def _nlp_views(self, ctx: ParseContext) -> Dict[str, str]:
+        """
+        Texts of one document that extractors run spaCy on,
+        so they can be piped through the model in one go.
+        """
+        edu_text = ctx.sections[sections.EDUCATION]
+        views = {
+            FULL_VIEW: ctx.text,
+            EDUCATION_VIEW: " ".join([x.strip() for x in edu_text.split("\n")]),
+        }
+        # experience found in the layout has no offsets in the full text
+        exp_text = ctx.sections[sections.EXPERIENCE]
+        if sections.EXPERIENCE not in ctx.spans and exp_text and exp_text != ctx.text:
+            views[EXPERIENCE_VIEW] = exp_text
+        return views
+
+    def _build_contexts(
+        self, contexts: List[ParseContext], batch_size: int = 32, n_process: int = 1
+    ) -> List[ParseContext]:
+        """
+        Run every NLP view of every context through nlp.pipe at once
+        and fill in their docs. Each context is charged an equal share of
+        the pipeline time and the peak allocation of the whole batch.
+        """
+        views = (
+            (view_text, (i, view))
+            for i, ctx in enumerate(contexts)
+            for view, view_text in self._nlp_views(ctx).items()
+        )
+        batch = ParseTimings()
+        with batch.stage("nlp"):
+            for doc, (i, view) in self.nlp.pipe(
+                views, as_tuples=True, batch_size=batch_size, n_process=n_process
+            ):
+                contexts[i].docs[view] = doc
+        for ctx in contexts:
+            ctx.timings.seconds["nlp"] = batch.seconds["nlp"] / len(contexts)
+            if "nlp" in batch.allocated:
+                ctx.timings.allocated["nlp"] = batch.allocated["nlp"]
+        return contexts
 
-        cv = self.create_mock()
+    def _parse_context(self, ctx: ParseContext) -> schema.CVParserSchema:
+        cv = draft.CV(keywords=self.catalogue.empty_keywords())
 
         extractors = [
             (self._extract_email, "personal_info.contact.email"),
@@ -953,26 +912,134 @@ class Parser:
             (self._extract_name, "personal_info.full_name"),
             (self._extract_overview, "overview"),
             (self._extract_education, "education"),
-            # (self._extract_work_experience, "work_experience"),
+            (self._extract_work_experience, "work_experience"),
             (self._extract_keywords, "keywords"),
         ]
 
-        content = "\n".join(
-            [page.get_text(sort=True) for _, page in enumerate(doc, start=1)]
+        self._apply_extractors(cv, ctx, extractors)
+        self._apply_section_lists(cv, ctx)
+        with ctx.timings.stage("validate"):
+            return draft.to_schema(cv)
+
+    def _cache_key(self, data: bytes) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.key(
+            data,
+            PARSER_VERSION,
+            self.nlp_profile,
+            self.docx_reader,
+            str(self.page_extractor.max_pages),
+            "layout" if self.layout else "plain",
+            self.model_version,
+            self.catalogue.version,
         )
-        log_content = []
-        normalized = self._normalize_whitespace(content)
-        normalized = self._remove_unwanted_unicode(normalized)
-        log_content.append(normalized)
-        self._apply_extractors(cv, normalized, extractors)
 
+    def _cache_get(
+        self, key: Optional[str], timings: ParseTimings
+    ) -> Optional[schema.CVParserSchema]:
+        if self.cache is None or key is None:
+            return None
+        with timings.stage("cache"):
+            cached = self.cache.get(key)
+            timings.cache = CACHE_MISS if cached is None else CACHE_HIT
+            if cached is None:
+                return None
+            return schema.CVParserSchema.model_validate_json(cached)
+
+    def _cache_put(
+        self, key: Optional[str], cv: schema.CVParserSchema, timings: ParseTimings
+    ) -> None:
+        if self.cache is not None and key is not None:
+            with timings.stage("cache"):
+                self.cache.put(key, cv.model_dump_json())
+
+    def parse_file(
+        self,
+        input: Source,
+        enable_log: bool = False,
+        log_output: str = "",
+        filetype: Optional[str] = None,
+        timings: Optional[ParseTimings] = None,
+    ) -> schema.CVParserSchema:
+        """
+        Parse a CV given as a path, raw bytes or a binary file object.
+        Nothing is written to disk apart from the optional log and cache:
+        with `enable_log` the raw_text_log record of this file goes to
+        raw-<name>.txt in `log_output`.
+        `timings`, when given, is filled in with the time of every stage.
+        """
+        if timings is None:
+            timings = ParseTimings()
+        with timings.stage("read"):
+            data, filetype, file_basename = self._read_input(input, filetype)
+            cache_key = self._cache_key(data)
+
+        cached = self._cache_get(cache_key, timings)
+        if cached is not None:
+            return cached
+
+        ctx = self._build_contexts([self._extract_context(data, filetype, timings)])[0]
         if enable_log:
-            with open(
-                os.path.join(log_output, f"raw-{file_basename}.txt"),
-                "w",
-                encoding="utf-8",
-            ) as f:
-                for content in log_content:
-                    f.write(content)
+            with _raw_text_file(os.path.join(log_output, f"raw-{file_basename}.txt")):
+                raw_text_log.debug("%s", ctx.text)
+        else:
+            raw_text_log.debug("%s", ctx.text)
 
+        cv = self._parse_context(ctx)
+        self._cache_put(cache_key, cv, timings)
         return cv
+
+    def parse_bytes(
+        self, data: bytes, filetype: Optional[str] = None, **kwargs: Any
+    ) -> schema.CVParserSchema:
+        """Parse an in-memory PDF/DOCX/ODT, e.g. an HTTP upload."""
+        return self.parse_file(data, filetype=filetype, **kwargs)
+
+    def parse_many(
+        self,
+        inputs: Iterable[Source],
+        batch_size: int = 32,
+        n_process: int = 1,
+        timings: Optional[List[ParseTimings]] = None,
+    ) -> List[Union[schema.CVParserSchema, Exception]]:
+        """
+        Parse many files, batching the spaCy work of all of them through
+        nlp.pipe. A file that fails yields its exception in place of a
+        result, the remaining files are still parsed. `timings`, when
+        given, gets one ParseTimings per input appended.
+        """
+        results: Dict[int, Union[schema.CVParserSchema, Exception]] = {}
+        pending: Dict[int, ParseContext] = {}
+        cache_keys: Dict[int, Optional[str]] = {}
+        file_timings: Dict[int, ParseTimings] = {}
+        for i, input in enumerate(inputs):
+            file_timings[i] = ParseTimings()
+            try:
+                with file_timings[i].stage("read"):
+                    data, filetype, _ = self._read_input(input)
+                    cache_keys[i] = self._cache_key(data)
+                cached = self._cache_get(cache_keys[i], file_timings[i])
+                if cached is not None:
+                    results[i] = cached
+                    continue
+                pending[i] = self._extract_context(data, filetype, file_timings[i])
+            except Exception as e:
+                results[i] = e
+
+        contexts = self._build_contexts(list(pending.values()), batch_size, n_process)
+        for i, ctx in zip(pending.keys(), contexts):
+            raw_text_log.debug("%s", ctx.text)
+            try:
+                cv = self._parse_context(ctx)
+                self._cache_put(cache_keys[i], cv, ctx.timings)
+                results[i] = cv
+            except Exception as e:
+                results[i] = e
+        if timings is not None:
+            timings.extend(file_timings[i] for i in sorted(file_timings))
+        return [results[i] for i in sorted(results)]
+
+    def close(self) -> None:
+        """Stop the page extraction workers, if any were started."""
+        self.page_extractor.close()
@@ -0,0 +1,194 @@
+"""
+Compiled regular expressions shared by the extractors in src/parser.py.
+
+Everything here is built once at import, extractors must not compile
+patterns per call.
+"""
+
+import re
+import unicodedata
+from typing import Dict
+
+YEAR_ALT = r"19\d\d|20\d\d|2100"
+
+WHITESPACE_RUN = re.compile(r"[ \t]+")
+# a gap between columns of one line: a tab or two and more spaces
+COLUMN_GAP = re.compile(r"[ \t]{2,}|\t")
+DOCX_FALLBACK = re.compile(r"<mc:Fallback>.*?</mc:Fallback>", re.DOTALL)
+
+YEAR = re.compile(rf"({YEAR_ALT})")
+YEAR_WORD = re.compile(rf"\b({YEAR_ALT})\b")
+NUMERIC_MONTH_YEAR = re.compile(rf"(\d{{1,2}})[\./-]({YEAR_ALT})")
+
+# Polish full forms and common abbreviations/stems, English months to be tolerant
+MONTHS_MAP: Dict[str, int] = {
+    "styczeń": 1,
+    "stycznia": 1,
+    "sty": 1,
+    "styc": 1,
+    "luty": 2,
+    "lutego": 2,
+    "lut": 2,
+    "marzec": 3,
+    "marca": 3,
+    "mar": 3,
+    "kwiecień": 4,
+    "kwietnia": 4,
+    "kwi": 4,
+    "maj": 5,
+    "czerwiec": 6,
+    "czerwca": 6,
+    "cze": 6,
+    "czerw": 6,
+    "lipiec": 7,
+    "lipca": 7,
+    "lip": 7,
+    "sierpień": 8,
+    "sierpnia": 8,
+    "sie": 8,
+    "sierp": 8,
+    "wrzesień": 9,
+    "września": 9,
+    "wrz": 9,
+    "wrzes": 9,
+    "październik": 10,
+    "października": 10,
+    "paź": 10,
+    "paz": 10,
+    "listopad": 11,
+    "listopada": 11,
+    "lis": 11,
+    "grudzień": 12,
+    "grudnia": 12,
+    "gru": 12,
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+}
+
+
+def ascii_fold(s: str) -> str:
+    """Lowercase and strip diacritics, e.g. "Październik" -> "pazdziernik"."""
+    return (
+        unicodedata.normalize("NFKD", s)
+        .encode("ascii", "ignore")
+        .decode("ascii")
+        .lower()
+    )
+
+
+# folded month name -> (month number, position in MONTHS_MAP)
+MONTHS_FOLDED: Dict[str, tuple[int, int]] = {}
+for _rank, (_name, _num) in enumerate(MONTHS_MAP.items()):
+    MONTHS_FOLDED.setdefault(ascii_fold(_name), (_num, _rank))
+
+# every month name in one alternation, longest first, matched on folded text
+MONTH_NAME_YEAR = re.compile(
+    r"\b("
+    + "|".join(re.escape(n) for n in sorted(MONTHS_FOLDED, key=len, reverse=True))
+    + rf")\b\s*({YEAR_ALT})",
+    re.IGNORECASE,
+)
+
+EDU_INSTITUTION_KEYWORD = re.compile(
+    r"(żłobek|szkoła|gimnazjum|liceum|technikum|politechnika|uniwersytet|akademia|kolegium)",
+    re.IGNORECASE,
+)
+
+CURRENTLY = re.compile(r"(teraz|obecnie|aktualnie|dziś|dzis)", re.IGNORECASE)
+DEAD_LIFT = re.compile(r"(\d+)(?: ?kg (?:w )?martwym? ci(?:ą|a)gu?)", re.IGNORECASE)
+
+EMAIL = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+PHONE = re.compile(
+    r"(?:(?:\+\d{1,3}\s*)?(?:\(?\d{2,4}\)?[\s.-]*)?\d{3}[\s.-]*\d{3,4}[\s.-]*\d{3,4})"
+)
+SENTENCE_END = re.compile(r"[.!?]")
+# text up to an empty line, the last paragraph needs one after it as well
+PARAGRAPH = re.compile(r"(.*?)\n\n", re.DOTALL)
+
+
+def _letters(*ranges: tuple[int, int]) -> str:
+    return "".join(
+        ch for lo, hi in ranges for ch in map(chr, range(lo, hi + 1)) if ch.isalpha()
+    )
+
+
+# letters of pyparsing_unicode Latin1 + LatinA + LatinB
+BASE_ALPHAS = _letters((0x20, 0x7E), (0xA0, 0xFF), (0x100, 0x17F), (0x180, 0x24F))
+BASE_WORD = re.compile(f"[{re.escape(BASE_ALPHAS)}]+")
+NAME_WORD = re.compile(f"[{re.escape(BASE_ALPHAS + '-')}]+")
+
+# education section
+DEGREE_ALT = r"magister|licencjat|in[żz]ynier|mgr|lic\.|bachelor|master"
+INSTITUTION_ALT = r"szko\w*|szkoła|gimnazjum|liceum|technikum|politechnika|uniwersytet|akademia|kolegium"
+EDU_MONTH_ALT = r"styczen|stycznia|styc|sty|luty|lutego|lut|marzec|marca|mar|kwiecien|kwietnia|kwi|kwiecie[nń]|maj|czerwiec|czerwca|cze|czerw|lipiec|lipca|lip|sierpien|sierpnia|sierp|sie|wrzesie[nń]|wrzesnia|wrz|wrzes|pa[zź]dziernik|pa[zź]dziernika|pa[zź]|paz|listopad|listopada|lis|grudzie[nń]|grudnia|gru"
+
+DEGREE = re.compile(rf"\b({DEGREE_ALT})\b", re.IGNORECASE)
+YEAR_OR_CURRENT = re.compile(
+    rf"\b({YEAR_ALT}|obecnie|aktualnie|do dziś|do dzisiaj|do teraz|present|current)\b",
+    re.IGNORECASE,
+)
+CURRENT = re.compile(
+    r"(obecnie|aktualnie|do dziś|do dzisiaj|do teraz|present|current)", re.IGNORECASE
+)
+INSTITUTION = re.compile(
+    rf"(([a-zA-ZąęółśżźćńĄĘÓŁŚŻŹĆŃ]+)({INSTITUTION_ALT})( w [a-zA-ZąęółśżźćńĄĘÓŁŚŻŹĆŃ]+)?)[^\n,\.;]*",
+    re.IGNORECASE,
+)
+EDU_MONTH_NAME = re.compile(rf"\b({EDU_MONTH_ALT})\b", re.IGNORECASE)
+FIELD_OF_STUDY = re.compile(
+    r"(kierunek|zawód|zawod)(?::)?\s+([A-Za-zĄĆĘŁŃÓŚŹŻąćęłńóśźż \-:]+)",
+    re.IGNORECASE,
+)
+DEGREE_INSTITUTION = re.compile(
+    rf"(?P<degree>\b({DEGREE_ALT})\b(?:,( )?)?)(?P<between>.*?)(?:,|\.|\n|;|$| )+(?P<institution>(?:{INSTITUTION_ALT})[^\n,\.;]*)",
+    re.IGNORECASE | re.DOTALL,
+)
+INSTITUTION_FIELD = re.compile(
+    rf"(?P<institution>(?:{INSTITUTION_ALT})[^\n,\.;]*):\s*(?P<field_of_study>[A-Za-zĄĆĘŁŃÓŚŹŻąćęłńóśźż\s\-:]+)",
+    re.IGNORECASE | re.DOTALL,
+)
+DEGREE_FIELD = re.compile(
+    rf"(?P<degree>\b({DEGREE_ALT})\b(?:,( )?)?)(?P<field_of_study>[A-Za-zĄĆĘŁŃÓŚŹŻąćęłńóśźż \-:]+?)(?=\n|$|\b({EDU_MONTH_ALT})\b|\b({YEAR_ALT})\b)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# experience section
+_MONTH_NAME_ALT = "|".join(
+    re.escape(n)
+    for n in sorted(set(MONTHS_MAP) | set(MONTHS_FOLDED), key=len, reverse=True)
+)
+# "wrzesień 2016", "01.2019", "2015" or an open end; a month may wrap a line
+JOB_DATE = re.compile(
+    rf"\b(?:(?P<month>{_MONTH_NAME_ALT})\.?\s*|(?P<month_number>\d{{1,2}})[\./-])?"
+    rf"(?P<year>{YEAR_ALT})\b"
+    r"|\b(?P<current>(?:do\s+)?(?:teraz|obecnie|aktualnie|nadal|dziś|dzisiaj|present|current))\b",
+    re.IGNORECASE,
+)
+# pieces of an entry header: "Operator, Firma sp. z o.o. - Gdańsk"
+JOB_HEADER_SEPARATOR = re.compile(r"\n|\s*[,|;]\s+|\s+[-–—]\s+")
+JOB_BULLET = re.compile(r"^[•·\-–*▪◦●]")
+COMPANY = re.compile(
+    r"\b(?:sp\.?\s*z\.?\s*o\.?\s*o\b\.?|sp\.\s*[jkp]\.|s\.\s?a\.|spółka|ltd|gmbh|inc|llc)"
+    r"|^(?:firma|przedsiębiorstwo|zakład|urząd|ministerstwo|instytut|fabryka|hurtownia"
+    r"|bank|szpital|grupa|agencja|biuro|spółdzielnia|studio|restauracja|hotel|gmina"
+    r"|starostwo)\b",
+    re.IGNORECASE,
+)
+JOB_TITLE = re.compile(
+    r"^(?:operator|specjalist|kierowni|kierowca|mechanik|magazynier|kurier|stolarz"
+    r"|inwestor|programist|analityk|księgow|asystent|sprzedaw|konsultant|manager"
+    r"|menedżer|dyrektor|technik|inżynier|praktykant|stażyst|pracownik|właściciel"
+    r"|pomocnik|monter|elektryk|spawacz|kucharz|kelner|kasjer|nauczyciel|żołnierz"
+    r"|developer|engineer|intern)",
+    re.IGNORECASE,
+)
@@ -0,0 +1,86 @@
+"""
+Where the time of one parse goes.
+
+Parser.parse_file(timings=ParseTimings()) fills in the wall time of every
+stage: reading the input, opening the document and extracting its text,
+segmenting it, the spaCy pipeline, each extractor and the cache. Memory
+is only measured while tracemalloc is tracing (python -X tracemalloc or
+--trace-malloc), since tracing slows everything else down.
+"""
+
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+CACHE_OFF = "off"
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+
+
+@dataclass
+class ParseTimings:
+    cache: str = CACHE_OFF
+    # stage -> seconds, in the order the stages ran
+    seconds: Dict[str, float] = field(default_factory=dict)
+    # stage -> peak bytes allocated during it, only while tracemalloc traces
+    allocated: Dict[str, int] = field(default_factory=dict)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the block as `name`, stages must not be nested."""
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = (
+                self.seconds.get(name, 0.0) + time.perf_counter() - start
+            )
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1] - before
+                self.allocated[name] = max(self.allocated.get(name, 0), peak)
+
+    @property
+    def total(self) -> float:
+        return sum(self.seconds.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready, times in milliseconds."""
+        out: Dict[str, Any] = {
+            "cache": self.cache,
+            "total_ms": round(self.total * 1000, 3),
+            "stages_ms": {
+                name: round(seconds * 1000, 3) for name, seconds in self.seconds.items()
+            },
+        }
+        if self.allocated:
+            out["allocated_bytes"] = dict(self.allocated)
+        return out
+
+    def server_timing(self) -> str:
+        """Value of an HTTP Server-Timing header."""
+        return ", ".join(
+            f"{name.replace('.', '-')};dur={seconds * 1000:.3f}"
+            for name, seconds in self.seconds.items()
+        )
+
+
+@contextmanager
+def profiled(path: Optional[str]) -> Iterator[None]:
+    """cProfile the block into `path` (read with pstats/snakeviz), no-op for None."""
+    if path is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
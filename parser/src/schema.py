@@ -1,4 +1,4 @@
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from datetime import date
 from pydantic import BaseModel, EmailStr, model_validator
 from datetime import date
@@ -60,7 +60,8 @@ class Certification(BaseModel):
 
 class Language(BaseModel):
     language: str
-    proficiency: Literal["basic", "conversational", "fluent", "native"]
+    # "unknown" when the CV names the language without a level
+    proficiency: Literal["basic", "conversational", "fluent", "native", "unknown"]
 
 
 class MilitaryExperience(BaseModel):
@@ -71,48 +72,13 @@ class MilitaryExperience(BaseModel):
     duties: List[str]
 
 
-class WajchaRequired(BaseModel):
-    has_higher_education: bool = False
-    ten_years_experience: bool = False
-    no_asking: bool = False
-    color_knowledge: bool = False
+class PositionKeywords(BaseModel):
+    required: Dict[str, bool]
+    optional: Dict[str, bool]
 
 
-class WajchaOptional(BaseModel):
-    high_soft_skills: bool = False
-    dead_lift_150kg: bool = False
-    forklift: bool = False
-    coffee_making: bool = False
-
-
-class WajchaKeywords(BaseModel):
-    required: WajchaRequired
-    optional: WajchaOptional
-
-
-class ZmecholRequired(BaseModel):
-    north_south_east_west: bool = False
-    fast_run: bool = False
-    push_ups: bool = False
-    kindergarten_graduate: bool = False
-
-
-class ZmecholOptional(BaseModel):
-    driving_licence: bool = False
-    reading: bool = False
-    unpunishability: bool = False
-    grade_school_graduate: bool = False
-    multiplication_table_knowledge: bool = False
-
-
-class ZmecholKeywords(BaseModel):
-    required: ZmecholRequired
-    optional: ZmecholOptional
-
-
-class Keywords(BaseModel):
-    wajcha_keywords: WajchaKeywords
-    zmechol_keywords: ZmecholKeywords
+# position -> its requirement flags, positions come from catalogue/positions.json
+Keywords = Dict[str, PositionKeywords]
 
 
 class CVParserSchema(BaseModel):
@@ -0,0 +1,366 @@
+"""
+Skills, languages, certifications and military experience, in one walk
+over the section index.
+
+Every section kind has one handler, run once on its text. Languages,
+proficiency levels, military ranks and branches are recognised by dict
+lookups of folded words (and two/three word phrases), never by scanning
+the text once per known name.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Literal, Optional, Tuple, TypeVar
+
+from src import draft, experience, patterns, sections
+
+UNKNOWN = "UNKNOWN"
+
+T = TypeVar("T")
+
+Proficiency = Literal["basic", "conversational", "fluent", "native", "unknown"]
+
+LANGUAGE_NAMES: Dict[str, Tuple[str, ...]] = {
+    "Polski": ("polski", "polskiego", "polish"),
+    "Angielski": ("angielski", "angielskiego", "english"),
+    "Niemiecki": ("niemiecki", "niemieckiego", "german"),
+    "Francuski": ("francuski", "francuskiego", "french"),
+    "Hiszpański": ("hiszpański", "hiszpańskiego", "spanish"),
+    "Włoski": ("włoski", "włoskiego", "italian"),
+    "Rosyjski": ("rosyjski", "rosyjskiego", "russian"),
+    "Ukraiński": ("ukraiński", "ukraińskiego", "ukrainian"),
+    "Czeski": ("czeski", "czeskiego", "czech"),
+    "Słowacki": ("słowacki", "słowackiego", "slovak"),
+    "Niderlandzki": ("niderlandzki", "holenderski", "dutch"),
+    "Portugalski": ("portugalski", "portugalskiego", "portuguese"),
+    "Szwedzki": ("szwedzki", "szwedzkiego", "swedish"),
+    "Norweski": ("norweski", "norweskiego", "norwegian"),
+    "Chiński": ("chiński", "chińskiego", "chinese"),
+    "Japoński": ("japoński", "japońskiego", "japanese"),
+    "Arabski": ("arabski", "arabskiego", "arabic"),
+    "Amerykański": ("amerykański",),
+    "Esperanto": ("esperanto", "esperano"),
+    "Migowy": ("migowy", "język migowy", "polski język migowy"),
+}
+
+PROFICIENCY_WORDS: Dict[Proficiency, Tuple[str, ...]] = {
+    "native": ("ojczysty", "ojczysta", "natywny", "native", "mother tongue"),
+    "fluent": (
+        "c1",
+        "c2",
+        "biegły",
+        "biegle",
+        "biegła",
+        "zaawansowany",
+        "fluent",
+        "advanced",
+        "proficient",
+    ),
+    "conversational": (
+        "b1",
+        "b2",
+        "komunikatywny",
+        "komunikatywnie",
+        "dobry",
+        "dobrze",
+        "średniozaawansowany",
+        "intermediate",
+        "conversational",
+    ),
+    "basic": ("a1", "a2", "podstawowy", "podstawowa", "basic", "beginner"),
+}
+# a language listed without a level, any other one gets UNKNOWN_PROFICIENCY
+DEFAULT_PROFICIENCY: Dict[str, Proficiency] = {"Polski": "native"}
+UNKNOWN_PROFICIENCY: Proficiency = "unknown"
+
+MILITARY_RANKS: Tuple[str, ...] = (
+    "szeregowy",
+    "starszy szeregowy",
+    "kapral",
+    "starszy kapral",
+    "plutonowy",
+    "sierżant",
+    "starszy sierżant",
+    "młodszy chorąży",
+    "chorąży",
+    "starszy chorąży",
+    "starszy chorąży sztabowy",
+    "podporucznik",
+    "porucznik",
+    "kapitan",
+    "major",
+    "podpułkownik",
+    "pułkownik",
+    "generał brygady",
+    "generał dywizji",
+    "generał broni",
+    "generał",
+    "marynarz",
+    "mat",
+    "bosman",
+    "komandor",
+    "private",
+    "corporal",
+    "sergeant",
+    "lieutenant",
+    "captain",
+    "colonel",
+)
+
+MILITARY_BRANCHES: Dict[str, Tuple[str, ...]] = {
+    "Wojska Lądowe": ("wojska lądowe", "wojsk lądowych", "army"),
+    "Siły Powietrzne": ("siły powietrzne", "sił powietrznych", "air force"),
+    "Marynarka Wojenna": ("marynarka wojenna", "marynarki wojennej", "navy"),
+    "Wojska Specjalne": ("wojska specjalne", "wojsk specjalnych", "special forces"),
+    "Wojska Obrony Terytorialnej": (
+        "wojska obrony terytorialnej",
+        "wojsk obrony terytorialnej",
+        "wot",
+    ),
+    "Żandarmeria Wojskowa": ("żandarmeria wojskowa", "żandarmerii wojskowej"),
+    "Wojska Obrony Cyberprzestrzeni": ("wojska obrony cyberprzestrzeni",),
+}
+
+# longest phrase in the tables above, in words
+MAX_PHRASE_WORDS = 4
+
+
+def _fold_table(table: Dict[T, Tuple[str, ...]]) -> Dict[str, T]:
+    return {
+        patterns.ascii_fold(phrase): value
+        for value, phrases in table.items()
+        for phrase in phrases
+    }
+
+
+_LANGUAGE_BY_WORD = _fold_table(LANGUAGE_NAMES)
+_PROFICIENCY_BY_WORD = _fold_table(PROFICIENCY_WORDS)
+_RANK_BY_WORD = {
+    patterns.ascii_fold(rank): rank.capitalize() for rank in MILITARY_RANKS
+}
+_BRANCH_BY_WORD = _fold_table(MILITARY_BRANCHES)
+
+_WORD = re.compile(r"\w+")
+# items of one line: "a | b", "• a • b", "a; b", columns separated by a tab
+_ITEM_SEPARATOR = re.compile(r"\s*[|•·▪;\t]\s*")
+_COMMA = re.compile(r",\s+(?![^()]*\))")
+_FOOTER = re.compile(r"©|https?://|www\.|\.com\b", re.IGNORECASE)
+# "Name – Issuer", "Name (Issuer)", "Name, Issuer"
+_ISSUER = re.compile(r"\s+[-–—]\s+|\s*\((?P<paren>[^()]+)\)\s*$|,\s+")
+
+
+@dataclass
+class SectionLists:
+    skills: List[str] = field(default_factory=list)
+    languages: List[draft.Language] = field(default_factory=list)
+    certifications: List[draft.Certification] = field(default_factory=list)
+    military_experience: List[draft.MilitaryExperience] = field(default_factory=list)
+    # field -> seconds spent on it
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+def _phrases(text: str) -> List[Tuple[int, List[str]]]:
+    """(index of the first word, folded phrases of 1..MAX_PHRASE_WORDS words)."""
+    words = [patterns.ascii_fold(w) for w in _WORD.findall(text)]
+    return [
+        (i, [" ".join(words[i : i + n]) for n in range(MAX_PHRASE_WORDS, 0, -1)])
+        for i in range(len(words))
+    ]
+
+
+def _first(text: str, table: Dict[str, str]) -> Optional[str]:
+    """Value of the first (longest at that word) phrase of `text` in `table`."""
+    for _, phrases in _phrases(text):
+        for phrase in phrases:
+            if phrase in table:
+                return table[phrase]
+    return None
+
+
+def _is_heading(line: str) -> bool:
+    letters = [ch for ch in line if ch.isalpha()]
+    return (
+        len(letters) > 1
+        and all(ch.isupper() for ch in letters)
+        and not any(ch.isdigit() for ch in line)
+        and len(line.split()) <= 5
+    )
+
+
+def _is_sentence(line: str) -> bool:
+    return line.endswith(".") and len(line.split()) > 3
+
+
+def list_items(text: str) -> List[str]:
+    """
+    Items of a list section: one per line, or separated by "|"/"•" or a
+    column gap (a tab) within lines. Wrapped lines are joined back, the list ends at a heading-like
+    line, a footer or, in a separated list, a lone line after a gap.
+    """
+    separated = any(
+        _ITEM_SEPARATOR.search(line.strip()[1:].strip()) for line in text.split("\n")
+    )
+    lines: List[str] = []
+    gap = False
+    for raw in text.split("\n"):
+        line = patterns.JOB_BULLET.sub("", raw.strip(), count=1).strip()
+        if not line:
+            gap = True
+            continue
+        # a row of columns is never the wrapped end of the previous item
+        continuation = (
+            (line[0].islower() or line[0] == "(") and bool(lines) and "\t" not in line
+        )
+        if _is_heading(line) or _FOOTER.search(line):
+            break
+        if (
+            not continuation
+            and lines
+            and (
+                _is_sentence(line)
+                or (separated and gap and not _ITEM_SEPARATOR.search(line))
+            )
+        ):
+            break
+        # a lowercase list ("parzenie kawy") has one item per line
+        if continuation and (
+            separated or lines[-1][:1].isupper() or _COMMA.search(lines[-1])
+        ):
+            lines[-1] = f"{lines[-1]} {line}"
+        else:
+            lines.append(line)
+        gap = False
+
+    items: List[str] = []
+    for line in lines:
+        pieces = _ITEM_SEPARATOR.split(line)
+        if len(pieces) == 1 and not separated:
+            commas = _COMMA.split(line)
+            if len(commas) > 1 and all(len(p.split()) > 1 for p in commas):
+                pieces = commas
+        for piece in pieces:
+            piece = piece.strip(" \t-–—*.")
+            if piece and piece not in items:
+                items.append(piece)
+    return items
+
+
+def extract_languages(text: str) -> List[draft.Language]:
+    """
+    Languages in the order listed. A level goes to the first language
+    still without one, so "Angielski Polski / C2 C1" pairs up by column.
+    """
+    found: Dict[str, Optional[Proficiency]] = {}
+    skip_until = -1
+    for i, phrases in _phrases(text):
+        if i < skip_until:
+            continue
+        for phrase in phrases:
+            if phrase in _LANGUAGE_BY_WORD:
+                found.setdefault(_LANGUAGE_BY_WORD[phrase], None)
+            elif phrase in _PROFICIENCY_BY_WORD:
+                pending = [lang for lang, level in found.items() if level is None]
+                if pending:
+                    found[pending[0]] = _PROFICIENCY_BY_WORD[phrase]
+            else:
+                continue
+            skip_until = i + len(phrase.split())
+            break
+    return [
+        draft.Language(
+            language=lang,
+            proficiency=level or DEFAULT_PROFICIENCY.get(lang, UNKNOWN_PROFICIENCY),
+        )
+        for lang, level in found.items()
+    ]
+
+
+def extract_certifications(text: str) -> List[draft.Certification]:
+    """Items of the section, the issuer is UNKNOWN unless given after the name."""
+    certifications = []
+    for item in list_items(text):
+        _, _, item = experience.header_dates(item)
+        item = " ".join(item.split()).strip(" -–—,")
+        if not item:
+            continue
+        name, issuer = item, UNKNOWN
+        match = _ISSUER.search(item)
+        if match:
+            if match.group("paren"):
+                name, issuer = item[: match.start()], match.group("paren")
+            else:
+                name, issuer = item[: match.start()], item[match.end() :]
+        certifications.append(
+            draft.Certification(name=name.strip(), issuing_organization=issuer.strip())
+        )
+    return certifications
+
+
+def extract_military(text: str) -> List[draft.MilitaryExperience]:
+    # entries are read line by line, columns of a line are one header
+    text = text.replace("\t", " ")
+    service = []
+    for entry in experience.job_entries(text):
+        start, end, _ = experience.header_dates("\n".join(entry.header))
+        if start is None:
+            continue
+        header = " ".join(entry.before + entry.header)
+        rank = _first(header, _RANK_BY_WORD)
+        branch = _first(header, _BRANCH_BY_WORD)
+        description = list(entry.description)
+        if (rank is None or branch is None) and entry.next_line is not None:
+            # rank or branch on the line under the dates
+            next_rank = _first(entry.next_line, _RANK_BY_WORD)
+            next_branch = _first(entry.next_line, _BRANCH_BY_WORD)
+            if next_rank or next_branch:
+                rank, branch = rank or next_rank, branch or next_branch
+                description.remove(entry.next_line)
+        service.append(
+            draft.MilitaryExperience(
+                rank=rank or UNKNOWN,
+                branch=branch or UNKNOWN,
+                start_date=start,
+                end_date=end,
+                duties=list_items("\n".join(description)),
+            )
+        )
+    return service
+
+
+def _skills(text: str, out: SectionLists) -> None:
+    out.skills = list_items(text)
+
+
+def _languages(text: str, out: SectionLists) -> None:
+    out.languages = extract_languages(text)
+
+
+def _certifications(text: str, out: SectionLists) -> None:
+    out.certifications = extract_certifications(text)
+
+
+def _military(text: str, out: SectionLists) -> None:
+    out.military_experience = extract_military(text)
+
+
+# section kind -> (field, handler)
+HANDLERS: Dict[str, Tuple[str, Callable[[str, SectionLists], None]]] = {
+    sections.SKILLS: ("skills", _skills),
+    sections.LANGUAGES: ("languages", _languages),
+    sections.CERTIFICATES: ("certifications", _certifications),
+    sections.MILITARY: ("military_experience", _military),
+}
+
+
+def extract(index: Dict[str, str]) -> SectionLists:
+    """All four lists from one walk over the section index, with timings."""
+    out = SectionLists()
+    for kind, text in index.items():
+        if kind not in HANDLERS:
+            continue
+        name, handler = HANDLERS[kind]
+        start = time.perf_counter()
+        handler(text, out)
+        out.timings[name] = time.perf_counter() - start
+    return out
@@ -0,0 +1,152 @@
+"""
+CV section kinds and the headings that open them.
+
+A heading is recognised with one dict lookup of the folded line, e.g.
+"Doświadczenie zawodowe:" -> "doswiadczenie zawodowe" -> EXPERIENCE.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from src import patterns
+
+HEADER = "header"  # everything before the first heading
+EXPERIENCE = "experience"
+EDUCATION = "education"
+SKILLS = "skills"
+LANGUAGES = "languages"
+CERTIFICATES = "certificates"
+MILITARY = "military"
+OVERVIEW = "overview"
+CONTACT = "contact"
+INTERESTS = "interests"
+PROJECTS = "projects"
+OTHER = "other"  # a heading that is not in the vocabulary
+
+SECTION_HEADINGS: Dict[str, tuple[str, ...]] = {
+    EXPERIENCE: (
+        "doświadczenie",
+        "doświatczenie",
+        "doświadczenie zawodowe",
+        "doświatczenie zawodowe",
+        "historia zatrudnienia",
+        "przebieg kariery",
+        "experience",
+        "work experience",
+    ),
+    EDUCATION: ("edukacja", "wykształcenie", "nauczanie", "education"),
+    SKILLS: ("umiejętności", "kluczowe umiejętności", "kompetencje", "skills"),
+    LANGUAGES: ("języki", "języki obce", "znajomość języków", "languages"),
+    CERTIFICATES: ("certyfikat", "certyfikaty", "kursy", "szkolenia", "certificates"),
+    MILITARY: (
+        "doświadczenie wojskowe",
+        "służba wojskowa",
+        "wojsko",
+        "military service",
+    ),
+    OVERVIEW: ("o mnie", "profil", "podsumowanie", "cel zawodowy", "about me"),
+    CONTACT: ("kontakt", "dane kontaktowe", "dane osobowe", "contact"),
+    INTERESTS: ("zainteresowania", "hobby", "interests"),
+    PROJECTS: ("projekty", "projects"),
+}
+
+# kinds found by segment_text, other headings only end the section before them
+TEXT_KINDS = (EXPERIENCE, EDUCATION, SKILLS, LANGUAGES, CERTIFICATES, MILITARY)
+# sections read as lists, see src/section_lists.py
+LIST_KINDS = (SKILLS, LANGUAGES, CERTIFICATES, MILITARY)
+# longer lines are never headings, no need to fold them
+MAX_HEADING_LENGTH = 40
+
+# "moje doświadczenie", "moja edukacja"
+_PREFIXES = ("moje ", "moja ", "moj ")
+
+_KIND_BY_HEADING: Dict[str, str] = {
+    patterns.ascii_fold(heading): kind
+    for kind, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+
+
+def heading_kind(line: str) -> Optional[str]:
+    """Section kind when the whole line is a known heading, else None."""
+    folded = " ".join(patterns.ascii_fold(line).replace(":", " ").split())
+    for prefix in _PREFIXES:
+        if folded.startswith(prefix):
+            folded = folded[len(prefix) :]
+            break
+    return _KIND_BY_HEADING.get(folded)
+
+
+def _heading(line: str) -> Optional[Tuple[str, int]]:
+    """
+    (kind, offset of the section text in the line) when the whole line,
+    "Doświadczenie zawodowe:", or its first column, "EDUKACJA<tab>Zakład
+    Produkcyjny 2010-2020", is a known heading.
+    """
+    cell, gap, _ = line.partition("\t")
+    if gap and len(cell) <= MAX_HEADING_LENGTH:
+        kind = heading_kind(cell)
+        if kind is not None:
+            return kind, len(cell) + 1
+    if len(line) <= MAX_HEADING_LENGTH:
+        kind = heading_kind(line)
+        if kind is not None:
+            return kind, len(line) + 1
+    return None
+
+
+def _starts_with_heading(line: str) -> bool:
+    """A short line without digits that starts with a known heading."""
+    if len(line) > MAX_HEADING_LENGTH or any(ch.isdigit() for ch in line):
+        return False
+    words = line.replace(":", " ").split()
+    return any(heading_kind(" ".join(words[:n])) for n in range(1, len(words)))
+
+
+# sections that also end at a line starting with a heading, e.g. education
+# at "KLUCZOWE UMIEJĘTNOŚCI I CECHY" or "Certyfikat Cisco"
+CLOSED_BY_PREFIX = (EXPERIENCE, EDUCATION)
+
+
+# a section as (start, end) offsets of its lines in the segmented text
+Span = Tuple[int, int]
+
+
+def segment_spans(text: str) -> Dict[str, List[Span]]:
+    """
+    Spans of the TEXT_KINDS sections, in one pass over the lines. A section
+    runs from its heading to the next heading line of any kind (see
+    _heading and CLOSED_BY_PREFIX), a kind whose heading repeats gets a
+    span per heading.
+    """
+    found: Dict[str, List[Span]] = {}
+    current: Optional[List[Span]] = None
+    current_kind: Optional[str] = None
+    start = 0
+    for line in text.split("\n"):
+        end = start + len(line)
+        heading = _heading(line)
+        if heading is None and current_kind in CLOSED_BY_PREFIX:
+            if _starts_with_heading(line):
+                heading = OTHER, len(line) + 1
+        if heading is not None:
+            current_kind, skip = heading
+            if current_kind in TEXT_KINDS:
+                current = found.setdefault(current_kind, [])
+                current.append((start + skip, max(start + skip, end)))
+            else:
+                current = None
+        elif current is not None:
+            current[-1] = (current[-1][0], end)
+        start = end + 1
+    return {kind: [s for s in spans if s[1] > s[0]] for kind, spans in found.items()}
+
+
+def section_text(text: str, spans: List[Span]) -> str:
+    return "\n".join(text[start:end] for start, end in spans).strip()
+
+
+def segment_text(text: str) -> Dict[str, str]:
+    """TEXT_KINDS sections of plain text, see segment_spans."""
+    return {
+        kind: section_text(text, spans) for kind, spans in segment_spans(text).items()
+    }
@@ -0,0 +1,164 @@
+import json
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from src.parser import Parser
+from src.profiling import ParseTimings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class ParserRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET  /health  -> {"status": "ok"}
+    POST /parse   -> CVParserSchema JSON
+
+    /parse accepts either a JSON body {"path": "..."} pointing at a file
+    under the server's root directory, or the raw file bytes. For raw
+    bytes the file type is taken from ?filename=cv.pdf (or the X-Filename
+    header). The time of every parse stage is sent in the Server-Timing
+    header.
+    """
+
+    server: "ParserServer"
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path != "/health":
+            self._send_json(404, {"error": "not found"})
+            return
+        self._send_json(
+            200, {"status": "ok", "model": self.server.parser.nlp.meta["name"]}
+        )
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        if url.path != "/parse":
+            self._send_json(404, {"error": "not found"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(400, {"error": "invalid Content-Length"})
+            return
+        body = self.rfile.read(length)
+        content_type = self.headers.get("Content-Type", "")
+
+        try:
+            if content_type.startswith("application/json"):
+                path = json.loads(body).get("path")
+                if self.server.root is None:
+                    self._send_json(403, {"error": "parsing by path is disabled"})
+                    return
+                path = self.server.resolve(path or "")
+                if path is None:
+                    self._send_json(403, {"error": "path outside the server root"})
+                    return
+                if not os.path.isfile(path):
+                    self._send_json(400, {"error": f"file not found: {path}"})
+                    return
+                result, timings = self.server.parse_path(path)
+            else:
+                filename = parse_qs(url.query).get("filename", [None])[0]
+                filename = filename or self.headers.get("X-Filename")
+                if not body:
+                    self._send_json(400, {"error": "empty request body"})
+                    return
+                result, timings = self.server.parse_upload(body, filename)
+        except Exception as e:
+            self._send_json(500, {"error": repr(e)})
+            return
+
+        self._send(
+            200,
+            result.encode("utf-8"),
+            {"Server-Timing": timings.server_timing(), "X-Cache": timings.cache},
+        )
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # the access log goes through logging instead of straight to stderr
+        logger.info("%s - " + format, self.address_string(), *args)
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def _send(
+        self, status: int, data: bytes, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class ParserServer(ThreadingHTTPServer):
+    """
+    HTTP server holding one Parser instance, so the spaCy model is loaded
+    once per process instead of once per CV. Files can be parsed by path
+    only under `root`, without it only uploads are accepted.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, parser: Parser, host: str, port: int, root: Optional[str] = None
+    ) -> None:
+        super().__init__((host, port), ParserRequestHandler)
+        self.parser = parser
+        self.root = os.path.realpath(root) if root else None
+        # spaCy pipelines and fitz documents are not safe to share between threads
+        self._lock = threading.Lock()
+
+    def resolve(self, path: str) -> Optional[str]:
+        """Real path of `path` (relative to root) or None if it leaves root."""
+        assert self.root is not None
+        real = os.path.realpath(os.path.join(self.root, path))
+        if os.path.commonpath([real, self.root]) != self.root:
+            return None
+        return real
+
+    def parse_path(self, path: str) -> Tuple[str, ParseTimings]:
+        timings = ParseTimings()
+        with self._lock:
+            cv = self.parser.parse_file(path, timings=timings)
+        return cv.model_dump_json(ensure_ascii=False), timings
+
+    def parse_upload(
+        self, data: bytes, filename: Optional[str]
+    ) -> Tuple[str, ParseTimings]:
+        # parsed straight from memory, nothing touches the disk
+        filetype = os.path.splitext(filename or "")[1].lstrip(".") or None
+        timings = ParseTimings()
+        with self._lock:
+            cv = self.parser.parse_bytes(data, filetype, timings=timings)
+        return cv.model_dump_json(ensure_ascii=False), timings
+
+
+def serve(
+    parser: Parser,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    root: Optional[str] = None,
+) -> None:
+    server = ParserServer(parser, host, port, root)
+    # load the model before the first request, not during it
+    parser.load()
+    logger.info("Parser server listening on http://%s:%d", host, server.server_port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
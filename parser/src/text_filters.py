@@ -0,0 +1,89 @@
+"""
+Character filters for the document text and names.
+
+Whether a character is kept depends only on the character, so the
+unicodedata.name lookup is done once per codepoint and cached in a table,
+not once per character of every document. Filtering then only looks at the
+distinct characters of a text and rewrites the few that change in one
+regex pass.
+"""
+
+import re
+import unicodedata
+from typing import Callable, Dict, Optional
+
+# bullets, dashes, ©, etc. kept in the document text
+KEPT_SYMBOLS = "•–—…«»©®°"
+# above this many distinct changed characters plain str.translate is cheaper
+MAX_REGEX_CHARS = 64
+
+
+class TranslateTable(Dict[int, Optional[str]]):
+    """
+    str.translate table filled on first use: `decide` maps a character to
+    its replacement, or to None to drop it.
+    """
+
+    def __init__(self, decide: Callable[[str], Optional[str]]) -> None:
+        super().__init__()
+        self._decide = decide
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        value = self._decide(chr(codepoint))
+        self[codepoint] = value
+        return value
+
+
+def _is_latin(ch: str) -> bool:
+    # Latin letters with accents (e.g., Polish, Czech, etc.)
+    name = unicodedata.name(ch, "")
+    return "LATIN" in name or "WITH" in name
+
+
+def _text_char(ch: str) -> Optional[str]:
+    if ord(ch) < 32 and ch not in ("\n", "\t"):
+        return None
+    if ord(ch) < 128 or _is_latin(ch) or ch in KEPT_SYMBOLS:
+        return ch
+    return None
+
+
+def _fullname_char(ch: str) -> Optional[str]:
+    if ch.isascii():
+        if ch.isalpha() or ch in " -":
+            return ch
+        return " " if ch in "\n\t" else None
+    return ch if _is_latin(ch) else None
+
+
+TEXT_TABLE = TranslateTable(_text_char)
+FULLNAME_TABLE = TranslateTable(_fullname_char)
+
+
+def apply_table(text: str, table: TranslateTable) -> str:
+    """Same as text.translate(table), but cost grows with the dropped characters."""
+    changed = {ch: table[ord(ch)] for ch in set(text)}
+    changed = {ch: out for ch, out in changed.items() if out != ch}
+    if not changed:
+        return text
+    if len(changed) > MAX_REGEX_CHARS:
+        # e.g. a CV in another script, a character class this big costs more
+        return text.translate(table)
+    chars = re.compile("[" + re.escape("".join(sorted(changed))) + "]")
+    return chars.sub(lambda m: changed[m.group()] or "", text)
+
+
+def remove_unwanted_unicode(text: str) -> str:
+    """
+    Keep only ASCII, common Latin letters with diacritics,
+    and punctuation/symbols useful in text.
+    Removes control characters and emoji-like symbols.
+    """
+    return apply_table(text, TEXT_TABLE)
+
+
+def remove_unwanted_chars_in_fullname(text: str) -> str:
+    """
+    Keep only ASCII letters, common Latin letters and spaces
+    """
+    return apply_table(text, FULLNAME_TABLE).strip()
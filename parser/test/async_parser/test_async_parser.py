@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import spacy
+
+import src.parser
+from src.async_parser import AsyncParser
+from src.parser import Parser
+
+DATA_DIR = (Path(__file__).parent / "../../../data").resolve()
+CVS = [DATA_DIR / "Johni3.pdf", DATA_DIR / "Johni3.docx", DATA_DIR / "wg-1.docx"]
+
+
+@pytest.fixture(autouse=True)
+def blank_model(monkeypatch):
+    # no trained model needed, the NER just finds nothing
+    blank = spacy.blank("pl")
+    monkeypatch.setattr(src.parser, "load_nlp", lambda profile: blank)
+
+
+def test_parse_one_matches_parse_file() -> None:
+    async def run():
+        async with AsyncParser() as parser:
+            return await parser.parse_one(CVS[0])
+
+    assert asyncio.run(run()) == Parser().parse_file(CVS[0])
+
+
+def test_parse_many_in_order_with_errors() -> None:
+    async def run():
+        async with AsyncParser(max_concurrency=2) as parser:
+            return await parser.parse_many([CVS[0], b"not a cv", CVS[1]])
+
+    first, broken, second = asyncio.run(run())
+
+    assert first == Parser().parse_file(CVS[0])
+    assert isinstance(broken, ValueError)
+    assert second == Parser().parse_file(CVS[1])
+
+
+def test_extraction_in_worker_processes() -> None:
+    async def run():
+        async with AsyncParser(extract_workers=2) as parser:
+            return await parser.parse_many(CVS)
+
+    results = asyncio.run(run())
+
+    sync = Parser()
+    assert results == [sync.parse_file(path) for path in CVS]
+
+
+def test_max_concurrency(monkeypatch) -> None:
+    in_flight = peak = 0
+    lock = threading.Lock()
+    read_input = Parser._read_input
+
+    def slow_read(self, *args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return read_input(self, *args, **kwargs)
+
+    monkeypatch.setattr(Parser, "_read_input", slow_read)
+
+    async def run():
+        async with AsyncParser(max_concurrency=2) as parser:
+            return await parser.parse_many(CVS * 2)
+
+    results = asyncio.run(run())
+
+    assert not any(isinstance(r, BaseException) for r in results)
+    assert peak == 2
+
+
+def test_timeout_leaves_the_loop_free(monkeypatch) -> None:
+    parsed = []
+    monkeypatch.setattr(Parser, "_extract_context", lambda *args: time.sleep(0.5))
+    monkeypatch.setattr(Parser, "_parse_context", lambda *args: parsed.append(args))
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        async with AsyncParser(timeout=0.1) as parser:
+            with pytest.raises(TimeoutError):
+                await parser.parse_one(CVS[0])
+        ticker.cancel()
+        return ticks
+
+    assert asyncio.run(run()) >= 5
+    # the extraction finished after the timeout, its result was dropped
+    assert parsed == []
+
+
+def test_cancel_parse_many(monkeypatch) -> None:
+    parsed = []
+    monkeypatch.setattr(Parser, "_extract_context", lambda *args: time.sleep(0.2))
+    monkeypatch.setattr(Parser, "_parse_context", lambda *args: parsed.append(args))
+
+    async def run():
+        async with AsyncParser() as parser:
+            task = asyncio.create_task(parser.parse_many(CVS))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(run())
+
+    assert parsed == []
+
+
+def test_invalid_concurrency() -> None:
+    with pytest.raises(ValueError):
+        AsyncParser(max_concurrency=0)
@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from src import batch
+from src.parser import Parser
+
+
+class FakeParser(Parser):
+    """A real Parser, minus the model and the documents."""
+
+    def load(self):
+        raise AssertionError("the batch tests never run the NLP")
+
+    def parse_many(self, paths, **kwargs):
+        return [
+            (ValueError("cannot open file") if "broken" in path else self.create_mock())
+            for path in paths
+        ]
+
+
+def test_collect_inputs_default_extensions(tmp_path) -> None:
+    for name in ["a.pdf", "b.DOCX", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "c.pdf").write_bytes(b"")
+
+    inputs = batch.collect_inputs(str(tmp_path), None)
+
+    assert [os.path.basename(p) for p in inputs] == ["a.pdf", "b.DOCX"]
+
+
+def test_collect_inputs_recursive_glob(tmp_path) -> None:
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "a.pdf").write_bytes(b"")
+    (tmp_path / "nested" / "c.pdf").write_bytes(b"")
+
+    inputs = batch.collect_inputs(str(tmp_path), "**/*.pdf")
+
+    assert [os.path.relpath(p, tmp_path) for p in inputs] == [
+        "a.pdf",
+        os.path.join("nested", "c.pdf"),
+    ]
+
+
+def test_parse_chunk_isolates_errors(monkeypatch) -> None:
+    monkeypatch.setattr(batch, "_worker_parser", FakeParser())
+
+    ok, broken = batch._parse_chunk(["cv.pdf", "broken.pdf"])
+
+    path, result, error = ok
+    assert path == "cv.pdf" and error is None and '"full_name":"UNDEFINED"' in result
+
+    path, result, error = broken
+    assert path == "broken.pdf" and result is None and "cannot open file" in error
+
+
+def test_run_batch_requires_single_output() -> None:
+    with pytest.raises(ValueError):
+        batch.run_batch([], 1)
+
+
+def test_jsonl_writer_streams_compact_records(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(batch, "_worker_parser", FakeParser())
+    out = tmp_path / "out.jsonl"
+    cv = str(tmp_path / "cv.pdf")
+
+    with batch.JsonlWriter(str(out), base_dir=str(tmp_path)) as writer:
+        writer.write_many(batch._parse_chunk([cv, "broken.pdf"]))
+        # flushed: readable before the writer is closed
+        ok, broken = batch.read_records(str(out))
+
+    assert ok["id"] == batch.file_id(cv, str(tmp_path))
+    assert (
+        ok["file"] == cv and ok["result"]["personal_info"]["full_name"] == "UNDEFINED"
+    )
+    assert "cannot open file" in broken["error"] and "result" not in broken
+    assert ", " not in out.read_text(encoding="utf-8").splitlines()[0][:40]
+
+
+def test_read_records_skips_incomplete_line(tmp_path) -> None:
+    out = tmp_path / "out.jsonl"
+    out.write_text('{"id":"a","file":"a.pdf","error":"x"}\n{"id":"b","fi', "utf-8")
+
+    assert [r["id"] for r in batch.read_records(str(out))] == ["a"]
+
+
+def test_file_id_is_stable(tmp_path, monkeypatch) -> None:
+    nested = tmp_path / "in" / "cv.pdf"
+    monkeypatch.chdir(tmp_path)
+
+    relative = batch.file_id(os.path.join("in", "cv.pdf"), "in")
+    absolute = batch.file_id(str(nested), str(tmp_path / "in"))
+
+    assert relative == absolute and len(relative) == 16
+    assert batch.file_id(str(tmp_path / "in" / "other.pdf"), "in") != relative
+
+
+def test_jsonl_writer_flushes_every_record(tmp_path) -> None:
+    out = tmp_path / "out.jsonl"
+
+    with batch.JsonlWriter(str(out)) as writer:
+        writer.write("a.pdf", None, "x")
+        assert [r["file"] for r in batch.read_records(str(out))] == ["a.pdf"]
+
+
+def test_jsonl_output_is_not_overwritten(tmp_path) -> None:
+    out = tmp_path / "out.jsonl"
+    out.write_text('{"id":"a","file":"a.pdf","error":"x"}\n', "utf-8")
+
+    with pytest.raises(batch.OutputExistsError):
+        batch.run_batch([], 1, output_jsonl=str(out))
+    assert len(batch.read_records(str(out))) == 1
+
+    with batch.JsonlWriter(str(out), overwrite=True):
+        pass
+    assert batch.read_records(str(out)) == []
@@ -0,0 +1,92 @@
+import os
+import time
+
+import src.parser
+from src.cache import ResultCache
+from src.parser import Parser
+from src.profiling import CACHE_HIT, ParseTimings
+
+
+def test_put_get(tmp_path) -> None:
+    cache = ResultCache(str(tmp_path))
+    key = cache.key(b"%PDF-1.7 ...", "1", "ner")
+
+    assert cache.get(key) is None
+    cache.put(key, '{"overview": "x"}')
+    assert cache.get(key) == '{"overview": "x"}'
+
+
+def test_key_depends_on_content_and_versions() -> None:
+    base = ResultCache.key(b"cv", "1", "ner", "catalogue-a")
+
+    assert base == ResultCache.key(b"cv", "1", "ner", "catalogue-a")
+    assert base != ResultCache.key(b"cv2", "1", "ner", "catalogue-a")
+    assert base != ResultCache.key(b"cv", "2", "ner", "catalogue-a")
+    assert base != ResultCache.key(b"cv", "1", "ner-sm", "catalogue-a")
+    assert base != ResultCache.key(b"cv", "1", "ner", "catalogue-b")
+
+
+def test_lru_eviction(tmp_path) -> None:
+    cache = ResultCache(str(tmp_path), max_bytes=25)
+    cache.put("a", "x" * 10)
+    cache.put("b", "x" * 10)
+    # make "a" older than "b", then read it so it becomes the most recent
+    past = time.time() - 60
+    os.utime(tmp_path / "a.json", (past, past))
+    os.utime(tmp_path / "b.json", (past + 1, past + 1))
+    assert cache.get("a") is not None
+
+    cache.put("c", "x" * 10)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_put_under_the_cap_does_not_scan(tmp_path, monkeypatch) -> None:
+    (tmp_path / "old.json").write_text("x" * 10)
+    past = time.time() - 60
+    os.utime(tmp_path / "old.json", (past, past))
+    cache = ResultCache(str(tmp_path), max_bytes=35)
+
+    def scan() -> None:
+        raise AssertionError("the directory was scanned under the cap")
+
+    monkeypatch.setattr(cache, "_entries", scan)
+    cache.put("a", "x" * 10)
+    # overwriting an entry replaces its size in the total
+    cache.put("a", "x" * 20)
+
+    monkeypatch.undo()
+    # the entry present at start counts, 10 + 20 + 10 goes over the cap
+    cache.put("b", "x" * 10)
+    assert cache.get("old") is None
+    assert cache.get("a") is not None and cache.get("b") is not None
+
+
+def test_invalidate(tmp_path) -> None:
+    cache = ResultCache(str(tmp_path))
+    cache.put("a", "{}")
+    cache.put("b", "{}")
+
+    cache.invalidate()
+
+    assert cache.get("a") is None and cache.get("b") is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_cache_hit_does_not_load_model(tmp_path, monkeypatch) -> None:
+    def load_nlp(profile: str) -> None:
+        raise AssertionError("the model was loaded on a cache hit")
+
+    monkeypatch.setattr(src.parser, "load_nlp", load_nlp)
+    data = b"%PDF-1.7 ..."
+    parser = Parser(cache_dir=str(tmp_path))
+    expected = parser.create_mock()
+    parser.cache.put(parser._cache_key(data), expected.model_dump_json())
+
+    timings = ParseTimings()
+    cv = Parser(cache_dir=str(tmp_path)).parse_bytes(data, "pdf", timings=timings)
+
+    assert cv == expected
+    assert timings.cache == CACHE_HIT
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from src.catalogue import load_catalogue
+
+
+def test_default_catalogue_keys() -> None:
+    catalogue = load_catalogue()
+
+    matched = catalogue.matcher.matched_keys("Mam prawo jazdy i lubię czytać")
+
+    assert matched == {
+        "zmechol_keywords.optional.driving_licence",
+        "zmechol_keywords.optional.reading",
+    }
+
+
+def test_empty_keywords_shape() -> None:
+    keywords = load_catalogue().empty_keywords()
+
+    assert set(keywords) == {"wajcha_keywords", "zmechol_keywords"}
+    assert keywords["wajcha_keywords"].required["has_higher_education"] is False
+    assert keywords["zmechol_keywords"].optional["reading"] is False
+
+
+def test_new_position_without_code_change(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    path.write_text(
+        json.dumps(
+            {
+                "positions": {
+                    "cook_keywords": {
+                        "title": "Kucharz polowy",
+                        "required": {"cooking": {"phrases": ["gotowanie"]}},
+                        "optional": {"baking": {"phrases": ["pieczenie chleba"]}},
+                    }
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    catalogue = load_catalogue(str(path))
+    keywords = catalogue.empty_keywords()
+
+    for key in catalogue.matcher.matched_keys("Lubię gotowanie i pieczenie chleba"):
+        catalogue.set_flag(keywords, key)
+
+    assert keywords["cook_keywords"].model_dump() == {
+        "required": {"cooking": True},
+        "optional": {"baking": True},
+    }
+
+
+def test_invalid_catalogue(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    path.write_text(
+        json.dumps({"positions": {"x": {"mandatory": {}}}}), encoding="utf-8"
+    )
+    with pytest.raises(ValueError):
+        load_catalogue(str(path))
+
+
+def test_version_follows_content(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    path.write_text(json.dumps({"positions": {}}), encoding="utf-8")
+    first = load_catalogue(str(path)).version
+    path.write_text(json.dumps({"positions": {"x": {}}}), encoding="utf-8")
+
+    assert load_catalogue(str(path)).version != first
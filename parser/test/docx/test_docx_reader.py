@@ -0,0 +1,81 @@
+import io
+import zipfile
+from pathlib import Path
+
+from src.docx_reader import clean_docx, read_docx_text
+
+DATA_DIR = (Path(__file__).parent / "../../../data").resolve()
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<w:document
+    xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">
+  <w:body>
+    <w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="4320"/></w:tabs></w:pPr><w:r><w:t>Jan</w:t></w:r><w:r><w:t xml:space="preserve"> Kowalski</w:t></w:r></w:p>
+    <w:p><w:r>
+      <mc:AlternateContent>
+        <mc:Choice><w:txbxContent><w:p><w:r><w:t>Doświadczenie</w:t></w:r></w:p></w:txbxContent></mc:Choice>
+        <mc:Fallback><w:txbxContent><w:p><w:r><w:t>Doświadczenie</w:t></w:r></w:p></w:txbxContent></mc:Fallback>
+      </mc:AlternateContent>
+    </w:r></w:p>
+    <w:tbl><w:tr>
+      <w:tc><w:p><w:r><w:t>2019</w:t><w:tab/><w:t>Operator wajchy</w:t></w:r></w:p></w:tc>
+      <w:tc><w:p><w:r><w:t>Gdańsk</w:t><w:br/><w:t>Polska</w:t></w:r></w:p></w:tc>
+    </w:tr></w:tbl>
+  </w:body>
+</w:document>
+"""
+
+
+def make_docx(footer: str = "") -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as docx:
+        docx.writestr("[Content_Types].xml", "<Types/>")
+        docx.writestr("word/document.xml", DOCUMENT)
+        docx.writestr("word/media/image1.png", b"\x89PNG" + b"\0" * 1024)
+        if footer:
+            docx.writestr(
+                "word/footer1.xml",
+                '<w:ftr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f"<w:p><w:r><w:t>{footer}</w:t></w:r></w:p></w:ftr>",
+            )
+    return buffer.getvalue()
+
+
+def test_read_text_in_document_order() -> None:
+    text = read_docx_text(make_docx(footer="strona 1"))
+
+    assert text.splitlines() == [
+        "Jan Kowalski",
+        "Doświadczenie",
+        "",
+        "2019\tOperator wajchy",
+        "Gdańsk",
+        "Polska",
+        "strona 1",
+    ]
+
+
+def test_tab_stops_are_not_text() -> None:
+    # the w:tab of w:pPr/w:tabs defines a tab stop, only a run's w:tab is a tab
+    assert read_docx_text(make_docx()).count("\t") == 1
+
+
+def test_fallback_text_is_skipped() -> None:
+    assert read_docx_text(make_docx()).count("Doświadczenie") == 1
+
+
+def test_clean_docx_drops_fallback_and_media() -> None:
+    with zipfile.ZipFile(io.BytesIO(clean_docx(make_docx()))) as docx:
+        names = docx.namelist()
+        document = docx.read("word/document.xml").decode("utf-8")
+
+    assert "word/media/image1.png" not in names
+    assert "[Content_Types].xml" in names
+    assert "mc:Fallback" not in document
+    assert document.count("Doświadczenie") == 1
+
+
+def test_fixtures_are_readable() -> None:
+    for path in sorted(DATA_DIR.glob("*.docx")):
+        assert read_docx_text(path.read_bytes()).strip(), path.name
@@ -0,0 +1,22 @@
+import pytest
+import spacy
+
+import src.parser
+from benchmark.synthetic_cv import CVSpec, to_pdf
+from src.parser import Parser
+
+
+@pytest.fixture(autouse=True)
+def blank_model(monkeypatch):
+    # no trained model needed, the NER just finds nothing
+    blank = spacy.blank("pl")
+    monkeypatch.setattr(src.parser, "load_nlp", lambda profile: blank)
+
+
+def test_field_of_study_running_into_the_next_date() -> None:
+    # "kierunek: logistyka" swallows the start of the next date line and
+    # cuts that date down to no year
+    cv = Parser().parse_bytes(to_pdf(CVSpec(education=2, keyword_density=0.5)))
+
+    assert cv.education
+    assert all(entry.start_date.year > 1900 for entry in cv.education)
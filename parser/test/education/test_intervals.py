@@ -0,0 +1,138 @@
+import random
+from typing import List, Tuple
+
+import pytest
+
+from src.intervals import (
+    Entity,
+    IntervalSweep,
+    cut_overlaps,
+    keep_longest,
+    merge_month_names,
+)
+
+LABELS = ("year", "date", "degree", "field_of_study", "orgName", "placeName")
+CUTTING = ("degree", "year", "field_of_study")
+
+
+# the nested loops of Parser._extract_education the sweep replaced
+def reference_merge(
+    entities: List[Entity], months: List[Tuple[int, int, str]], text: str
+) -> List[Entity]:
+    entities = list(entities)
+    for start, end, month_text in months:
+        merged = False
+        for i, (e_start, e_end, e_label, e_text) in enumerate(entities):
+            if e_label == "year" or e_label == "date" and abs(e_start - end) <= 3:
+                entities[i] = (start, e_end, "date", text[start:e_end])
+                merged = True
+                break
+            elif e_label == "year" or e_label == "date" and abs(start - e_end) <= 3:
+                entities[i] = (e_start, end, "date", text[e_start:end])
+                merged = True
+                break
+        if not merged:
+            entities.append((start, end, "date", month_text))
+    return entities
+
+
+def reference_cut(entities: List[Entity]) -> List[Entity]:
+    adjusted: List[Entity] = []
+    for start, end, label, text in entities:
+        if label in CUTTING:
+            overlaps = [
+                e
+                for e in adjusted
+                if not (end <= e[0] or start >= e[1]) and e[2] != "date"
+            ]
+            for o_start, o_end, o_label, o_text in overlaps:
+                if start > o_start:
+                    adjusted.append(
+                        (o_start, start, o_label, o_text[: start - o_start].strip())
+                    )
+                if end < o_end:
+                    adjusted.append(
+                        (end, o_end, o_label, o_text[end - o_start :].strip())
+                    )
+                adjusted.remove((o_start, o_end, o_label, o_text))
+        adjusted.append((start, end, label, text))
+    return adjusted
+
+
+def reference_keep_longest(entities: List[Entity]) -> List[Entity]:
+    kept: List[Entity] = []
+    for start, end, label, text in entities:
+        overlap = False
+        for o_start, o_end, o_label, o_text in kept:
+            if not (end <= o_start or start >= o_end):
+                overlap = True
+                if (end - start) > (o_end - o_start):
+                    kept.remove((o_start, o_end, o_label, o_text))
+                    kept.append((start, end, label, text))
+                break
+        if not overlap:
+            kept.append((start, end, label, text))
+    return kept
+
+
+def random_entities(rng: random.Random, text: str, n: int) -> List[Entity]:
+    entities = []
+    for _ in range(n):
+        start = rng.randrange(len(text))
+        end = min(len(text), start + rng.randrange(0, 25))
+        entities.append((start, end, rng.choice(LABELS), text[start:end]))
+    entities.sort(key=lambda e: e[0])
+    return entities
+
+
+def random_text(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice("abc xyz 2019 ") for _ in range(length))
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_merge_month_names_matches_loop(seed: int) -> None:
+    rng = random.Random(seed)
+    text = random_text(rng, 300)
+    entities = random_entities(rng, text, rng.randrange(0, 40))
+    months = []
+    for start, end, _, _ in random_entities(rng, text, rng.randrange(0, 15)):
+        months.append((start, end, text[start:end]))
+    assert merge_month_names(entities, months, text) == reference_merge(
+        entities, months, text
+    )
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_cut_overlaps_matches_loop(seed: int) -> None:
+    rng = random.Random(seed)
+    text = random_text(rng, 300)
+    entities = random_entities(rng, text, rng.randrange(0, 60))
+    assert cut_overlaps(entities, CUTTING) == reference_cut(entities)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_keep_longest_matches_loop(seed: int) -> None:
+    rng = random.Random(seed)
+    text = random_text(rng, 300)
+    entities = random_entities(rng, text, rng.randrange(0, 60))
+    assert keep_longest(entities) == reference_keep_longest(entities)
+
+
+def test_month_merges_with_first_year_at_any_distance() -> None:
+    text = "2015 liceum, styczeń 2019"
+    entities: List[Entity] = [(0, 4, "year", "2015"), (21, 25, "year", "2019")]
+    merged = merge_month_names(entities, [(13, 20, "styczeń")], text)
+    # kept from the original loop: the first year is taken, not the nearest
+    assert merged[0] == (13, 4, "date", "")
+    assert merged[1] == (21, 25, "year", "2019")
+
+
+def test_sweep_skips_removed_and_finished_items() -> None:
+    sweep = IntervalSweep()
+    first = sweep.add((0, 5, "orgName", "a"))
+    second = sweep.add((3, 10, "orgName", "b"))
+    sweep.add((4, 6, "date", "c"), searchable=False)
+    assert sweep.overlapping(4, 8) == [first, second]
+    sweep.remove(second)
+    assert sweep.overlapping(5, 8) == []
+    assert sweep.items() == [(0, 5, "orgName", "a"), (4, 6, "date", "c")]
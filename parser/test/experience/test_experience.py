@@ -0,0 +1,144 @@
+from datetime import date
+
+import pytest
+import spacy
+
+import src.parser
+from src import sections
+from src.experience import extract_jobs, job_entries
+from src.parser import Parser
+from src.profiling import ParseTimings
+
+
+@pytest.mark.parametrize(
+    "text, title, company",
+    [
+        # dates first, title and company after them on the same line
+        (
+            "wrzesień 2016– Operator wózka widłowego, Stary Makdonald sp. z o.o.\n"
+            "wrzesień 2025 Wspomaganie kucharzy w zaopatrzeniu towaru podczas",
+            "Operator wózka widłowego",
+            "Stary Makdonald sp. z o.o.",
+        ),
+        # title with dates, company on the next line
+        (
+            "Specjalista ds. finansowych - 2015 – 2024\n"
+            "Urząd Miasta Warszawy – Wydział Finansowy\n"
+            "• Prowadzenie ewidencji i rozliczeń finansowych jednostki",
+            "Specjalista ds. finansowych",
+            "Urząd Miasta Warszawy",
+        ),
+        # title and company above the dates
+        (
+            "Operator Wajchy Głównej\n"
+            "Fabryka Precyzyjnych Wajch Sp. z o.o.\n"
+            "2010 – obecnie\n"
+            "• 10 lat doświadczenia w obsłudze urządzeń mechanicznych,",
+            "Operator Wajchy Głównej",
+            "Fabryka Precyzyjnych Wajch Sp. z o.o.",
+        ),
+        # company with dates, a known job name on the next line
+        (
+            "OutPost styczeń 2022 - sierpień 2023\n"
+            "Kurier\n"
+            "Dostarczanie przesyłek w mieście i poza nim.",
+            "Kurier",
+            "OutPost",
+        ),
+    ],
+    ids=["dates-first", "company-after", "dates-last", "title-after"],
+)
+def test_header_layouts(text: str, title: str, company: str) -> None:
+    [job] = extract_jobs(text)
+    assert job.job_title == title
+    assert job.company == company
+
+
+def test_dates_in_two_columns() -> None:
+    text = (
+        "Czerw 2012 Operator wajchy w firmie rodzinnej\n"
+        "Wrzes 2022 Horni sp z.o.o\n"
+        "Rozróżnianie kolorów wajch.\n"
+        "\n"
+        "Wrzes 2022 Inwestor\n"
+        "do teraz Samo-zatrudniony\n"
+        "Kłócenie się z innymi."
+    )
+    first, second = extract_jobs(text)
+    assert (first.start_date, first.end_date) == (date(2012, 6, 1), date(2022, 9, 30))
+    assert first.company == "Horni sp z.o.o"
+    assert (second.start_date, second.end_date) == (date(2022, 9, 1), None)
+    assert (second.job_title, second.company) == ("Inwestor", "Samo-zatrudniony")
+
+
+def test_numeric_months_and_wrapped_date() -> None:
+    [numeric] = extract_jobs("01.2019 - 03.2021 Kierowca, Trans sp. z o.o.")
+    assert (numeric.start_date, numeric.end_date) == (
+        date(2019, 1, 1),
+        date(2021, 3, 31),
+    )
+
+    [wrapped] = extract_jobs("Instytut Badawczy – Laborant, Marzec 2006 – Lipiec\n2007")
+    assert wrapped.end_date == date(2007, 7, 31)
+    assert wrapped.company == "Instytut Badawczy"
+
+
+def test_ner_entities_pick_company_and_drop_places() -> None:
+    text = "Operator wajchy Gdańsk, Pomorskie\nWajchex Czerwiec 2012 – Wrzesień 2022"
+    [job] = extract_jobs(text, orgs={"Wajchex"}, places={"Gdańsk", "Pomorskie"})
+    assert (job.job_title, job.company) == ("Operator wajchy", "Wajchex")
+
+
+def test_stops_at_next_section() -> None:
+    text = (
+        "Nie mam :3\n" "\n" "MOJE NAUCZANIE\n" "Żłobek Przedszkole\n" "2002 2004 2006"
+    )
+    assert job_entries(text) == []
+
+
+def test_description_years_do_not_start_entries() -> None:
+    text = (
+        "2015 – 2024 Magazynier, Hurtownia Kowalski\n"
+        "• W 2019 roku wdrożenie nowego systemu magazynowego"
+    )
+    assert len(extract_jobs(text)) == 1
+
+
+@pytest.mark.parametrize("layout", [False, True])
+def test_parser_passes_only_entities_of_the_section(monkeypatch, layout) -> None:
+    def load_nlp(profile):
+        nlp = spacy.blank("pl")
+        ruler = nlp.add_pipe("entity_ruler")
+        ruler.add_patterns(
+            [
+                {"label": "orgName", "pattern": "Klub Wajchowców"},
+                {"label": "orgName", "pattern": "Wajchex"},
+            ]
+        )
+        return nlp
+
+    seen = {}
+
+    def extract(text, orgs, places):
+        seen["orgs"] = orgs
+        return []
+
+    monkeypatch.setattr(src.parser, "load_nlp", load_nlp)
+    monkeypatch.setattr(src.parser.experience, "extract_jobs", extract)
+    parser = Parser()
+    columns = (
+        "Jan Kowalski\nPrezes, Klub Wajchowców\n"
+        "Doświadczenie\nOperator wajchy\nWajchex 2012 – 2022"
+    )
+    layout_sections = (
+        {sections.EXPERIENCE: "Operator wajchy\nWajchex 2012 – 2022"}
+        if layout
+        else None
+    )
+    [ctx] = parser._build_contexts(
+        [parser._make_context(columns, ParseTimings(), layout_sections)]
+    )
+
+    parser._extract_work_experience(ctx)
+
+    assert seen["orgs"] == {"Wajchex"}
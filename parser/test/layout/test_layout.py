@@ -0,0 +1,80 @@
+import fitz
+
+from src import sections
+from src.layout import extract_layout
+from src.sections import heading_kind
+
+
+def make_pdf(lines: list[tuple[str, bool]]) -> bytes:
+    """
+    One text block per (text, is_heading) line, headings bold and bigger.
+    Base-14 fonts have no Polish letters, so the texts stay ASCII.
+    """
+    doc = fitz.open()
+    page = doc.new_page()
+    y = 60
+    for text, heading in lines:
+        fontname, size = ("hebo", 14) if heading else ("helv", 10)
+        page.insert_text((60, y), text, fontname=fontname, fontsize=size)
+        y += 40
+    return bytes(doc.tobytes())
+
+
+def test_heading_kind() -> None:
+    assert heading_kind("Doświadczenie zawodowe:") == sections.EXPERIENCE
+    assert heading_kind("MOJE DOŚWIADCZENIE") == sections.EXPERIENCE
+    assert heading_kind("Moja edukacja") == sections.EDUCATION
+    assert heading_kind("Doświadczenie wojskowe") == sections.MILITARY
+    assert heading_kind("Doświadczenie w obsłudze wajchy") is None
+
+
+def test_sections_by_layout() -> None:
+    data = make_pdf(
+        [
+            ("Jan Kowalski", False),
+            ("Doswiadczenie", True),
+            ("Operator wajchy 2010 - 2020", False),
+            ("Wolontariat", True),
+            ("Wajcha dwustopniowa", False),
+            ("Edukacja", True),
+            ("Politechnika Gdanska 2005", False),
+        ]
+    )
+
+    layout = extract_layout(data, "pdf")
+
+    assert layout.sections == {
+        sections.HEADER: "Jan Kowalski",
+        sections.EXPERIENCE: "Operator wajchy 2010 - 2020",
+        sections.OTHER: "Wajcha dwustopniowa",
+        sections.EDUCATION: "Politechnika Gdanska 2005",
+    }
+    assert layout.text.split("\n\n")[:3] == [
+        "Jan Kowalski",
+        "Doswiadczenie",
+        "Operator wajchy 2010 - 2020",
+    ]
+
+
+def test_body_styled_lines_are_not_headings() -> None:
+    data = make_pdf(
+        [
+            ("Doswiadczenie", False),
+            ("Wolontariat", False),
+            ("Operator wajchy", False),
+        ]
+    )
+
+    assert extract_layout(data, "pdf").sections == {
+        sections.EXPERIENCE: "Wolontariat\n\nOperator wajchy"
+    }
+
+
+def test_max_pages() -> None:
+    doc = fitz.open()
+    for i in range(3):
+        doc.new_page().insert_text((60, 60), f"Strona {i + 1}")
+
+    assert extract_layout(bytes(doc.tobytes()), "pdf", max_pages=2).text == (
+        "Strona 1\n\nStrona 2"
+    )
@@ -0,0 +1,15 @@
+import pytest
+
+from src.parser import NER_UNUSED_COMPONENTS, load_nlp
+
+
+def test_unknown_profile() -> None:
+    with pytest.raises(ValueError):
+        load_nlp("does-not-exist")
+
+
+def test_ner_profile_drops_unused_components() -> None:
+    nlp = load_nlp("ner")
+
+    assert "ner" in nlp.pipe_names
+    assert not set(NER_UNUSED_COMPONENTS) & set(nlp.pipe_names)
@@ -0,0 +1,82 @@
+import io
+import zipfile
+
+import spacy
+
+import src.parser
+from src.odt_reader import is_odt, read_odt_text
+from src.parser import Parser
+
+CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<office:document-content
+    xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+    xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+    xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+    xmlns:draw="urn:oasis:names:tc:opendocument:xmlns:drawing:1.0">
+  <office:automatic-styles/>
+  <office:body><office:text>
+    <text:h>Jan <text:span>Kowalski</text:span></text:h>
+    <text:p>Operator<text:s text:c="3"/>wajchy<text:tab/>2019<text:line-break/>Gdańsk</text:p>
+    <text:p><draw:frame><draw:text-box><text:p>Doświadczenie</text:p></draw:text-box></draw:frame>Zakotwiczony akapit</text:p>
+    <text:p>Tekst<office:annotation><text:p>komentarz</text:p></office:annotation> z komentarzem<text:note><text:note-body><text:p>przypis</text:p></text:note-body></text:note></text:p>
+    <text:list><text:list-item><text:p>Angielski</text:p></text:list-item></text:list>
+    <table:table><table:table-row>
+      <table:table-cell><text:p>2020</text:p></table:table-cell>
+      <table:table-cell><text:p>Politechnika Gdańska</text:p></table:table-cell>
+    </table:table-row></table:table>
+  </office:text></office:body>
+</office:document-content>
+"""
+
+
+def make_odt(content: str = CONTENT) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as odt:
+        odt.writestr(
+            "mimetype",
+            "application/vnd.oasis.opendocument.text",
+            compress_type=zipfile.ZIP_STORED,
+        )
+        odt.writestr("content.xml", content, compress_type=zipfile.ZIP_DEFLATED)
+    return buffer.getvalue()
+
+
+def test_read_text_in_document_order() -> None:
+    assert read_odt_text(make_odt()).splitlines() == [
+        "Jan Kowalski",
+        "Operator   wajchy\t2019",
+        "Gdańsk",
+        "Doświadczenie",
+        "Zakotwiczony akapit",
+        "Tekst z komentarzem",
+        "Angielski",
+        "2020",
+        "Politechnika Gdańska",
+    ]
+
+
+def test_is_odt() -> None:
+    assert is_odt(make_odt())
+    assert not is_odt(b"%PDF-1.7")
+
+    docx = io.BytesIO()
+    with zipfile.ZipFile(docx, "w") as archive:
+        archive.writestr("word/document.xml", "<w:document/>")
+    assert not is_odt(docx.getvalue())
+
+
+def test_parse_odt_saved_as_pdf(tmp_path, monkeypatch) -> None:
+    # the backend saves every upload as input-*.pdf, the content decides
+    monkeypatch.setattr(src.parser, "load_nlp", lambda profile: spacy.blank("pl"))
+    path = tmp_path / "input-123.pdf"
+    path.write_bytes(
+        make_odt(
+            CONTENT.replace(
+                "<text:h>Jan", "<text:p>jan.kowalski@example.pl</text:p><text:h>Jan"
+            )
+        )
+    )
+
+    cv = Parser().parse_file(str(path))
+
+    assert cv.personal_info.contact.email == "jan.kowalski@example.pl"
@@ -0,0 +1,45 @@
+import fitz
+import pytest
+
+from src.page_text import PARALLEL_MIN_PAGES, PageExtractor, _split
+
+
+def make_pdf(n_pages: int) -> bytes:
+    doc = fitz.open()
+    for i in range(n_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Strona {i + 1}")
+        page.insert_text((72, 100), "Doświadczenie")
+    return bytes(doc.tobytes())
+
+
+def test_split_keeps_order_and_covers_all_pages() -> None:
+    assert _split(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert _split(2, 4) == [(0, 1), (1, 2)]
+
+
+def test_parallel_matches_serial() -> None:
+    data = make_pdf(PARALLEL_MIN_PAGES + 5)
+    serial = PageExtractor().pages(data, "pdf")
+    extractor = PageExtractor(workers=3)
+    try:
+        parallel = extractor.pages(data, "pdf")
+    finally:
+        extractor.close()
+
+    assert parallel == serial
+    assert [text.split("\n")[0] for text in parallel] == [
+        f"Strona {i + 1}" for i in range(PARALLEL_MIN_PAGES + 5)
+    ]
+
+
+def test_max_pages_stops_early() -> None:
+    pages = PageExtractor(max_pages=2).pages(make_pdf(40), "pdf")
+
+    assert len(pages) == 2
+    assert pages[1].startswith("Strona 2")
+
+
+def test_max_pages_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        PageExtractor(max_pages=0)
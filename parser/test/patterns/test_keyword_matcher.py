@@ -0,0 +1,38 @@
+from src.keyword_matcher import KeywordMatch, KeywordMatcher
+
+
+def test_single_pass_reports_all_keys_with_offsets() -> None:
+    matcher = KeywordMatcher(
+        {
+            "forklift": ["wózek widłowy"],
+            "school": ["szkoła", "szkoła podstawowa"],
+            "primary": ["szkoła podstawowa"],
+        }
+    )
+    text = "Ukończona Szkoła Podstawowa, uprawnienia na wózek widłowy."
+
+    matches = matcher.find_all(text)
+
+    assert KeywordMatch("school", "szkoła", 10, 16) in matches
+    assert KeywordMatch("school", "szkoła podstawowa", 10, 27) in matches
+    assert KeywordMatch("primary", "szkoła podstawowa", 10, 27) in matches
+    assert KeywordMatch("forklift", "wózek widłowy", 44, 57) in matches
+    assert text[44:57] == "wózek widłowy"
+
+
+def test_word_boundaries_match_regex_semantics() -> None:
+    matcher = KeywordMatcher({"run": ["bieg"], "lic": ["lic."]})
+
+    assert matcher.matched_keys("lubię bieg.") == {"run"}
+    assert matcher.matched_keys("przebieg, biegacz") == set()
+    # like \blic\.\b the dot has to be followed by a word character
+    assert matcher.matched_keys("lic. informatyka") == set()
+    assert matcher.matched_keys("lic.informatyka") == {"lic"}
+
+
+def test_separators_must_match_exactly() -> None:
+    matcher = KeywordMatcher({"push_ups": ["push-ups", "push ups"]})
+
+    assert matcher.matched_keys("PUSH-UPS") == {"push_ups"}
+    assert matcher.matched_keys("push ups") == {"push_ups"}
+    assert matcher.matched_keys("push - ups") == set()
@@ -0,0 +1,42 @@
+from src import patterns
+
+
+def month_years(text: str) -> list[tuple[int, int]]:
+    return [
+        (int(m.group(2)), patterns.MONTHS_FOLDED[m.group(1).lower()][0])
+        for m in patterns.MONTH_NAME_YEAR.finditer(patterns.ascii_fold(text))
+    ]
+
+
+def test_ascii_fold() -> None:
+    assert patterns.ascii_fold("Październik WRZESIEŃ") == "pazdziernik wrzesien"
+
+
+def test_month_name_year_single_pass() -> None:
+    text = "Wrzesień 2019 - czerwiec 2023, paź 2020, Lis. 2021, May 2018"
+    assert month_years(text) == [(2019, 9), (2023, 6), (2020, 10), (2018, 5)]
+
+
+def test_month_name_requires_whole_word() -> None:
+    # "mar" must not match inside "marca", "marca" itself is a month
+    assert month_years("marca 2020") == [(2020, 3)]
+    assert month_years("smar 2020") == []
+
+
+def test_words_match_pyparsing() -> None:
+    from pyparsing import Combine, SkipTo, Word, pyparsing_unicode as ppu
+
+    alphas = ppu.Latin1.alphas + ppu.LatinA.alphas + ppu.LatinB.alphas
+    assert set(patterns.BASE_ALPHAS) == set(alphas)
+
+    text = "Jan Kowalski-Nowak, ur. 1990r.\n\nZnam  język ǅ i ŉ.\n\n\nKoniec"
+    assert patterns.BASE_WORD.findall(text) == [
+        t[0] for t in Word(alphas).searchString(text)
+    ]
+    assert patterns.NAME_WORD.findall(text) == [
+        t[0] for t in Word(alphas + "-").searchString(text)
+    ]
+    paragraphs = Combine(SkipTo("\n\n", include=False) + "\n\n")
+    assert [m.group(1).strip() for m in patterns.PARAGRAPH.finditer(text)] == [
+        res[0].strip() for res, _, _ in paragraphs.scanString(text)
+    ]
@@ -1,7 +1,9 @@
 import json
 import pytest
 from pathlib import Path
-from src.parser import Parser
+from benchmark.synthetic_cv import CVSpec, to_docx, to_pdf
+from src.parser import Parser, raw_text_log
+from src.profiling import ParseTimings
 
 # Paths
 BASE_DIR = Path(__file__).parent
@@ -16,11 +18,16 @@ all_pdfs = {pdf.name: pdf for pdf in PDF_DIR.glob("*.pdf")}
 test_pdfs = {name: path for name, path in all_pdfs.items() if name in EXPECTED}
 
 
+@pytest.fixture(scope="module")
+def parser():
+    # loading the spaCy model dominates a parse, load it once for the module
+    return Parser()
+
+
 @pytest.mark.parametrize(
     "pdf_name, pdf_path", list(test_pdfs.items()), ids=list(test_pdfs.keys())
 )
-def test_parser_results(pdf_name, pdf_path):
-    parser = Parser()
+def test_parser_results(parser, pdf_name, pdf_path):
     cv = parser.parse_file(pdf_path)
     expected_data = EXPECTED[pdf_name]
 
@@ -33,6 +40,96 @@ def test_parser_results(pdf_name, pdf_path):
     assert_dict_recursive(result_dict, expected_data, path=pdf_name)
 
 
+def test_parse_many_matches_parse_file(parser):
+    names = list(test_pdfs.keys())
+    results = parser.parse_many([test_pdfs[name] for name in names], batch_size=4)
+
+    assert len(results) == len(names)
+    for name, cv in zip(names, results):
+        assert not isinstance(cv, Exception), f"{name}: {cv!r}"
+        assert_dict_recursive(cv.model_dump(mode="json"), EXPECTED[name], path=name)
+
+
+def test_cached_result_matches(tmp_path):
+    parser = Parser(cache_dir=str(tmp_path))
+    name, path = next(iter(test_pdfs.items()))
+
+    first = parser.parse_file(path)
+    second = parser.parse_file(path)
+
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    assert second == first
+    assert_dict_recursive(second.model_dump(mode="json"), EXPECTED[name], path=name)
+
+
+def test_timings_of_every_stage(tmp_path):
+    parser = Parser(cache_dir=str(tmp_path))
+    path = next(iter(test_pdfs.values()))
+
+    first, second = ParseTimings(), ParseTimings()
+    parser.parse_file(path, timings=first)
+    parser.parse_file(path, timings=second)
+
+    assert first.cache == "miss"
+    for stage in ("read", "text", "sections", "nlp", "education", "skills", "cache"):
+        assert stage in first.seconds
+    assert second.cache == "hit"
+    assert "nlp" not in second.seconds
+
+
+def test_parse_bytes_matches_parse_file(parser):
+    name, path = next(iter(test_pdfs.items()))
+    data = path.read_bytes()
+
+    from_bytes = parser.parse_bytes(data, "pdf")
+    with open(path, "rb") as f:
+        from_stream = parser.parse_file(f)
+
+    assert from_bytes == parser.parse_file(path)
+    assert from_stream == from_bytes
+
+
+def test_parse_prints_nothing(parser, capsys):
+    parser.parse_file(next(iter(test_pdfs.values())))
+
+    assert capsys.readouterr().out == ""
+
+
+def test_raw_text_log(parser, tmp_path):
+    name, path = next(iter(test_pdfs.items()))
+
+    cv = parser.parse_file(path, enable_log=True, log_output=str(tmp_path))
+
+    raw = (tmp_path / f"raw-{name}.txt").read_text(encoding="utf-8")
+    assert cv.personal_info.contact.email in raw
+    assert not raw_text_log.handlers and raw_text_log.propagate
+
+
+def test_docx_parse_writes_nothing(parser, tmp_path):
+    docx = tmp_path / "cv.docx"
+    docx.write_bytes(PDF_DIR.joinpath("Johni1.docx").read_bytes())
+
+    parser.parse_file(docx)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["cv.docx"]
+
+
+@pytest.mark.parametrize(
+    "render, spec",
+    [
+        (to_pdf, CVSpec()),
+        (to_docx, CVSpec(education=4, seed=1)),
+        (to_pdf, CVSpec(pages=3, education=6, keyword_density=1.0, seed=2)),
+    ],
+    ids=["pdf", "docx", "pdf-long"],
+)
+def test_synthetic_cv(parser, render, spec):
+    cv = parser.parse_bytes(render(spec))
+
+    assert cv.personal_info.contact.email.endswith("@example.pl")
+    assert cv.work_experience and cv.education
+
+
 def assert_list_recursive(actual: list, expected: list, path="root"):
     for index, (actual_item, expected_item) in enumerate(zip(actual, expected)):
         current_path = f"{path}[{index}]"
@@ -0,0 +1,72 @@
+import io
+import pstats
+import tracemalloc
+
+import pytest
+
+from src.profiling import CACHE_HIT, ParseTimings, profiled
+
+
+def test_stages_in_order_and_accumulated() -> None:
+    timings = ParseTimings()
+    with timings.stage("read"):
+        pass
+    with timings.stage("cache"):
+        pass
+    with timings.stage("cache"):
+        pass
+    timings.cache = CACHE_HIT
+
+    assert list(timings.seconds) == ["read", "cache"]
+    assert timings.total == sum(timings.seconds.values())
+    assert timings.allocated == {}
+    out = timings.to_dict()
+    assert out["cache"] == "hit"
+    assert list(out["stages_ms"]) == ["read", "cache"]
+    assert "allocated_bytes" not in out
+
+
+def test_stage_timed_when_it_raises() -> None:
+    timings = ParseTimings()
+    with pytest.raises(ValueError):
+        with timings.stage("text"):
+            raise ValueError("broken file")
+
+    assert "text" in timings.seconds
+
+
+def test_allocations_while_tracing() -> None:
+    timings = ParseTimings()
+    tracemalloc.start()
+    try:
+        with timings.stage("text"):
+            data = [bytearray(1024) for _ in range(100)]
+    finally:
+        tracemalloc.stop()
+
+    assert len(data) == 100
+    assert timings.allocated["text"] >= 100 * 1024
+    assert timings.to_dict()["allocated_bytes"]["text"] >= 100 * 1024
+
+
+def test_server_timing_header() -> None:
+    timings = ParseTimings(seconds={"text": 0.0125, "personal_info.full_name": 0.001})
+
+    assert timings.server_timing() == (
+        "text;dur=12.500, personal_info-full_name;dur=1.000"
+    )
+
+
+def test_profiled_dump(tmp_path) -> None:
+    path = tmp_path / "parse.prof"
+    with profiled(str(path)):
+        sorted(range(1000), reverse=True)
+
+    report = io.StringIO()
+    pstats.Stats(str(path), stream=report).print_stats()
+    assert "builtins.sorted" in report.getvalue()
+
+
+def test_profiled_none_is_a_no_op() -> None:
+    with profiled(None):
+        pass
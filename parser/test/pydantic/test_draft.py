@@ -0,0 +1,98 @@
+from datetime import date
+
+import pytest
+import spacy
+from pydantic import ValidationError
+
+import src.parser
+from src import draft, schema
+from src.parser import Parser
+
+
+def filled_draft() -> draft.CV:
+    cv = draft.CV(
+        keywords={
+            "magazynier": schema.PositionKeywords(
+                required={"has_higher_education": True}, optional={}
+            )
+        }
+    )
+    cv.personal_info.full_name = "Jan Kowalski"
+    cv.personal_info.contact.email = "jan.kowalski@example.pl"
+    cv.education = [
+        draft.Education(
+            "Magister", "Politechnika Gdańska", date(2010, 10, 1), None, "informatyka"
+        )
+    ]
+    cv.work_experience = [
+        draft.WorkExperience("Magazynier", "Wajchex sp. z o.o.", date(2015, 3, 1))
+    ]
+    cv.languages = [draft.Language("Polski", "native")]
+    cv.military_experience = [
+        draft.MilitaryExperience(
+            "Szeregowy", "Wojska Lądowe", date(1999, 1, 1), None, ["Warta"]
+        )
+    ]
+    return cv
+
+
+def test_to_schema_keeps_every_field() -> None:
+    cv = draft.to_schema(filled_draft())
+
+    assert isinstance(cv.education[0], schema.Education)
+    assert cv.personal_info.contact.email == "jan.kowalski@example.pl"
+    assert cv.education[0].field_of_study == "informatyka"
+    assert cv.military_experience and cv.military_experience[0].duties == ["Warta"]
+    assert cv.keywords["magazynier"].required == {"has_higher_education": True}
+
+
+def test_construct_matches_validation() -> None:
+    assert draft.construct(filled_draft()) == draft.to_schema(filled_draft())
+    assert draft.construct(draft.CV()) == draft.to_schema(draft.CV())
+
+
+def test_to_schema_validates_the_whole_draft() -> None:
+    cv = filled_draft()
+    cv.languages.append(draft.Language("Angielski", "excellent"))
+
+    with pytest.raises(ValidationError, match=r"languages\.1\.proficiency"):
+        draft.to_schema(cv)
+
+
+def cv_pdf(*lines: str) -> bytes:
+    import fitz
+
+    doc = fitz.open()
+    page = doc.new_page()
+    for n, line in enumerate(lines):
+        page.insert_text((50, 72 + 20 * n), line)
+    return bytes(doc.tobytes())
+
+
+@pytest.mark.parametrize(
+    "email",
+    [
+        "jan@firma.local",
+        "jan..kowalski@example.com",
+        ".jan@wp.pl",
+        "jan.@wp.pl",
+    ],
+    ids=["local", "dots", "lead", "trail"],
+)
+def test_parse_keeps_placeholder_for_invalid_email(monkeypatch, email) -> None:
+    # the pattern matches these, the schema rejects them
+    monkeypatch.setattr(src.parser, "load_nlp", lambda profile: spacy.blank("pl"))
+
+    cv = Parser().parse_bytes(cv_pdf("Jan Kowalski", email, "+48 600 100 200"))
+
+    assert cv.personal_info.contact.email == draft.MOCK_EMAIL
+
+
+def test_parse_takes_first_valid_email(monkeypatch) -> None:
+    monkeypatch.setattr(src.parser, "load_nlp", lambda profile: spacy.blank("pl"))
+
+    cv = Parser().parse_bytes(
+        cv_pdf("jan@firma.local", "jan.kowalski@example.pl", "jan@example.com")
+    )
+
+    assert cv.personal_info.contact.email == "jan.kowalski@example.pl"
@@ -0,0 +1,179 @@
+from datetime import date
+
+import pytest
+
+from src import sections
+from src.parser import Parser
+from src.profiling import ParseTimings
+from src.section_lists import (
+    extract,
+    extract_certifications,
+    extract_languages,
+    extract_military,
+    list_items,
+)
+
+
+@pytest.mark.parametrize(
+    "text, items",
+    [
+        # one item per line, bullets dropped, a wrapped line joined back
+        (
+            "• Obsługa komputera i systemów ERP\n"
+            "• Podstawowa wiedza techniczna (szkolenia BHP, obsługa urządzeń\n"
+            "i magazynowych)\n"
+            "• Prawo jazdy kat. B",
+            [
+                "Obsługa komputera i systemów ERP",
+                "Podstawowa wiedza techniczna (szkolenia BHP, obsługa urządzeń"
+                " i magazynowych)",
+                "Prawo jazdy kat. B",
+            ],
+        ),
+        # a lowercase list stays one item per line
+        (
+            "parzenie kawy\nzadawanie pytań",
+            ["parzenie kawy", "zadawanie pytań"],
+        ),
+        # items separated within lines
+        (
+            "Python | SQL | Docker\nExcel • Word",
+            ["Python", "SQL", "Docker", "Excel", "Word"],
+        ),
+        # a comma separated list wrapped over two lines
+        (
+            "znajomość nazw kolorów, wysokie umiejętności miękkie, parzenie\n"
+            "kawy, zadawanie pytań",
+            [
+                "znajomość nazw kolorów",
+                "wysokie umiejętności miękkie",
+                "parzenie kawy",
+                "zadawanie pytań",
+            ],
+        ),
+        # columns separated by a gap (a tab), a row is not a wrapped line
+        (
+            "Nagroda Darwina\tOrder uśmiechu\tCertyfikat okropnego inwestora\n"
+            "parzenie kawy\tzadawanie pytań",
+            [
+                "Nagroda Darwina",
+                "Order uśmiechu",
+                "Certyfikat okropnego inwestora",
+                "parzenie kawy",
+                "zadawanie pytań",
+            ],
+        ),
+        # the list ends at a heading-like line and at a footer
+        (
+            "Spawanie\nHOBBY\nWędkarstwo",
+            ["Spawanie"],
+        ),
+        (
+            "Spawanie\n©AZURIUS - My-resume-templates.com",
+            ["Spawanie"],
+        ),
+    ],
+    ids=["bullets", "lowercase", "separated", "commas", "columns", "heading", "footer"],
+)
+def test_list_items(text: str, items: list[str]) -> None:
+    assert list_items(text) == items
+
+
+def test_languages_with_levels() -> None:
+    languages = extract_languages("Angielski (C2)\nNiemiecki - podstawowy\nPolski")
+
+    assert [(lang.language, lang.proficiency) for lang in languages] == [
+        ("Angielski", "fluent"),
+        ("Niemiecki", "basic"),
+        ("Polski", "native"),
+    ]
+
+
+def test_languages_levels_in_a_second_column() -> None:
+    languages = extract_languages("Angielski: Francuski:\nC1 B2\nesperanto")
+
+    assert [(lang.language, lang.proficiency) for lang in languages] == [
+        ("Angielski", "fluent"),
+        ("Francuski", "conversational"),
+        ("Esperanto", "unknown"),
+    ]
+
+
+def test_certifications() -> None:
+    certifications = extract_certifications(
+        "Certyfikat SEP do 1 kV – Urząd Dozoru Technicznego\n"
+        "CCNA (Cisco) 2019\n"
+        "Kurs pierwszej pomocy"
+    )
+
+    assert [(c.name, c.issuing_organization) for c in certifications] == [
+        ("Certyfikat SEP do 1 kV", "Urząd Dozoru Technicznego"),
+        ("CCNA", "Cisco"),
+        ("Kurs pierwszej pomocy", "UNKNOWN"),
+    ]
+
+
+def test_military_service() -> None:
+    service = extract_military(
+        "Kapral, Brygada Zmechanizowana\n"
+        "2010 – 2014\n"
+        "Wojska Lądowe\n"
+        "• Dowodzenie drużyną\n"
+        "• Szkolenie strzeleckie\n"
+        "Starszy szeregowy\n"
+        "marzec 2015 - obecnie\n"
+        "• Służba wartownicza"
+    )
+
+    assert len(service) == 2
+    assert service[0].rank == "Kapral"
+    assert service[0].branch == "Wojska Lądowe"
+    assert service[0].start_date == date(2010, 1, 1)
+    assert service[0].end_date == date(2014, 12, 31)
+    assert service[0].duties == ["Dowodzenie drużyną", "Szkolenie strzeleckie"]
+    assert service[1].rank == "Starszy szeregowy"
+    assert service[1].branch == "UNKNOWN"
+    assert service[1].start_date == date(2015, 3, 1)
+    assert service[1].end_date is None
+    assert service[1].duties == ["Służba wartownicza"]
+
+
+def test_extract_all_lists_with_timings() -> None:
+    index = {
+        sections.EXPERIENCE: "Operator wajchy 2010 - 2020",
+        sections.SKILLS: "Spawanie\nSpawanie\nLutowanie",
+        sections.LANGUAGES: "Polski, angielski B2",
+        sections.CERTIFICATES: "",
+    }
+
+    lists = extract(index)
+
+    assert lists.skills == ["Spawanie", "Lutowanie"]
+    assert [(lang.language, lang.proficiency) for lang in lists.languages] == [
+        ("Polski", "conversational"),
+        ("Angielski", "unknown"),
+    ]
+    assert lists.certifications == []
+    assert lists.military_experience == []
+    assert set(lists.timings) == {"skills", "languages", "certifications"}
+
+
+def test_column_gaps_survive_whitespace_normalization() -> None:
+    parser = Parser()
+    raw = (
+        "Certyfikaty\n\n"
+        "Nagroda Darwina        Order uśmiechu     Kurs BHP\n"
+        "Kurs pierwszej pomocy  Certyfikat SEP\n"
+    )
+
+    ctx = parser._make_context(parser._clean_columns(raw), ParseTimings())
+
+    assert "\t" not in ctx.text
+    assert "Nagroda Darwina Order uśmiechu Kurs BHP" in ctx.text
+    assert [c.name for c in extract(ctx.sections).certifications] == [
+        "Nagroda Darwina",
+        "Order uśmiechu",
+        "Kurs BHP",
+        "Kurs pierwszej pomocy",
+        "Certyfikat SEP",
+    ]
@@ -0,0 +1,54 @@
+from src import sections
+from src.sections import segment_text
+
+
+def test_segment_text_in_one_pass() -> None:
+    text = "\n".join(
+        [
+            "Jan Kowalski",
+            "Umiejętności:",
+            "obsługa wajchy",
+            "parzenie kawy",
+            "Języki",
+            "angielski B2",
+            "Edukacja",
+            "Politechnika Gdańska",
+            "Certyfikaty",
+            "Certyfikat operatora wajchy",
+            "Służba wojskowa",
+            "2010 - 2012 piechota zmechanizowana",
+        ]
+    )
+
+    assert segment_text(text) == {
+        sections.SKILLS: "obsługa wajchy\nparzenie kawy",
+        sections.LANGUAGES: "angielski B2",
+        sections.EDUCATION: "Politechnika Gdańska",
+        sections.CERTIFICATES: "Certyfikat operatora wajchy",
+        sections.MILITARY: "2010 - 2012 piechota zmechanizowana",
+    }
+
+
+def test_heading_must_be_the_whole_line() -> None:
+    text = "Umiejętności pracy w zespole nabyłem w wojsku\nparzenie kawy"
+    assert segment_text(text) == {}
+
+
+def test_heading_in_the_first_column() -> None:
+    text = "EDUKACJA\tPolitechnika Gdańska 2010-2015\nmagister inżynier"
+    assert segment_text(text) == {
+        sections.EDUCATION: "Politechnika Gdańska 2010-2015\nmagister inżynier"
+    }
+
+
+def test_experience_ends_at_a_line_starting_with_a_heading() -> None:
+    text = "Doświadczenie\nOperator wajchy 2010 - 2020\nKluczowe umiejętności i cechy\nupór"
+    assert segment_text(text) == {sections.EXPERIENCE: "Operator wajchy 2010 - 2020"}
+
+
+def test_spans_are_offsets_in_the_text() -> None:
+    text = "Jan Kowalski\nDoświadczenie\nOperator wajchy\nHobby\nwędkarstwo"
+    spans = sections.segment_spans(text)
+    assert [text[start:end] for start, end in spans[sections.EXPERIENCE]] == [
+        "Operator wajchy"
+    ]
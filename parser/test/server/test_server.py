@@ -0,0 +1,144 @@
+import json
+import logging
+import socket
+import threading
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+
+from src.parser import Parser
+from src.profiling import ParseTimings
+from src.server import ParserServer
+
+
+class FakeParser(Parser):
+    """A real Parser with a stub model that records what it was given."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parsed: list[tuple[str, bytes]] = []
+
+    def load(self):
+        return SimpleNamespace(meta={"name": "fake_model"})
+
+    def parse_file(self, path: str, timings: ParseTimings):
+        with timings.stage("read"), open(path, "rb") as f:
+            self.parsed.append((path, f.read()))
+        return self.create_mock()
+
+    def parse_bytes(self, data: bytes, filetype=None, timings=None):
+        self.parsed.append((filetype, data))
+        return self.create_mock()
+
+
+@pytest.fixture
+def running_server(tmp_path):
+    parser = FakeParser()
+    server = ParserServer(parser, "127.0.0.1", 0, root=str(tmp_path))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, parser, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_health(running_server) -> None:
+    _, _, url = running_server
+    with urllib.request.urlopen(f"{url}/health") as response:
+        payload = json.loads(response.read())
+    assert payload == {"status": "ok", "model": "fake_model"}
+
+
+def test_parse_by_path(running_server, tmp_path) -> None:
+    _, parser, url = running_server
+    cv_path = tmp_path / "cv.pdf"
+    cv_path.write_bytes(b"%PDF-fake")
+
+    request = urllib.request.Request(
+        f"{url}/parse",
+        data=json.dumps({"path": str(cv_path)}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request) as response:
+        payload = json.loads(response.read())
+        server_timing = response.headers["Server-Timing"]
+        cache = response.headers["X-Cache"]
+
+    assert payload["personal_info"]["full_name"] == "UNDEFINED"
+    assert server_timing.startswith("read;dur=")
+    assert cache == "off"
+    assert parser.parsed == [(str(cv_path), b"%PDF-fake")]
+
+
+def test_parse_raw_bytes(running_server) -> None:
+    _, parser, url = running_server
+    request = urllib.request.Request(
+        f"{url}/parse?filename=upload.docx",
+        data=b"raw-docx-bytes",
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    with urllib.request.urlopen(request) as response:
+        assert response.status == 200
+
+    assert parser.parsed == [("docx", b"raw-docx-bytes")]
+
+
+def post_path(url: str, path: str) -> int:
+    request = urllib.request.Request(
+        f"{url}/parse",
+        data=json.dumps({"path": path}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return int(response.status)
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_parse_missing_path(running_server, tmp_path) -> None:
+    _, _, url = running_server
+    assert post_path(url, str(tmp_path / "does-not-exist.pdf")) == 400
+
+
+def test_parse_by_path_only_under_root(running_server, tmp_path) -> None:
+    _, parser, url = running_server
+    (tmp_path / "cv.pdf").write_bytes(b"%PDF-fake")
+
+    assert post_path(url, "cv.pdf") == 200
+    assert post_path(url, "../cv.pdf") == 403
+    assert post_path(url, "/etc/passwd") == 403
+    assert parser.parsed == [(str(tmp_path / "cv.pdf"), b"%PDF-fake")]
+
+
+def test_parse_by_path_disabled_without_root(tmp_path) -> None:
+    (tmp_path / "cv.pdf").write_bytes(b"%PDF-fake")
+    server = ParserServer(FakeParser(), "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        assert post_path(url, str(tmp_path / "cv.pdf")) == 403
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_malformed_content_length(running_server) -> None:
+    server, _, _ = running_server
+    with socket.create_connection(("127.0.0.1", server.server_port)) as conn:
+        conn.sendall(b"POST /parse HTTP/1.1\r\nHost: x\r\nContent-Length: abc\r\n\r\n")
+        status_line = conn.makefile("rb").readline()
+
+    assert status_line.split()[1] == b"400"
+
+
+def test_access_log_goes_through_logging(running_server, caplog) -> None:
+    _, _, url = running_server
+    with caplog.at_level(logging.INFO, logger="src.server"):
+        with urllib.request.urlopen(f"{url}/health"):
+            pass
+
+    assert any("GET /health" in r.getMessage() for r in caplog.records)
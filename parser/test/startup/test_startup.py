@@ -0,0 +1,70 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.parser
+from src.parser import Parser
+
+PARSER_DIR = Path(__file__).resolve().parent.parent.parent
+HEAVY_MODULES = ("spacy", "fitz")
+
+
+def imported_modules(*args: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PARSER_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize(
+    "module", ["src.parser", "src.batch", "src.server", "src.async_parser"]
+)
+def test_import_loads_no_heavy_module(module: str) -> None:
+    modules = imported_modules("-c", f"import {module}")
+
+    assert module in modules
+    assert not {m.split(".")[0] for m in modules} & set(HEAVY_MODULES)
+
+
+def test_api_mock_loads_no_heavy_module(tmp_path) -> None:
+    output = tmp_path / "mock.json"
+
+    modules = imported_modules("__main__.py", "--api-mock", "--output", str(output))
+
+    assert not {m.split(".")[0] for m in modules} & set(HEAVY_MODULES)
+    assert json.loads(output.read_text(encoding="utf-8"))["work_experience"] == []
+
+
+def test_export_schema(tmp_path) -> None:
+    output = tmp_path / "schema.json"
+
+    modules = imported_modules("__main__.py", "--export-schema", str(output))
+
+    assert not {m.split(".")[0] for m in modules} & set(HEAVY_MODULES)
+    exported = json.loads(output.read_text(encoding="utf-8"))
+    assert exported["title"] == "CVParserSchema"
+    assert "keywords" in exported["required"]
+
+
+def test_model_loads_once_on_load(monkeypatch) -> None:
+    loaded = []
+    monkeypatch.setattr(
+        src.parser, "load_nlp", lambda profile: loaded.append(profile) or profile
+    )
+
+    parser = Parser(nlp_profile="ner-sm")
+    assert loaded == []
+
+    assert parser.load() == "ner-sm"
+    assert parser.nlp == "ner-sm" and loaded == ["ner-sm"]
@@ -0,0 +1,97 @@
+import unicodedata
+from pathlib import Path
+
+import fitz
+import pytest
+
+from src.text_filters import (
+    TranslateTable,
+    remove_unwanted_chars_in_fullname,
+    remove_unwanted_unicode,
+)
+
+DATA_DIR = (Path(__file__).parent / "../../../data").resolve()
+
+
+# the per-character loops the translate tables replaced
+def reference_unicode(text: str) -> str:
+    cleaned = []
+    for ch in text:
+        if ord(ch) < 32 and ch not in ("\n", "\t"):
+            continue
+        if ord(ch) < 128:
+            cleaned.append(ch)
+            continue
+        cat = unicodedata.name(ch, "")
+        if "LATIN" in cat or "WITH" in cat:
+            cleaned.append(ch)
+            continue
+        if ch in "•–—…«»©®°":
+            cleaned.append(ch)
+    return "".join(cleaned)
+
+
+def reference_fullname(text: str) -> str:
+    cleaned = []
+    for ch in text:
+        if 65 <= ord(ch) <= 90 or 97 <= ord(ch) <= 122:
+            cleaned.append(ch)
+            continue
+        if ch == " " or ch == "-":
+            cleaned.append(ch)
+            continue
+        if ch == "\n" or ch == "\t":
+            cleaned.append(" ")
+            continue
+        cat = unicodedata.name(ch, "")
+        if "LATIN" in cat or "WITH" in cat:
+            cleaned.append(ch)
+    return "".join(cleaned).strip()
+
+
+def fixture_texts() -> list[str]:
+    texts = []
+    for path in sorted(DATA_DIR.glob("*.pdf")):
+        with fitz.open(path) as doc:
+            texts.append("\n".join(page.get_text(sort=True) for page in doc))
+    return texts
+
+
+@pytest.mark.parametrize(
+    "new, reference",
+    [
+        (remove_unwanted_unicode, reference_unicode),
+        (remove_unwanted_chars_in_fullname, reference_fullname),
+    ],
+)
+def test_same_as_reference_for_every_codepoint(new, reference) -> None:
+    for start in range(0, 0x110000, 0x1000):
+        # surrogates cannot be encoded, but can appear in str
+        chunk = "".join(chr(cp) for cp in range(start, start + 0x1000))
+        assert new(chunk) == reference(chunk), hex(start)
+
+
+def test_same_as_reference_on_fixtures() -> None:
+    texts = fixture_texts()
+    assert texts
+    for text in texts:
+        assert remove_unwanted_unicode(text) == reference_unicode(text)
+        for line in text.splitlines():
+            assert remove_unwanted_chars_in_fullname(line) == reference_fullname(line)
+
+
+def test_examples() -> None:
+    assert (
+        remove_unwanted_unicode("Zażółć\x07 gęślą 🚀 • jaźń") == "Zażółć gęślą  • jaźń"
+    )
+    assert remove_unwanted_chars_in_fullname(" Jan\tKowalski-Nowak 1 🚀") == (
+        "Jan Kowalski-Nowak"
+    )
+
+
+def test_table_decides_each_codepoint_once() -> None:
+    calls = []
+    table = TranslateTable(lambda ch: calls.append(ch) or ch.upper())
+
+    assert "abab".translate(table) == "ABAB"
+    assert calls == ["a", "b"]